@@ -0,0 +1,106 @@
+"""基准测试：读取大型 .docx 正文（python-docx Document() vs 流式 DocxReader）
+
+用法：python benchmarks/bench_docx_reader.py [--paragraphs 500000]
+测试文档直接流式写出 XML 生成（默认约 200 MB 正文）；每种读取方式在独立子进程中运行，
+以便分别统计峰值内存（RSS）。
+"""
+import os
+import sys
+import time
+import zipfile
+import argparse
+import resource
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="word/document.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+PARAGRAPH = (
+    '<w:p><w:pPr><w:pStyle w:val="Normal"/></w:pPr>'
+    '<w:r><w:rPr><w:b/></w:rPr><w:t>第{0}条</w:t></w:r>'
+    '<w:r><w:t xml:space="preserve"> 本报告由系统自动生成，数据截至本月末，如有疑问请联系数据中心。'
+    'Generated report line {0}, values are provisional.</w:t></w:r></w:p>'
+)
+
+
+def make_docx(path, paragraphs):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+        archive.writestr("_rels/.rels", PACKAGE_RELS)
+        with archive.open("word/document.xml", "w", force_zip64=True) as f:
+            f.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    b'<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>')
+            for i in range(paragraphs):
+                f.write(PARAGRAPH.format(i).encode("utf-8"))
+            f.write(b'<w:sectPr/></w:body></w:document>')
+
+
+def read_python_docx(path):
+    """原写法：Document() 载入整个 DOM 后遍历 paragraphs"""
+    from docx import Document
+    return sum(len(p.text) for p in Document(path).paragraphs)
+
+
+def read_streaming(path):
+    """新写法：DocxReader 流式读取"""
+    from pdfconverter.docxreader import DocxReader
+    with DocxReader(path) as reader:
+        return sum(len(block.text) for block in reader)
+
+
+READERS = {"python-docx": read_python_docx, "streaming": read_streaming}
+
+
+def run_one(reader, path):
+    """子进程：执行一种读法，输出 耗时 峰值RSS(MB) 字符数"""
+    start = time.perf_counter()
+    chars = READERS[reader](path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux 下单位为 KB
+    print(f"{elapsed:.2f} {peak:.1f} {chars}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=500_000)
+    parser.add_argument("--reader", choices=sorted(READERS), help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.reader:
+        run_one(args.reader, args.path)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "large.docx")
+        make_docx(path, args.paragraphs)
+        with zipfile.ZipFile(path) as archive:
+            xml_mb = archive.getinfo("word/document.xml").file_size / 1024 / 1024
+        print(f"document.xml: {xml_mb:.0f} MB, {args.paragraphs} paragraphs")
+        print(f"{'reader':>12} {'seconds':>10} {'peak RSS MB':>12} {'chars':>12}")
+        for reader in READERS:
+            output = subprocess.run([sys.executable, __file__, "--reader", reader, "--path", path],
+                                    check=True, capture_output=True, text=True).stdout
+            # 导入 fitz 时的弃用提示也会打印到 stdout，只取最后一行
+            output = output.splitlines()[-1].split()
+            print(f"{reader:>12} {output[0]:>10} {output[1]:>12} {output[2]:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
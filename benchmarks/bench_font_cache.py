@@ -0,0 +1,71 @@
+"""基准测试：Word转PDF 字体解析缓存（同一进程内连续转换大量单页文档）
+
+用法：python benchmarks/bench_font_cache.py [--docs 1000] [--font 字体文件]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from docx import Document
+
+from pdfconverter import fontcache
+from pdfconverter.batch import init_worker
+from pdfconverter.engine import ConversionJob, convert
+
+TEXT = "本合同由甲乙双方在平等自愿的基础上订立，双方应严格遵守。This agreement is made in good faith."
+
+
+def make_docs(directory, count):
+    """生成 count 个单页 .docx"""
+    paths = []
+    for i in range(count):
+        doc = Document()
+        doc.add_paragraph(f"第 {i + 1} 号文件")
+        for _ in range(5):
+            doc.add_paragraph(TEXT)
+        path = os.path.join(directory, f"doc{i:04d}.docx")
+        doc.save(path)
+        paths.append(path)
+    return paths
+
+
+def run(paths, out_dir, options):
+    start = time.perf_counter()
+    for path in paths:
+        output = os.path.join(out_dir, os.path.basename(path) + ".pdf")
+        result = convert(ConversionJob("word2pdf", path, output, dict(options)))
+        if not result.success:
+            raise SystemExit(result.message)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--font", help="字体文件（默认自动查找中文字体）")
+    args = parser.parse_args()
+    init_worker()
+    options = {"font_path": args.font} if args.font else {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_docs(tmp, args.docs)
+        fontcache.DISK_CACHE = False  # 只比较进程内缓存
+
+        fontcache.ENABLED = False
+        before = run(paths, tmp, options)
+        fontcache.ENABLED = True
+        after = run(paths, tmp, options)
+
+    print(f"{'font cache':>10} {'docs':>6} {'seconds':>9} {'ms/doc':>8}")
+    print(f"{'off':>10} {args.docs:>6} {before:>9.2f} {before / args.docs * 1000:>8.1f}")
+    print(f"{'on':>10} {args.docs:>6} {after:>9.2f} {after / args.docs * 1000:>8.1f}")
+    print(f"speedup: {before / after:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""基准测试：生成PDF时的字体子集化（输出大小与写出耗时）
+
+对一批典型短文档分别以三种方式写出PDF并比较：
+  full    嵌入完整字体（关闭 fontTools 子集化，仅作对照）
+  subset  只嵌入用到的字形，每个文档自行解析字体表
+  shared  只嵌入用到的字形，子集化所需的字体表在文档间共享（默认）
+
+用法：python benchmarks/bench_font_subset.py [--docs 50] [--font 字体文件]
+"""
+import io
+import os
+import sys
+import time
+import random
+import argparse
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fpdf.output
+
+from pdfconverter import fontcache
+from pdfconverter.batch import init_worker
+from pdfconverter.pdfdoc import PDF
+
+SENTENCES = [
+    "本合同由甲乙双方在平等自愿的基础上订立，双方应严格遵守。",
+    "会议纪要：项目进度符合预期，第三季度将完成系统上线。",
+    "请各部门于本周五前提交年度预算，逾期将影响审批流程。",
+    "The quarterly report is attached for your review.",
+    "付款方式：银行转账，账户信息见附件二。",
+    "如有疑问，请联系行政部王女士，电话 010-12345678。",
+]
+
+
+class NoSubsetter:
+    """替代 fontTools 子集化器：原样保留完整字体"""
+
+    def __init__(self, options=None):
+        pass
+
+    def populate(self, **kwargs):
+        pass
+
+    def subset(self, font):
+        pass
+
+
+@contextmanager
+def full_embedding():
+    original = fpdf.output.ftsubset.Subsetter
+    fpdf.output.ftsubset.Subsetter = NoSubsetter
+    try:
+        yield
+    finally:
+        fpdf.output.ftsubset.Subsetter = original
+
+
+def make_corpus(count, seed=0):
+    """每个文档 5~40 段，约 1~3 页"""
+    rng = random.Random(seed)
+    return [[rng.choice(SENTENCES) * rng.randint(1, 4) for _ in range(rng.randint(5, 40))]
+            for _ in range(count)]
+
+
+def write_doc(paragraphs, font_path):
+    pdf = PDF('P', 'mm', 'A4')
+    pdf.add_page()
+    pdf.use_cjk_font(font_path, size=12)
+    for text in paragraphs:
+        pdf.multi_cell(0, 10, text=text, align='L')
+        pdf.ln(5)
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    pdf.output(buffer)
+    return len(buffer.getvalue()), time.perf_counter() - start, len(pdf.fonts["simhei"].subset)
+
+
+def run(corpus, font_path):
+    sizes, write_time, glyphs = 0, 0.0, 0
+    for paragraphs in corpus:
+        size, elapsed, used = write_doc(paragraphs, font_path)
+        sizes += size
+        write_time += elapsed
+        glyphs += used
+    return sizes, write_time, glyphs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--font", help="字体文件（默认自动查找中文字体）")
+    args = parser.parse_args()
+    init_worker()
+    corpus = make_corpus(args.docs)
+    write_doc(corpus[0], args.font)  # 预热字体缓存
+
+    results = {}
+    with full_embedding():
+        results["full"] = run(corpus, args.font)
+    fontcache.SHARED_TABLES = False
+    results["subset"] = run(corpus, args.font)
+    fontcache.SHARED_TABLES = True
+    results["shared"] = run(corpus, args.font)
+
+    print(f"{'mode':>8} {'docs':>6} {'avg KB':>9} {'glyphs':>7} {'write ms/doc':>13}")
+    for mode, (sizes, write_time, glyphs) in results.items():
+        print(f"{mode:>8} {args.docs:>6} {sizes / args.docs / 1024:>9.1f} {glyphs / args.docs:>7.0f} "
+              f"{write_time / args.docs * 1000:>13.1f}")
+    full, shared = results["full"], results["shared"]
+    print(f"size: {full[0] / shared[0]:.0f}x smaller, write time: {full[1] / shared[1]:.1f}x faster than full embedding")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
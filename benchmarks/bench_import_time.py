@@ -0,0 +1,59 @@
+"""基准测试：启动导入耗时（冷启动预算检查，超出预算或启动时导入了转换库时返回非零）
+
+用法：python benchmarks/bench_import_time.py [--runs 5] [--budget-ms 400]
+用 python -X importtime 在子进程中分别导入 pdfconverter、命令行入口、GUI 启动脚本 main（工作进程会重新导入，
+应几乎不耗时）和 GUI 模块 gui（未安装 PyQt6 时跳过），
+取多次中的最短耗时与预算比较；同时检查启动时没有导入任何转换库（转换库应在首次转换时才导入）。
+"""
+import os
+import sys
+import argparse
+import subprocess
+import importlib.util
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+TARGETS = ["pdfconverter", "pdfconverter.cli", "main", "gui"]
+# 只应在首次转换时导入的库
+HEAVY_MODULES = {"fitz", "pymupdf", "pdf2docx", "pdfplumber", "openpyxl", "fpdf", "fontTools", "docx", "lxml", "PIL"}
+
+
+def import_profile(module):
+    """在子进程中导入 module，返回 (累计导入耗时 ms, 导入的顶层包名集合)"""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=SRC, env=env, capture_output=True, text=True, check=True)
+    cumulative, packages = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if total.strip().isdigit():
+            packages.add(name.strip().split(".")[0])
+            if name.strip() == module:
+                cumulative = int(total) / 1000
+    return cumulative, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=400)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':>18} {'best ms':>9} {'budget':>7}  heavy imports")
+    for module in TARGETS:
+        if module == "gui" and importlib.util.find_spec("PyQt6") is None:
+            print(f"{module:>18} {'-':>9} {'-':>7}  （未安装 PyQt6，跳过）")
+            continue
+        profiles = [import_profile(module) for _ in range(args.runs)]
+        best = min(ms for ms, _ in profiles)
+        heavy = sorted(set().union(*(packages for _, packages in profiles)) & HEAVY_MODULES)
+        failed |= best > args.budget_ms or bool(heavy)
+        print(f"{module:>18} {best:>9.1f} {args.budget_ms:>7g}  {', '.join(heavy) or '-'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""基准测试：页面缓存（在已转换过的报告末尾追加若干页后再次转换）
+
+用法：python benchmarks/bench_page_cache.py [--pages 200] [--append 10] [--types pdf2excel pdf2word]
+先转换 N 页的报告（页面缓存为空），再转换重新生成的 N+k 页新版报告（前 N 页内容相同），
+与关闭缓存时转换新版报告的耗时和输出对比。使用临时缓存目录，不影响本机已有的缓存。
+"""
+import os
+import sys
+import time
+import zipfile
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fitz  # PyMuPDF
+import openpyxl
+
+from pdfconverter.batch import init_worker
+
+EXTENSIONS = {"pdf2excel": ".xlsx", "pdf2word": ".docx"}
+
+
+def make_report(path, pages):
+    """生成每页含标题、正文和一个 4x3 表格的报告"""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Section {i + 1}", fontsize=16)
+        for j in range(20):
+            page.insert_text((50, 90 + j * 16), f"Item {i + 1}.{j} quarterly revenue and cost summary")
+        for r in range(5):
+            page.draw_line((50, 430 + r * 20), (450, 430 + r * 20))
+        for c in range(4):
+            page.draw_line((50 + c * 133.3, 430), (50 + c * 133.3, 510))
+        for r in range(4):
+            for c in range(3):
+                page.insert_text((55 + c * 133.3, 445 + r * 20), f"R{r}C{c}-{i}")
+    doc.save(path)
+    doc.close()
+
+
+def output_content(path):
+    """用于比较的输出内容：xlsx 为所有单元格值，docx 为正文 XML"""
+    if path.endswith(".xlsx"):
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        return [list(ws.iter_rows(values_only=True)) for ws in workbook.worksheets]
+    with zipfile.ZipFile(path) as archive:
+        return archive.read("word/document.xml")
+
+
+def timed(convert, job):
+    start = time.perf_counter()
+    result = convert(job)
+    if not result.success:
+        raise SystemExit(result.message)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--append", type=int, default=10)
+    parser.add_argument("--types", nargs="+", default=list(EXTENSIONS))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["PDFCONVERTER_RESULT_CACHE"] = "0"  # 只测页面缓存
+        os.environ["PDFCONVERTER_PAGE_CACHE_DIR"] = os.path.join(tmp, "pages")
+        from pdfconverter.engine import ConversionJob, convert
+
+        init_worker()
+        old, new = os.path.join(tmp, "report-v1.pdf"), os.path.join(tmp, "report-v2.pdf")
+        make_report(old, args.pages)
+        make_report(new, args.pages + args.append)
+
+        print(f"{'type':>10} {'pass':>10} {'pages':>6} {'seconds':>9} {'same':>5}")
+        for conversion_type in args.types:
+            out = os.path.join(tmp, "out" + EXTENSIONS[conversion_type])
+            options = {"mode": "tables"} if conversion_type == "pdf2excel" else {}
+            baseline = os.path.join(tmp, "baseline" + EXTENSIONS[conversion_type])
+            elapsed = timed(convert, ConversionJob(conversion_type, new, baseline, dict(options, cache=False)))
+            print(f"{conversion_type:>10} {'no cache':>10} {args.pages + args.append:>6} {elapsed:>9.2f} {'-':>5}")
+            elapsed = timed(convert, ConversionJob(conversion_type, old, out, dict(options)))
+            print(f"{conversion_type:>10} {'cold':>10} {args.pages:>6} {elapsed:>9.2f} {'-':>5}")
+            elapsed = timed(convert, ConversionJob(conversion_type, new, out, dict(options)))
+            same = output_content(out) == output_content(baseline)
+            print(f"{conversion_type:>10} {'appended':>10} {args.pages + args.append:>6} {elapsed:>9.2f} {str(same):>5}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
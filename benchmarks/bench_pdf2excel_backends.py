@@ -0,0 +1,74 @@
+"""基准测试：PDF转Excel 的文本提取后端（pdfplumber vs PyMuPDF）
+
+用法：python benchmarks/bench_pdf2excel_backends.py [--pdf 文件] [--pages 300]
+每个后端在独立子进程中运行，以便分别统计峰值内存（RSS）。
+未指定 --pdf 时自动生成一个纯文本的合成PDF。
+"""
+import os
+import sys
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC)
+
+import fitz  # PyMuPDF
+
+BACKENDS = ("pdfplumber", "fitz")
+
+
+def make_pdf(path, pages):
+    """生成每页 40 行文字的合成PDF"""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        for j in range(40):
+            page.insert_text((40, 30 + j * 19), f"{i + 1:04d}-{j:02d}  2024-01-31  Transfer  12,345.67  98,765.43")
+    doc.save(path)
+    doc.close()
+
+
+def run_one(backend, pdf):
+    """子进程：用指定后端转换一次，输出 页数 耗时 峰值RSS(MB)"""
+    from pdfconverter.engine import ConversionJob, convert
+
+    with tempfile.TemporaryDirectory() as tmp:
+        job = ConversionJob("pdf2excel", pdf, os.path.join(tmp, "out.xlsx"), {"backend": backend, "cache": False})
+        start = time.perf_counter()
+        result = convert(job)
+        elapsed = time.perf_counter() - start
+    if not result.success:
+        raise SystemExit(result.message)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux 下单位为 KB
+    print(f"{result.pages} {elapsed:.2f} {peak:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pdf")
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--backend", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.backend:
+        run_one(args.backend, args.pdf)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = args.pdf or os.path.join(tmp, "bench.pdf")
+        if not args.pdf:
+            make_pdf(pdf, args.pages)
+
+        print(f"{'backend':>10} {'pages':>6} {'seconds':>8} {'pages/s':>8} {'peak RSS MB':>12}")
+        for backend in BACKENDS:
+            output = subprocess.run([sys.executable, __file__, "--backend", backend, "--pdf", pdf],
+                                    check=True, capture_output=True, text=True).stdout.splitlines()[-1].split()
+            pages, elapsed, peak = int(output[0]), float(output[1]), output[2]
+            print(f"{backend:>10} {pages:>6} {elapsed:>8.2f} {pages / elapsed:>8.1f} {peak:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
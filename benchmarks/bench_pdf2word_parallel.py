@@ -0,0 +1,61 @@
+"""基准测试：PDF转Word 按页分片多进程的扩展性
+
+用法：python benchmarks/bench_pdf2word_parallel.py [--pdf 文件] [--pages 600] [--workers 1 2 4 8 16]
+未指定 --pdf 时自动生成一个纯文本的合成PDF。
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fitz  # PyMuPDF
+
+from pdfconverter.batch import init_worker
+from pdfconverter.engine import ConversionJob, convert
+
+
+def make_pdf(path, pages):
+    """生成每页 30 行文字的合成PDF"""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        for j in range(30):
+            page.insert_text((50, 40 + j * 24), f"Page {i + 1} line {j} lorem ipsum dolor sit amet")
+    doc.save(path)
+    doc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pdf")
+    parser.add_argument("--pages", type=int, default=600)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+    init_worker()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = args.pdf or os.path.join(tmp, "bench.pdf")
+        if not args.pdf:
+            make_pdf(pdf, args.pages)
+
+        print(f"{'workers':>8} {'seconds':>10} {'pages/s':>10} {'speedup':>8}")
+        baseline = None
+        for workers in args.workers:
+            job = ConversionJob("pdf2word", pdf, os.path.join(tmp, f"out-{workers}.docx"),
+                                {"page_workers": workers, "cache": False})
+            start = time.perf_counter()
+            result = convert(job)
+            elapsed = time.perf_counter() - start
+            if not result.success:
+                print(result.message)
+                return 1
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>10.2f} {result.pages / elapsed:>10.1f} {baseline / elapsed:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""基准测试：转换结果缓存（首次转换 vs 重复提交命中缓存）
+
+用法：python benchmarks/bench_result_cache.py [--files 20] [--paragraphs 300]
+使用临时缓存目录，不影响本机已有的缓存。
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from docx import Document
+
+from pdfconverter.batch import init_worker
+
+TEXT = "本合同由甲乙双方在平等自愿的基础上订立，双方应严格遵守。"
+
+
+def make_docs(directory, count, paragraphs):
+    paths = []
+    for i in range(count):
+        doc = Document()
+        for j in range(paragraphs):
+            doc.add_paragraph(f"{i}-{j} " + TEXT * 3)
+        paths.append(os.path.join(directory, f"doc{i:03d}.docx"))
+        doc.save(paths[-1])
+    return paths
+
+
+def run(convert, ConversionJob, paths, out_dir):
+    start = time.perf_counter()
+    hits = 0
+    for path in paths:
+        output = os.path.join(out_dir, os.path.basename(path) + ".pdf")
+        result = convert(ConversionJob("word2pdf", path, output))
+        if not result.success:
+            raise SystemExit(result.message)
+        hits += result.cached
+    return time.perf_counter() - start, hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--paragraphs", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["PDFCONVERTER_RESULT_CACHE_DIR"] = os.path.join(tmp, "cache")
+        from pdfconverter.engine import ConversionJob, convert
+
+        init_worker()
+        paths = make_docs(tmp, args.files, args.paragraphs)
+        print(f"{'pass':>8} {'files':>6} {'hits':>5} {'seconds':>9} {'ms/file':>9}")
+        for name in ("first", "repeat"):
+            elapsed, hits = run(convert, ConversionJob, paths, tmp)
+            print(f"{name:>8} {args.files:>6} {hits:>5} {elapsed:>9.2f} {elapsed / args.files * 1000:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
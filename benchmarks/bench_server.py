@@ -0,0 +1,111 @@
+"""基准测试：HTTP 转换服务的并发提交（上传延迟、排队与转换耗时、队列深度）
+
+用法：python benchmarks/bench_server.py [--files 100] [--clients 32] [--workers 4] [--paragraphs 50]
+在本进程内启动服务（随机端口），多个客户端线程同时上传 Word 文档转 PDF，全部完成后逐个下载校验。
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import statistics
+from urllib.request import Request, urlopen
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from docx import Document
+
+from pdfconverter.batch import init_worker
+from pdfconverter.server import ConversionServer
+
+TEXT = "本合同由甲乙双方在平等自愿的基础上订立，双方应严格遵守。"
+
+
+def make_doc(path, paragraphs):
+    doc = Document()
+    for j in range(paragraphs):
+        doc.add_paragraph(f"{j} " + TEXT * 3)
+    doc.save(path)
+
+
+def call(base, method, path, data=None):
+    with urlopen(Request(base + path, data=data, method=method)) as response:
+        body = response.read()
+    return json.loads(body) if response.headers.get_content_type() == "application/json" else body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--paragraphs", type=int, default=50)
+    args = parser.parse_args()
+    init_worker()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["PDFCONVERTER_RESULT_CACHE"] = "0"  # 每个文件都真正转换
+        docx = os.path.join(tmp, "合同.docx")
+        make_doc(docx, args.paragraphs)
+        with open(docx, "rb") as f:
+            data = f.read()
+
+        start = time.perf_counter()
+        server = ConversionServer(port=0, max_workers=args.workers)
+        print(f"启动服务（预加载字体、启动 {args.workers} 个工作进程）：{time.perf_counter() - start:.2f}s")
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = "http://127.0.0.1:%d" % server.server_address[1]
+
+        peak_depth = 0
+        submitted = threading.Event()
+
+        def watch_depth():
+            nonlocal peak_depth
+            while not submitted.is_set():
+                peak_depth = max(peak_depth, call(base, "GET", "/status")["queue_depth"])
+                time.sleep(0.05)
+
+        def submit(i):
+            t = time.perf_counter()
+            job = call(base, "POST", f"/jobs?type=word2pdf&filename={quote(f'合同{i}.docx')}", data)
+            return job["id"], time.perf_counter() - t
+
+        depth_thread = threading.Thread(target=watch_depth)
+        depth_thread.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.clients) as clients:
+            submissions = list(clients.map(submit, range(args.files)))
+        submit_elapsed = time.perf_counter() - start
+        submitted.set()
+        depth_thread.join()
+
+        while True:
+            counts = call(base, "GET", "/status")["jobs"]
+            if counts["done"] + counts["failed"] >= args.files:
+                break
+            time.sleep(0.1)
+        elapsed = time.perf_counter() - start
+        jobs = [call(base, "GET", f"/jobs/{job_id}") for job_id, _ in submissions]
+        failed = [job for job in jobs if job["status"] != "done"]
+        pdf = call(base, "GET", f"/jobs/{submissions[0][0]}/result")
+        server.shutdown()
+        server.server_close()
+
+    latencies = sorted(latency for _, latency in submissions)
+    print(f"{args.files} 个文件，{args.clients} 个客户端并发提交：提交耗时 {submit_elapsed:.2f}s，"
+          f"单次提交 p50 {latencies[len(latencies) // 2] * 1000:.1f}ms / "
+          f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f}ms")
+    print(f"全部完成 {elapsed:.2f}s（{args.files / elapsed * 3600:.0f} 文件/小时），失败 {len(failed)}，"
+          f"最大队列深度 {peak_depth}，结果示例 {len(pdf)} 字节（{pdf[:5]!r}）")
+    for name in ("upload", "queued", "convert", "total"):
+        values = [job["timings"][name] for job in jobs]
+        print(f"  {name:>8}: 平均 {statistics.mean(values):.3f}s  最大 {max(values):.3f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""基准测试：Word转PDF 中文断行（multi_cell 与 layout 模块对比）
+
+用法：python benchmarks/bench_word2pdf_layout.py [--pages 1000] [--font 字体文件]
+"""
+import os
+import sys
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from docx import Document
+
+from pdfconverter import word2pdf
+from pdfconverter.batch import init_worker
+from pdfconverter.engine import ConversionJob, convert
+
+SENTENCES = [
+    "本合同由甲乙双方在平等自愿的基础上订立，双方应严格遵守。",
+    "根据《中华人民共和国民法典》及相关法律法规的规定，经友好协商，达成如下协议：",
+    "乙方应于每月五日前（含当日）支付上月费用，逾期按日加收万分之五的违约金。",
+    "“服务期限”指自本合同生效之日起至双方权利义务履行完毕之日止。",
+    "The parties agree to resolve disputes through friendly negotiation first.",
+]
+PARAGRAPHS_PER_PAGE = 6  # 按默认排版每页约容纳的段落数
+
+
+def make_doc(path, pages, seed=0):
+    rng = random.Random(seed)
+    doc = Document()
+    for _ in range(pages * PARAGRAPHS_PER_PAGE):
+        doc.add_paragraph("".join(rng.choice(SENTENCES) for _ in range(rng.randint(2, 6))))
+    doc.save(path)
+
+
+def multi_cell_paragraph(pdf, text, line_height):
+    """原实现：multi_cell 逐字符测量断行"""
+    pdf.multi_cell(0, line_height, text=text, align='L')
+
+
+def run(path, output, options):
+    result = convert(ConversionJob("word2pdf", path, output, dict(options, cache=False)))
+    if not result.success:
+        raise SystemExit(result.message)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--font", help="字体文件（默认自动查找中文字体）")
+    args = parser.parse_args()
+    init_worker()
+    options = {"font_path": args.font} if args.font else {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "long.docx")
+        make_doc(source, args.pages)
+        output = os.path.join(tmp, "long.pdf")
+
+        results = {}
+        layout_paragraph = word2pdf.write_paragraph
+        word2pdf.write_paragraph = multi_cell_paragraph
+        results["multi_cell"] = run(source, output, options)
+        word2pdf.write_paragraph = layout_paragraph
+        results["layout"] = run(source, output, options)
+
+    print(f"{'mode':>10} {'pages':>6} {'seconds':>9} {'pages/s':>8}")
+    for mode, result in results.items():
+        print(f"{mode:>10} {result.pages:>6} {result.elapsed:>9.2f} {result.pages / result.elapsed:>8.1f}")
+    print(f"speedup: {results['multi_cell'].elapsed / results['layout'].elapsed:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""基准测试：Word转PDF 按分页符/分节符分片多进程渲染的扩展性
+
+用法：python benchmarks/bench_word2pdf_parallel.py [--docx 文件] [--pages 2000] [--workers 1 2 4 8 16]
+未指定 --docx 时自动生成一个合成文档（每约 20 页一个分节符，模拟合同的章节）。
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from docx import Document
+from docx.enum.section import WD_SECTION
+
+from pdfconverter.batch import init_worker
+from pdfconverter.engine import ConversionJob, convert
+
+CLAUSE = "本合同由甲乙双方在平等自愿的基础上订立，双方应严格遵守，任何一方不得擅自变更或解除。"
+PARAGRAPHS_PER_PAGE = 7  # 按默认排版每页约容纳的段落数
+PAGES_PER_SECTION = 20
+
+
+def make_docx(path, pages):
+    doc = Document()
+    for section in range(max(1, pages // PAGES_PER_SECTION)):
+        if section:
+            doc.add_section(WD_SECTION.NEW_PAGE)
+        doc.add_paragraph(f"第 {section + 1} 章")
+        for i in range(PAGES_PER_SECTION * PARAGRAPHS_PER_PAGE):
+            doc.add_paragraph(f"{section + 1}.{i + 1} " + CLAUSE * 3)
+    doc.save(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docx")
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+    init_worker()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docx = args.docx or os.path.join(tmp, "bench.docx")
+        if not args.docx:
+            make_docx(docx, args.pages)
+
+        print(f"{'workers':>8} {'pages':>6} {'seconds':>10} {'pages/s':>10} {'speedup':>8}")
+        baseline = None
+        for workers in args.workers:
+            job = ConversionJob("word2pdf", docx, os.path.join(tmp, f"out-{workers}.pdf"),
+                                {"page_workers": workers, "cache": False})
+            start = time.perf_counter()
+            result = convert(job)
+            elapsed = time.perf_counter() - start
+            if not result.success:
+                print(result.message)
+                return 1
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {result.pages:>6} {elapsed:>10.2f} {result.pages / elapsed:>10.1f} "
+                  f"{baseline / elapsed:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
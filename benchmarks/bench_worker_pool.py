@@ -0,0 +1,107 @@
+"""基准测试：预加载转换库和字体的工作进程池与冷启动工作进程的小文件延迟对比
+
+用法：python benchmarks/bench_worker_pool.py [--files 8] [--workers 2] [--types word2pdf pdf2excel pdf2word]
+每种转换类型、每种方式在单独的子进程中测试（forkserver 每个进程只启动一次）：
+  batch：run_batch 转换 N 个小文件的总耗时（含进程池启动，对应命令行批量转换）
+  first：进程池启动完成后（对应 GUI 打开窗口时后台启动）提交一个小文件到取得结果的延迟
+冷启动即 PDFCONVERTER_PRELOAD=0：工作进程在首个任务中才导入转换库、加载字体。
+"""
+import os
+import sys
+import time
+import json
+import argparse
+import tempfile
+import subprocess
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC)
+
+INPUTS = {"word2pdf": "small.docx", "excel2pdf": "small.xlsx", "pdf2excel": "small.pdf", "pdf2word": "small.pdf"}
+
+
+def make_inputs(tmp):
+    """生成各转换类型的小输入文件（两页左右）"""
+    from docx import Document
+    import openpyxl
+    import fitz  # PyMuPDF
+
+    doc = Document()
+    for j in range(30):
+        doc.add_paragraph(f"{j} 本合同由甲乙双方在平等自愿的基础上订立，双方应严格遵守。" * 2)
+    doc.save(os.path.join(tmp, "small.docx"))
+    workbook = openpyxl.Workbook()
+    for r in range(60):
+        workbook.active.append([f"项目{r}", r, r * 1.5, "备注"])
+    workbook.save(os.path.join(tmp, "small.xlsx"))
+    pdf = fitz.open()
+    for i in range(2):
+        page = pdf.new_page()
+        for j in range(30):
+            page.insert_text((50, 60 + j * 20), f"Item {i}.{j} quarterly revenue and cost summary")
+    pdf.save(os.path.join(tmp, "small.pdf"))
+
+
+def run_scenario(scenario, conversion_type, tmp, files, workers):
+    """子进程：执行一个测试场景，返回耗时（秒）"""
+    from pdfconverter.batch import BatchRunner, init_worker, run_batch
+    from pdfconverter.engine import OUTPUT_EXTENSIONS, ConversionJob
+
+    init_worker()
+    source = os.path.join(tmp, INPUTS[conversion_type])
+    ext = OUTPUT_EXTENSIONS[conversion_type]
+    jobs = [ConversionJob(conversion_type, source, os.path.join(tmp, f"{scenario}{i}-{conversion_type}{ext}"),
+                          {"cache": False}) for i in range(files)]
+    if scenario == "batch":
+        start = time.perf_counter()
+        results = run_batch(jobs, workers)
+        elapsed = time.perf_counter() - start
+    else:
+        runner = BatchRunner(workers, conversion_types=[conversion_type])
+        runner.start_workers()
+        start = time.perf_counter()
+        runner.submit(jobs[0])
+        results = []
+        while not results:
+            results = runner.poll()[1]
+            time.sleep(0.002)
+        elapsed = time.perf_counter() - start
+        runner.shutdown(wait=True)
+    if not all(r.success for r in results):
+        raise SystemExit(results[0].message)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--types", nargs="+", default=["word2pdf", "pdf2excel", "pdf2word"])
+    parser.add_argument("--child", nargs=3, metavar=("SCENARIO", "TYPE", "TMP"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        scenario, conversion_type, tmp = args.child
+        print(json.dumps(run_scenario(scenario, conversion_type, tmp, args.files, args.workers)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        make_inputs(tmp)
+        print(f"{'type':>10} {'scenario':>9} {'cold s':>8} {'preload s':>10} {'speedup':>8}")
+        for conversion_type in args.types:
+            for scenario in ("batch", "first"):
+                timings = []
+                for preload in ("0", "1"):
+                    env = dict(os.environ, PDFCONVERTER_PRELOAD=preload, PDFCONVERTER_RESULT_CACHE="0",
+                               PDFCONVERTER_PAGE_CACHE="0")
+                    out = subprocess.run([sys.executable, __file__, "--files", str(args.files),
+                                          "--workers", str(args.workers), "--child", scenario, conversion_type, tmp],
+                                         env=env, capture_output=True, text=True, check=True).stdout
+                    timings.append(json.loads(out.strip().splitlines()[-1]))
+                cold, warm = timings
+                print(f"{conversion_type:>10} {scenario:>9} {cold:>8.2f} {warm:>10.2f} {cold / warm:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
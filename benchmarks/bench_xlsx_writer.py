@@ -0,0 +1,69 @@
+"""基准测试：PDF转Excel 的 xlsx 写入方式（逐单元格 vs 只写模式流式追加）
+
+用法：python benchmarks/bench_xlsx_writer.py [--rows 1000000]
+每种写入方式在独立子进程中运行，以便分别统计峰值内存（RSS）。
+"""
+import os
+import sys
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+import openpyxl
+
+LINE = "2024-01-31  转账收入  账户 6222 **** 1234  金额 12,345.67  余额 98,765.43"
+
+
+def write_cells(path, rows):
+    """原写法：完整 Workbook + worksheet.cell() 逐格写入"""
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.title = "PDF内容"
+    for row in range(1, rows + 1):
+        worksheet.cell(row=row, column=1, value=LINE)
+    workbook.save(path)
+
+
+def write_streaming(path, rows):
+    """新写法：write_only 工作簿 + append() 整行追加"""
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet("PDF内容")
+    for _ in range(rows):
+        worksheet.append([LINE])
+    workbook.save(path)
+
+
+WRITERS = {"cells": write_cells, "streaming": write_streaming}
+
+
+def run_one(writer, rows):
+    """子进程：执行一种写法，输出 耗时 峰值RSS(MB)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        WRITERS[writer](os.path.join(tmp, "out.xlsx"), rows)
+        elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux 下单位为 KB
+    print(f"{elapsed:.2f} {peak:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--writer", choices=sorted(WRITERS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.writer:
+        run_one(args.writer, args.rows)
+        return 0
+
+    print(f"{'writer':>10} {'rows':>10} {'seconds':>10} {'peak RSS MB':>12}")
+    for writer in WRITERS:
+        output = subprocess.run([sys.executable, __file__, "--writer", writer, "--rows", str(args.rows)],
+                                check=True, capture_output=True, text=True).stdout.split()
+        print(f"{writer:>10} {args.rows:>10} {output[0]:>10} {output[1]:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
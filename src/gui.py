@@ -0,0 +1,680 @@
+import sys
+import os
+import threading
+
+from PyQt6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QFrame, QLabel, QPushButton, QProgressBar,
+    QVBoxLayout, QHBoxLayout, QGridLayout, QFileDialog, QMessageBox, QListWidget,
+    QListWidgetItem
+)
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QPixmap, QDragEnterEvent, QDropEvent
+
+from pdfconverter.engine import (
+    ConversionJob, converter_available, default_output_path, install_hint
+)
+from pdfconverter.batch import BatchRunner
+from pdfconverter.journal import open_journal
+
+
+class ConversionQueue(QObject):
+    """转换任务队列：多个文件在工作进程中并发转换，定时轮询结果，避免UI卡顿"""
+    job_progress = pyqtSignal(str, int)  # job_id, 进度
+    job_finished = pyqtSignal(object)  # ConversionResult
+    all_finished = pyqtSignal()
+
+    def __init__(self, conversion_type=None, max_workers=None, parent=None):
+        super().__init__(parent)
+        self.max_workers = max_workers
+        self.conversion_types = [conversion_type] if conversion_type else None
+        # 窗口打开时即在后台启动工作进程并预加载该转换的库和字体，首个文件不必等待
+        self.runner = BatchRunner(max_workers, conversion_types=self.conversion_types)
+        threading.Thread(target=self.start_workers, args=(self.runner,), daemon=True).start()
+        self.journal = open_journal()  # 批次日志，程序意外退出后可用命令行 resume 继续；打开失败时为 None
+        self.timer = QTimer(self)
+        self.timer.setInterval(100)
+        self.timer.timeout.connect(self.poll)
+
+    @staticmethod
+    def start_workers(runner):
+        """后台线程：启动全部工作进程；启动完成前窗口已关闭（进程池已关闭）时直接返回"""
+        try:
+            runner.start_workers()
+        except Exception:
+            pass
+
+    def is_running(self):
+        """是否有任务在排队或转换中"""
+        return self.runner is not None and self.runner.busy
+
+    def submit(self, jobs):
+        """提交一批任务，立即返回"""
+        if self.runner is None:
+            self.runner = BatchRunner(self.max_workers, conversion_types=self.conversion_types)
+        if self.journal:
+            self.journal.create_batch(jobs, "gui")
+        for job in jobs:
+            self.runner.submit(job)
+        self.timer.start()
+
+    def poll(self):
+        """在GUI线程中取回进度和结果，并以信号转发"""
+        progress, results = self.runner.poll()
+        for job_id, value in progress:
+            self.job_progress.emit(job_id, value)
+        for result in results:
+            if self.journal:
+                self.journal.record(result)
+            self.job_finished.emit(result)
+        if not self.runner.busy:
+            self.timer.stop()
+            if self.journal:
+                self.journal.flush()
+            self.all_finished.emit()
+
+    def shutdown(self):
+        """取消未开始的任务并关闭进程池"""
+        self.timer.stop()
+        if self.runner is not None:
+            self.runner.shutdown()
+            self.runner = None
+        if self.journal:
+            self.journal.close()
+            self.journal = None
+
+
+class PDFConverterGUI(QMainWindow):
+
+    def __init__(self):
+        super().__init__()
+        self.init_ui()
+
+    def init_ui(self):
+        # 主窗口设置
+        self.setWindowTitle("PDF转换器 - 多功能格式转换工具")
+        self.setGeometry(100, 100, 1080, 720)
+        self.setMinimumSize(720, 480)
+
+        # 中心窗口
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+
+        # 主布局
+        main_layout = QGridLayout(central_widget)
+        main_layout.setSpacing(10)
+        main_layout.setContentsMargins(10, 10, 10, 10)
+
+        # 配置网格权重
+        main_layout.setColumnStretch(0, 1)
+        main_layout.setColumnStretch(1, 14)
+        main_layout.setRowStretch(0, 1)
+        main_layout.setRowStretch(1, 9)
+
+        # 创建组件
+        self.create_top_frame(main_layout)
+        self.create_left_frame(main_layout)
+        self.create_middle_frame(main_layout)
+
+    def create_top_frame(self, parent_layout):
+        """顶部标题栏"""
+        top_frame = QFrame()
+        top_frame.setStyleSheet("background-color: #3c3f41")
+        parent_layout.addWidget(top_frame, 0, 0, 1, 2)
+        top_layout = QVBoxLayout(top_frame)
+        img_text_layout = QHBoxLayout()
+
+        # 加载图片（若不存在则仅显示文字）
+        img_label = QLabel(top_frame)
+        img_label.setFixedSize(50, 50)
+        try:
+            img = QPixmap("PDFconverter.ico")
+            img = img.scaled(50, 50, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            img_label.setPixmap(img)
+        except:
+            pass  # 图片不存在时不显示
+        img_label.setStyleSheet("border:0.5px solid #ffffff")
+
+        # 顶部文字
+        title_label = QLabel("PDF转换器")
+        title_font = QFont("微软雅黑", 14, QFont.Weight.Bold)
+        title_label.setFont(title_font)
+
+        img_text_layout.addWidget(img_label)
+        img_text_layout.addWidget(title_label)
+
+        v_layout = QVBoxLayout()
+        v_layout.addSpacing(5)
+        h_layout = QHBoxLayout()
+        h_layout.addLayout(img_text_layout)
+        v_layout.addLayout(h_layout)
+        v_layout.addStretch(1)
+
+        top_layout.addLayout(v_layout)
+
+    def create_left_frame(self, parent_layout):
+        """左侧功能栏"""
+        left_frame = QFrame()
+        left_frame.setStyleSheet("background-color: #3c3f41")
+        parent_layout.addWidget(left_frame, 1, 0)
+
+        left_layout = QVBoxLayout(left_frame)
+        left_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        left_layout.setContentsMargins(10, 20, 10, 10)
+        left_layout.setSpacing(10)
+
+        # 功能标题
+        func_label = QLabel("功能选择")
+        func_font = QFont("微软雅黑", 14, QFont.Weight.Bold)
+        func_label.setFont(func_font)
+        func_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        left_layout.addWidget(func_label)
+        left_layout.addSpacing(10)
+
+        # 按钮样式
+        btn_style = """
+            QPushButton {
+                font-family: 微软雅黑;
+                font-size: 12px;
+                padding: 8px;
+                border-radius: 4px;
+            }
+            QPushButton:hover {
+                background-color: #e0e0e0;
+                color: #000;
+            }
+            QPushButton:pressed {
+                background-color: #d0d0d0;
+            }
+            QPushButton:disabled {
+                background-color: #cccccc;
+                color: #666666;
+            }
+        """
+
+        # 功能按钮（依赖缺失时禁用）
+        self.pdf2word_btn = QPushButton("PDF转Word")
+        self.pdf2word_btn.setStyleSheet(btn_style)
+        self.pdf2word_btn.clicked.connect(lambda: self.switch_to_select_func("pdf2word"))
+        self.enable_converter_button(self.pdf2word_btn, "pdf2word")
+        left_layout.addWidget(self.pdf2word_btn)
+
+        self.pdf2excel_btn = QPushButton("PDF转Excel")
+        self.pdf2excel_btn.setStyleSheet(btn_style)
+        self.pdf2excel_btn.clicked.connect(lambda: self.switch_to_select_func("pdf2excel"))
+        self.enable_converter_button(self.pdf2excel_btn, "pdf2excel")
+        left_layout.addWidget(self.pdf2excel_btn)
+
+        self.word2pdf_btn = QPushButton("Word转PDF")
+        self.word2pdf_btn.setStyleSheet(btn_style)
+        self.word2pdf_btn.clicked.connect(lambda: self.switch_to_select_func("word2pdf"))
+        self.enable_converter_button(self.word2pdf_btn, "word2pdf")
+        left_layout.addWidget(self.word2pdf_btn)
+
+        self.excel2pdf_btn = QPushButton("Excel转PDF")
+        self.excel2pdf_btn.setStyleSheet(btn_style)
+        self.excel2pdf_btn.clicked.connect(lambda: self.switch_to_select_func("excel2pdf"))
+        self.enable_converter_button(self.excel2pdf_btn, "excel2pdf")
+        left_layout.addWidget(self.excel2pdf_btn)
+
+        left_layout.addStretch()
+
+    def enable_converter_button(self, button, conversion_type):
+        """按转换类型的依赖库是否齐全启用按钮（只检查是否已安装，转换库在首次转换时才导入）"""
+        available = converter_available(conversion_type)
+        button.setEnabled(available)
+        if not available:
+            button.setToolTip(install_hint(conversion_type))
+
+    def create_middle_frame(self, parent_layout):
+        """中间主界面"""
+        middle_frame = QFrame()
+        middle_frame.setStyleSheet("background-color: #2b2d30")
+        parent_layout.addWidget(middle_frame, 1, 1)
+
+        middle_layout = QVBoxLayout(middle_frame)
+        middle_layout.setContentsMargins(20, 20, 20, 20)
+        middle_layout.setSpacing(20)
+
+        # 最近文档标题
+        recent_label = QLabel("最近文档")
+        recent_font = QFont("微软雅黑", 14, QFont.Weight.Bold)
+        recent_label.setFont(recent_font)
+        recent_label.setStyleSheet("background-color: #2b2d30; color: white;")
+        middle_layout.addWidget(recent_label)
+
+        # 空状态提示
+        empty_label = QLabel("请从左侧选择转换功能开始使用")
+        empty_label.setStyleSheet("color: #aaa; font-size: 16px;")
+        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        middle_layout.addStretch()
+        middle_layout.addWidget(empty_label)
+        middle_layout.addStretch()
+
+    def switch_to_select_func(self, conversion_type):
+        """跳转到转换功能窗口"""
+        if hasattr(self, 'selectfunc') and self.selectfunc.isVisible():
+            self.selectfunc.activateWindow()
+            self.selectfunc.raise_()
+        else:
+            self.selectfunc = SelectFunc(conversion_type, self)
+            self.selectfunc.show()
+
+
+class SelectFunc(QMainWindow):
+    """转换功能窗口"""
+
+    def __init__(self, conversion_type, main_windows):
+        super().__init__()
+        self.conversion_type = conversion_type
+        self.main_window = main_windows
+        self.file_paths = []  # 存储多选文件路径
+        self.file_items = {}  # 文件路径 -> 列表项
+        self.jobs = {}  # job_id -> [任务, 进度]
+        self.failed_files = []  # 本批转换失败的文件
+        self.drag_pos = None  # 窗口拖动位置
+        self.init_ui()
+        self.move_to_main_window_center()
+
+        # 初始化转换队列
+        self.conversion_queue = ConversionQueue(conversion_type, parent=self)
+        self.conversion_queue.job_progress.connect(self.update_progress)
+        self.conversion_queue.job_finished.connect(self.conversion_finished)
+        self.conversion_queue.all_finished.connect(self.batch_finished)
+        if not converter_available(conversion_type):
+            QMessageBox.warning(self, "功能受限", install_hint(conversion_type) +
+                                "\n\n下载缓慢时可加参数：-i https://pypi.tuna.tsinghua.edu.cn/simple")
+
+    def move_to_main_window_center(self):
+        """将窗口移动到主窗口中心"""
+        main_geo = self.main_window.geometry()
+        self_geo = self.geometry()
+        center_x = main_geo.x() + (main_geo.width() - self_geo.width()) // 2
+        center_y = main_geo.y() + (main_geo.height() - self_geo.height()) // 2
+        self.move(center_x, center_y)
+
+    def init_ui(self):
+        """初始化UI"""
+        self.setWindowTitle(self.get_conversion_title())
+        self.setGeometry(0, 0, 800, 600)
+
+        # 中心部件
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+
+        # 子网格布局
+        second_layout = QGridLayout()
+        second_layout.setSpacing(10)
+        second_layout.setContentsMargins(10, 10, 10, 10)
+        second_layout.setRowStretch(0, 1)
+        second_layout.setRowStretch(1, 9)
+        second_layout.setRowStretch(2, 3)
+        layout.addLayout(second_layout)
+
+        self.create_top_frame(second_layout)
+        self.create_middle_frame(second_layout)
+        self.create_bottom_frame(second_layout)
+
+    def create_top_frame(self, parent_layout):
+        """顶部标题框架"""
+        top_frame = QFrame()
+        top_frame.setStyleSheet("background-color: #3c3f41")
+        parent_layout.addWidget(top_frame, 0, 0, 1, 2)
+        top_layout = QVBoxLayout(top_frame)
+
+        title_text = f"✨ {self.get_conversion_title()}"
+        title = QLabel(title_text)
+        title.setStyleSheet("font-size: 20px; color: #2E86AB;")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        top_layout.addWidget(title)
+
+    def create_middle_frame(self, parent_layout):
+        """中间文件列表框架"""
+        middle_frame = QFrame()
+        middle_frame.setStyleSheet("background-color: #3c3f41")
+        parent_layout.addWidget(middle_frame, 1, 0, 1, 2)
+
+        middle_layout = QVBoxLayout(middle_frame)
+        middle_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        middle_layout.setContentsMargins(10, 20, 10, 10)
+        middle_layout.setSpacing(10)
+
+        # 顶部工具条
+        top_tool_layout = QHBoxLayout()
+        list_tip_label = QLabel("已选择的文件：")
+        list_tip_label.setStyleSheet("font-size: 14px; color: #2E86AB; font-weight: bold;")
+        top_tool_layout.addWidget(list_tip_label)
+        top_tool_layout.addStretch()
+
+        # 删除按钮
+        delete_btn = QPushButton("删除选中文件")
+        delete_btn.clicked.connect(self.delete_selected_file)
+        delete_btn.setStyleSheet("""
+            QPushButton {
+                padding: 8px 16px;
+                font-size: 14px;
+                background-color: #f44336;
+                color: white;
+                border: none;
+                border-radius: 6px;
+            }
+            QPushButton:hover {
+                background-color: #d32f2f;
+            }
+        """)
+        top_tool_layout.addWidget(delete_btn)
+        middle_layout.addLayout(top_tool_layout)
+
+        # 文件列表
+        self.file_list_widget = QListWidget()
+        self.file_list_widget.setMinimumHeight(200)
+        self.file_list_widget.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
+
+        # 开启拖放接受功能
+        self.file_list_widget.setAcceptDrops(True)
+        # 隐藏默认拖放指示器（如需自定义样式）
+        self.file_list_widget.setDropIndicatorShown(True)
+
+        # 补充QListWidget样式，与深色主题统一
+        self.file_list_widget.setStyleSheet("""
+                   QListWidget {
+                       background-color: #2b2b2b;
+                       color: #ffffff;
+                       font-size: 13px;
+                       border: none;
+                       border-radius: 6px;
+                       padding: 5px;
+                   }
+                   QListWidget::item:selected {
+                       background-color: #2E86AB;
+                       color: white;
+                   }
+                   QListWidget::item:hover {
+                       background-color: #4a4d4f;
+                   }
+               """)
+        middle_layout.addWidget(self.file_list_widget)
+
+        # 进度条
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setStyleSheet("""
+            QProgressBar {
+                border: 2px solid grey;
+                border-radius: 5px;
+                text-align: center;
+                height: 20px;
+            }
+            QProgressBar::chunk {
+                background-color: #4CAF50;
+                width: 10px;
+            }
+        """)
+        self.progress_bar.setValue(0)
+        middle_layout.addWidget(self.progress_bar)
+
+        # 判断拖入数据是否合法
+
+    def dragEnterEvent(self, event: QDragEnterEvent):
+        # 判断是否为文件路径数据
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()  # 允许拖放
+        else:
+            event.ignore()  # 忽略无效拖放
+
+        # 支持拖放过程中移动
+
+    def dragMoveEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+        # 处理拖放落地逻辑，添加文件到列表
+
+    def dropEvent(self, event: QDropEvent):
+        # 获取拖入的所有数据（URL格式）
+        mime_data = event.mimeData()
+        if not mime_data.hasUrls():
+            event.ignore()
+            return
+
+        # 遍历所有URL，转换为本地文件路径
+        for url in mime_data.urls():
+            # 关键：将QUrl转换为本地文件路径（解决中文路径乱码问题）
+            file_path = url.toLocalFile()
+            # 过滤：只添加实际存在的文件（排除文件夹）
+            if os.path.isfile(file_path):
+                self.add_file(file_path)
+
+        event.acceptProposedAction()
+
+    def create_bottom_frame(self, parent_layout):
+        """底部按钮框架"""
+        bottom_frame = QFrame()
+        bottom_frame.setStyleSheet("background-color: #3c3f41")
+        parent_layout.addWidget(bottom_frame, 2, 0, 1, 2)
+        bottom_layout = QHBoxLayout(bottom_frame)
+        bottom_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        bottom_layout.setContentsMargins(50, 20, 50, 10)
+        bottom_layout.setSpacing(30)
+
+        # 选择文件按钮
+        select_btn = QPushButton("选择文件")
+        select_btn.setStyleSheet("""
+            QPushButton {
+                padding: 10px 20px;
+                font-size: 16px;
+                background-color: #4CAF50;
+                color: white;
+                border: none;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+        """)
+        select_btn.clicked.connect(lambda: self.select_file(self.conversion_type))
+
+        # 转换按钮
+        converter_btn = QPushButton("开始转换")
+        converter_btn.setStyleSheet("""
+            QPushButton {
+                padding: 10px 20px;
+                font-size: 16px;
+                background-color: #4CAF50;
+                color: white;
+                border: none;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+        """)
+        converter_btn.clicked.connect(lambda: self.converter_func(self.conversion_type))
+
+        # 返回按钮
+        back_btn = QPushButton("返回主窗口")
+        back_btn.setStyleSheet("""
+            QPushButton {
+                padding: 10px 20px;
+                font-size: 16px;
+                background-color: #2196F3;
+                color: white;
+                border: none;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #0b7dda;
+            }
+        """)
+        back_btn.clicked.connect(self.back_to_main)
+
+        bottom_layout.addWidget(select_btn)
+        bottom_layout.addWidget(converter_btn)
+        bottom_layout.addWidget(back_btn)
+
+    def get_conversion_title(self):
+        """获取转换类型标题"""
+        title_map = {
+            "pdf2word": "PDF转Word 转换界面",
+            "pdf2excel": "PDF转Excel 转换界面",
+            "word2pdf": "Word转PDF 转换界面",
+            "excel2pdf": "Excel转PDF 转换界面"
+        }
+        return title_map.get(self.conversion_type, "PDF转换界面")
+
+    def mousePressEvent(self, event):
+        """窗口拖动：鼠标按下"""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            event.accept()
+
+    def mouseMoveEvent(self, event):
+        """窗口拖动：鼠标移动"""
+        if event.buttons() == Qt.MouseButton.LeftButton and self.drag_pos is not None:
+            self.move(event.globalPosition().toPoint() - self.drag_pos)
+            event.accept()
+
+    def select_file(self, conversion_type):
+        """选择文件"""
+        if conversion_type in ["pdf2word", "pdf2excel"]:
+            # PDF转其他格式
+            file_paths, _ = QFileDialog.getOpenFileNames(
+                self, "选择PDF文件（可多选）", "", "PDF文件 (*.pdf);;所有文件 (*.*)"
+            )
+        elif conversion_type == "word2pdf":
+            # Word转PDF
+            file_paths, _ = QFileDialog.getOpenFileNames(
+                self, "选择Word文件（可多选）", "", "Word文件 (*.docx *.doc);;所有文件 (*.*)"
+            )
+        elif conversion_type == "excel2pdf":
+            # Excel转PDF
+            file_paths, _ = QFileDialog.getOpenFileNames(
+                self, "选择Excel文件（可多选）", "", "Excel文件 (*.xlsx *.xls);;所有文件 (*.*)"
+            )
+        else:
+            return
+
+        # 添加文件到列表
+        for path in file_paths:
+            self.add_file(path)
+
+    def add_file(self, path):
+        """添加文件到列表（忽略重复文件）"""
+        if path in self.file_paths:
+            return
+        self.file_paths.append(path)
+        item = QListWidgetItem(path)
+        item.setData(Qt.ItemDataRole.UserRole, path)
+        self.file_items[path] = item
+        self.file_list_widget.addItem(item)
+
+    def set_file_status(self, path, status):
+        """在文件列表中显示单个文件的转换状态"""
+        item = self.file_items.get(path)
+        if item is not None:
+            item.setText(f"[{status}] {path}")
+
+    def delete_selected_file(self):
+        """删除选中文件"""
+        if self.conversion_queue.is_running():
+            QMessageBox.information(self, "提示", "转换正在进行中，请稍后再试")
+            return
+        selected_items = self.file_list_widget.selectedItems()
+        if not selected_items:
+            return  # 无选中项时直接返回
+        # 反向删除避免正向删除导致索引错乱
+        for item in reversed(selected_items):
+            path = item.data(Qt.ItemDataRole.UserRole)
+            if path in self.file_paths:
+                self.file_paths.remove(path)
+                del self.file_items[path]
+            row = self.file_list_widget.row(item)
+            self.file_list_widget.takeItem(row)
+
+    def back_to_main(self):
+        """返回主窗口"""
+        self.close()
+        self.main_window.activateWindow()
+
+    def closeEvent(self, event):
+        """关闭窗口时取消未开始的转换任务"""
+        self.conversion_queue.shutdown()
+        super().closeEvent(event)
+
+    def update_progress(self, job_id, value):
+        """更新单个文件的进度及总进度条"""
+        if job_id not in self.jobs:
+            return
+        job_state = self.jobs[job_id]
+        job_state[1] = value
+        self.set_file_status(job_state[0].input_file, f"转换中 {value}%")
+        total = sum(progress for _, progress in self.jobs.values())
+        self.progress_bar.setValue(int(total / len(self.jobs)))
+
+    def conversion_finished(self, result):
+        """单个文件转换完成回调"""
+        job_state = self.jobs.get(result.job.job_id)
+        if job_state is None:
+            return
+        job_state[1] = 100
+        self.set_file_status(result.job.input_file, "成功" if result.success else "失败")
+        if not result.success:
+            self.failed_files.append(result.job.input_file)
+        item = self.file_items.get(result.job.input_file)
+        if item is not None:
+            item.setToolTip(result.message)
+
+    def batch_finished(self):
+        """整批转换完成回调：汇总结果"""
+        failed = self.failed_files
+        total = len(self.jobs)
+        self.jobs.clear()
+        self.failed_files = []
+        self.progress_bar.setValue(0)
+        if failed:
+            details = "\n".join(failed[:10]) + ("\n..." if len(failed) > 10 else "")
+            QMessageBox.critical(self, "失败",
+                                 f"转换完成：成功 {total - len(failed)} 个，失败 {len(failed)} 个"
+                                 f"\n（鼠标悬停文件可查看原因）\n\n{details}")
+        else:
+            QMessageBox.information(self, "成功", f"转换完成：共 {total} 个文件")
+
+    def converter_func(self, conversion_type):
+        """转换功能入口"""
+        if not self.file_paths:
+            QMessageBox.warning(self, "警告", "请先选择文件")
+            return
+
+        # 确保上一批转换已结束
+        if self.conversion_queue.is_running():
+            QMessageBox.information(self, "提示", "转换正在进行中，请稍后再试")
+            return
+
+        # 批量生成转换任务
+        jobs = []
+        for input_file in self.file_paths:
+            # 生成输出路径
+            output_file = default_output_path(conversion_type, input_file)
+
+            # 校验输出路径
+            if not output_file or os.path.isdir(output_file):
+                QMessageBox.warning(self, "错误", f"无效的输出路径：{output_file}")
+                continue
+
+            job = ConversionJob(conversion_type, input_file, output_file)
+            self.jobs[job.job_id] = [job, 0]
+            self.set_file_status(input_file, "等待中")
+            jobs.append(job)
+
+        # 提交到转换队列，立即返回（不阻塞界面）
+        if jobs:
+            self.progress_bar.setValue(0)
+            self.conversion_queue.submit(jobs)
+
+
+def main():
+    app = QApplication(sys.argv)
+    window = PDFConverterGUI()
+    window.show()
+    return app.exec()
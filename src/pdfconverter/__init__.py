@@ -0,0 +1,12 @@
+"""PDF转换器核心包：可在无 Qt 环境下独立运行的转换引擎"""
+from .engine import (
+    CONVERTER_MODULES, CONVERTERS, INPUT_EXTENSIONS, OUTPUT_EXTENSIONS,
+    ConversionError, ConversionJob, ConversionResult, convert, converter_available, default_output_path,
+    install_hint, load_converter, missing_module, register_converter,
+)
+
+__all__ = [
+    "CONVERTER_MODULES", "CONVERTERS", "INPUT_EXTENSIONS", "OUTPUT_EXTENSIONS",
+    "ConversionError", "ConversionJob", "ConversionResult", "convert", "converter_available",
+    "default_output_path", "install_hint", "load_converter", "missing_module", "register_converter",
+]
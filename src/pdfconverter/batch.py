@@ -0,0 +1,257 @@
+"""批量转换：基于进程池的多文件并发执行（命令行、GUI 共用）"""
+import os
+import queue
+import logging
+import importlib
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from .engine import CONVERTER_MODULES, ConversionResult, convert, converter_available
+
+logger = logging.getLogger(__name__)
+
+WORKER_DIED = "转换失败：\n工作进程异常退出（可能内存不足或转换库崩溃）"
+
+# 工作进程内的进度队列，由 init_worker 设置
+_progress_queue = None
+
+
+def init_worker(log_level=logging.WARNING, progress_queue=None, preload=()):
+    """工作进程初始化：导入 preload 中尚未加载的模块，压低第三方库（如 pdf2docx）的日志输出，记录进度队列"""
+    global _progress_queue
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass  # 缺少依赖库的转换在转换时再报错
+    logging.getLogger().setLevel(log_level)  # 在导入之后：pdf2docx 导入时会把根日志级别设为 INFO
+    _progress_queue = progress_queue
+
+
+def run_job(job):
+    """在工作进程中执行单个任务；设置了进度队列时回传 (job_id, 进度)，开始执行时先回传 0"""
+    if _progress_queue is None:
+        return convert(job)
+    _progress_queue.put((job.job_id, 0))
+    return convert(job, lambda value: _progress_queue.put((job.job_id, value)))
+
+
+def warm_up():
+    """预先加载中文字体（含字宽表），之后由本进程 fork 出的工作进程直接继承，首个任务不必再解析字体"""
+    from .layout import glyph_widths
+    from .word2pdf import new_document
+
+    try:
+        glyph_widths(new_document({}).current_font)
+    except Exception as e:
+        logger.warning("预加载字体失败（首个任务转换时再加载）：%s", e)
+
+
+def available_types(conversion_types=None):
+    return [t for t in (conversion_types or CONVERTER_MODULES) if t in CONVERTER_MODULES and converter_available(t)]
+
+
+def preload_modules(conversion_types=None):
+    """工作进程需要预加载的模块：各转换类型（默认全部）可用的转换模块，用到中文字体时再加上 preload"""
+    types = available_types(conversion_types)
+    modules = [f"{__package__}.{CONVERTER_MODULES[t][0]}" for t in types]
+    if {"word2pdf", "excel2pdf"} & set(types):
+        modules.append(f"{__package__}.preload")
+    return modules
+
+
+def worker_context(conversion_types=None):
+    """工作进程的启动方式及需要预加载的模块，返回 (multiprocessing 上下文, 预加载模块列表)
+
+    支持 forkserver 时，forkserver 进程先导入转换库、加载字体（见 forkserver_preload），工作进程都由它 fork 出来，
+    直接继承（写时复制共享内存），首个任务不必再导入；也避免从带线程的主进程（GUI、HTTP 服务）直接 fork。
+    forkserver 每个进程只启动一次，之后的进程池沿用首次设置的预加载模块，其余模块由 init_worker 补充导入。
+    不支持 forkserver 时（Windows）由 init_worker 在各工作进程启动时导入。
+    工作进程会以 __mp_main__ 重新导入启动脚本，启动脚本模块级不应导入重量级的库（见 main.py）。
+    环境变量 PDFCONVERTER_PRELOAD=0 时不预加载，使用默认启动方式。
+    """
+    if os.environ.get("PDFCONVERTER_PRELOAD") == "0":
+        return multiprocessing.get_context(), []
+    preload = preload_modules(conversion_types)
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context(), preload
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(forkserver_preload(conversion_types, preload))
+    return context, preload
+
+
+def forkserver_paths():
+    """forkserver 进程的模块搜索路径中与本进程可能不同的部分：当前目录、PYTHONPATH、site-packages"""
+    import site
+
+    paths = [os.getcwd()] + [p for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p]
+    paths += site.getsitepackages() + [site.getusersitepackages()]
+    return {os.path.abspath(p) for p in paths}
+
+
+def forkserver_preload(conversion_types, preload):
+    """forkserver 进程预加载的模块
+
+    Python 3.11 的 forkserver 进程不沿用本进程的 sys.path（传入的 sys_path、main_path 都被忽略），
+    只能从当前目录、PYTHONPATH 和 site-packages 导入。本包由脚本所在目录或运行时加入的路径导入时
+    （GUI 的 main.py、基准测试），forkserver 进程导入不了本包：这时只预加载转换依赖的第三方库（导入耗时的主要部分），
+    本包的模块和字体由 init_worker 在各工作进程中加载（工作进程沿用本进程的 sys.path）。
+    不为此修改环境变量或当前目录，本进程中的其他线程和之后启动的其他子进程不受影响。
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if package_root in forkserver_paths():
+        return preload
+    return list(dict.fromkeys(name for t in available_types(conversion_types) for name in CONVERTER_MODULES[t][1]))
+
+
+def default_workers():
+    """默认并发数：CPU 核数"""
+    return os.cpu_count() or 1
+
+
+def ordered_map(executor, func, args_list, window):
+    """并行执行 func(*args)，最多 window 个任务在途，按提交顺序逐个产出结果"""
+    pending = deque()
+    for args in args_list:
+        pending.append(executor.submit(func, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def run_round(jobs, max_workers, context, preload, log_level, report):
+    """在新建的进程池中执行一轮任务，结果交给 report(result)；返回因进程池损坏而未完成的任务（按提交顺序）"""
+    futures = {}
+    broken = set()
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=init_worker,
+                             initargs=(log_level, None, preload)) as executor:
+        try:
+            for job in jobs:
+                futures[executor.submit(run_job, job)] = job
+        except BrokenProcessPool:
+            pass  # 提交过程中进程池已损坏，未提交的任务留到下一轮
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                report(future.result())
+            except BrokenProcessPool:
+                broken.add(job.job_id)
+            except Exception as e:
+                report(ConversionResult(job, False, f"转换失败：\n{str(e)}"))
+    submitted = {job.job_id for job in futures.values()}
+    return [job for job in jobs if job.job_id in broken or job.job_id not in submitted]
+
+
+def run_batch(jobs, max_workers=None, on_result=None, log_level=logging.WARNING):
+    """用进程池并发执行一批任务，每完成一个回调 on_result(result)，返回全部结果
+
+    工作进程异常退出会使整个进程池损坏，池中未完成的任务都无法得到结果：这些任务在新的进程池中重新执行；
+    再次遇到进程池损坏的任务逐个单独执行，单独执行仍然损坏的才作为失败结果返回，不影响其余任务。
+    """
+    results = []
+
+    def report(result):
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    max_workers = max(1, min(max_workers or default_workers(), len(jobs) or 1))
+    context, preload = worker_context({job.conversion_type for job in jobs})
+    broken = run_round(jobs, max_workers, context, preload, log_level, report)
+    if broken:
+        logger.warning("工作进程异常退出，在新的进程池中重新执行 %d 个任务", len(broken))
+        broken = run_round(broken, min(max_workers, len(broken)), context, preload, log_level, report)
+    for job in broken:
+        if run_round([job], 1, context, preload, log_level, report):
+            report(ConversionResult(job, False, WORKER_DIED))
+    return results
+
+
+class BatchRunner:
+    """非阻塞批量执行器：submit() 立即返回，调用方定期 poll() 获取进度与结果
+
+    工作进程预加载 conversion_types（默认全部）的转换库和字体，进程池存续期间一直复用。
+    工作进程异常退出（内存不足、转换库崩溃）会使整个进程池损坏：此时重建进程池，
+    受影响的任务重新提交一次，再次失败才作为失败结果返回。
+    """
+
+    def __init__(self, max_workers=None, log_level=logging.WARNING, conversion_types=None):
+        self.context, self.preload = worker_context(conversion_types)
+        self.log_level = log_level
+        self.max_workers = max_workers or default_workers()
+        self.generation = 0  # 进程池重建次数，用于判断损坏的是不是当前进程池
+        self.start_pool()
+        self.pending = {}  # job_id -> (job, future, 提交时的进程池代数)
+        self.retried = set()  # 因进程池损坏重新提交过的任务
+
+    def start_pool(self):
+        """创建进程池；进度队列也每次新建（被杀死的工作进程可能持有旧队列的写锁）"""
+        self.progress_queue = self.context.Queue()
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.context,
+                                            initializer=init_worker,
+                                            initargs=(self.log_level, self.progress_queue, self.preload))
+
+    def restart_pool(self):
+        """工作进程异常退出后重建进程池"""
+        logger.warning("工作进程异常退出，重建进程池")
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.generation += 1
+        self.start_pool()
+
+    def start_workers(self):
+        """立即启动全部工作进程（进程池默认在提交任务时才按需启动），返回各进程的 pid"""
+        futures = [self.executor.submit(os.getpid) for _ in range(self.max_workers)]
+        return {future.result() for future in futures}
+
+    @property
+    def busy(self):
+        """是否还有未完成的任务"""
+        return bool(self.pending)
+
+    def submit(self, job):
+        """提交一个任务；进程池已损坏时先重建"""
+        try:
+            future = self.executor.submit(run_job, job)
+        except BrokenProcessPool:
+            self.restart_pool()
+            future = self.executor.submit(run_job, job)
+        self.pending[job.job_id] = (job, future, self.generation)
+
+    def poll(self):
+        """取出已到达的进度事件和已完成的结果（不阻塞），返回 (progress, results)"""
+        progress = []
+        while True:
+            try:
+                progress.append(self.progress_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        results = []
+        for job_id, (job, future, generation) in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[job_id]
+            try:
+                results.append(future.result())
+            except BrokenProcessPool:
+                if job_id in self.retried:
+                    self.retried.discard(job_id)
+                    results.append(ConversionResult(job, False, WORKER_DIED))
+                    continue
+                if generation == self.generation:
+                    self.restart_pool()
+                self.retried.add(job_id)
+                self.submit(job)
+            except Exception as e:
+                results.append(ConversionResult(job, False, f"转换失败：\n{str(e)}"))
+            else:
+                self.retried.discard(job_id)
+        return progress, results
+
+    def shutdown(self, wait=False):
+        """关闭进程池，取消尚未开始的任务"""
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+        self.pending.clear()
@@ -0,0 +1,106 @@
+"""长文档转换的断点（PDF转Word、PDF转Excel）：每个分片解析（提取）完成后，把该分片的页面结果写入任务的工作目录
+
+工作目录为 断点根目录/<任务键>，任务键与结果缓存相同（输入文件内容 + 转换类型 + 影响输出的参数 +
+依赖库版本）。断点与结果缓存、页面缓存相互独立：关闭缓存或缓存条目被淘汰都不影响断点。
+每个分片一个 JSON 文件（原子写入，文件名为分片的首页和末页页码）；转换中途失败或进程被终止后，
+再次转换同一文件（相同参数）时读取已完成的分片，只解析其余页面。
+转换成功后删除工作目录；超过 KEEP_DAYS 天未更新的工作目录（失败后不再重试的任务）在下次转换时清理。
+
+环境变量 PDFCONVERTER_CHECKPOINT_DIR 指定断点根目录（默认为本工具缓存目录下的 checkpoints）。
+"""
+import os
+import json
+import time
+import shutil
+import logging
+
+from .resultcache import atomic_write_json, cache_key
+
+logger = logging.getLogger(__name__)
+
+KEEP_DAYS = 7
+
+
+def checkpoint_root():
+    path = os.environ.get("PDFCONVERTER_CHECKPOINT_DIR")
+    if path:
+        return path
+    from .fonts import cache_dir
+
+    return os.path.join(cache_dir(), "checkpoints")
+
+
+def remove_stale(root):
+    """删除超过 KEEP_DAYS 天未更新的工作目录"""
+    cutoff = time.time() - KEEP_DAYS * 86400
+    for entry in os.scandir(root):
+        try:
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        except OSError:
+            pass  # 其他进程刚删除
+
+
+class Checkpoints:
+    """一个任务的断点工作目录"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    @classmethod
+    def for_job(cls, job):
+        """任务的断点工作目录（不存在时创建）；无法创建时记录警告并返回 None，转换照常进行，只是没有断点"""
+        root = checkpoint_root()
+        try:
+            os.makedirs(root, exist_ok=True)
+            remove_stale(root)
+            directory = os.path.join(root, cache_key(job))
+            os.makedirs(directory, exist_ok=True)
+            os.utime(directory)  # 继续转换时刷新，避免被当作过期目录清理
+        except OSError as e:
+            logger.warning("无法创建断点目录 %s：%s", root, e)
+            return None
+        return cls(directory)
+
+    def load(self):
+        """已完成分片的页面 {页码: 解析结果}；无法读取的文件跳过（这些页重新解析）"""
+        pages = {}
+        for name in sorted(os.listdir(self.directory)):
+            if name.endswith(".json"):
+                pages.update(self.read(os.path.join(self.directory, name)))
+        return pages
+
+    def page_files(self):
+        """已完成分片中各页所在的文件 {页码: 文件路径}，按文件名中的首末页码推算，不读取文件
+
+        用于逐个分片读取断点，内存中只保留一个分片；分片中的页码不连续时，推算出的页可能不在文件中。
+        """
+        files = {}
+        for name in sorted(os.listdir(self.directory)):
+            first, sep, last = name[:-len(".json")].partition("-")
+            if name.endswith(".json") and sep and first.isdigit() and last.isdigit():
+                files.update(dict.fromkeys(range(int(first), int(last) + 1), os.path.join(self.directory, name)))
+        return files
+
+    def read(self, path):
+        """一个分片的页面 {页码: 解析结果}；无法读取时记录警告并返回空字典（这些页重新解析）"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return {int(i): page for i, page in json.load(f).items()}
+        except (OSError, ValueError) as e:
+            logger.warning("忽略无法读取的断点文件 %s：%s", path, e)
+            return {}
+
+    def save(self, pages):
+        """保存一个分片的页面 {页码: 解析结果}；写入失败只记录警告"""
+        if not pages:
+            return
+        try:
+            atomic_write_json({str(i): page for i, page in pages.items()},
+                              os.path.join(self.directory, f"{min(pages):06d}-{max(pages):06d}.json"))
+        except OSError as e:
+            logger.warning("无法写入断点 %s：%s", self.directory, e)
+
+    def remove(self):
+        """转换成功后删除工作目录"""
+        shutil.rmtree(self.directory, ignore_errors=True)
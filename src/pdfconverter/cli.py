@@ -0,0 +1,330 @@
+"""命令行入口
+
+python -m pdfconverter convert --type pdf2excel --jobs 16 <文件/通配符/目录>
+python -m pdfconverter resume [批次ID]
+python -m pdfconverter watch -o <输出目录> <输入目录> [<输入目录> ...]
+python -m pdfconverter serve [--port 8765]
+"""
+import os
+import sys
+import glob
+import time
+import signal
+import logging
+import threading
+import argparse
+
+from .engine import INPUT_EXTENSIONS, OUTPUT_EXTENSIONS, ConversionJob, parse_option_value
+from .batch import default_workers, run_batch
+from .watch import SETTLE_SECONDS, POLL_INTERVAL, FolderWatcher, default_routes
+from .journal import open_journal, default_journal_path
+from .server import DEFAULT_PORT, DEFAULT_MAX_UPLOAD_MB, RETENTION_SECONDS, ConversionServer
+
+
+def glob_root(pattern):
+    """通配符中第一个含通配符的路径部分之前的目录，如 in/**/*.pdf -> in"""
+    parts = []
+    for part in pattern.split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or "."
+
+
+def expand_inputs(patterns, conversion_type):
+    """展开文件、通配符和目录，返回去重后的 [(输入文件, 所属输入根目录)]（保持顺序）
+
+    输入根目录用于在输出目录中镜像子目录：目录参数为该目录，通配符为其不含通配符的前缀目录，文件参数为所在目录。
+    """
+    exts = INPUT_EXTENSIONS[conversion_type]
+    files = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches, root = glob.glob(pattern, recursive=True), glob_root(pattern)
+        else:
+            matches, root = [pattern], None
+        for path in sorted(matches):
+            if os.path.isdir(path):
+                # 目录：递归收集匹配扩展名的文件
+                for parent, _, names in os.walk(path):
+                    files.extend((os.path.join(parent, name), root or path) for name in sorted(names)
+                                 if name.lower().endswith(exts))
+            elif os.path.isfile(path):
+                files.append((path, root or os.path.dirname(path)))
+    roots = {}
+    for path, root in files:
+        roots.setdefault(os.path.abspath(path), os.path.abspath(root))
+    return list(roots.items())
+
+
+def parse_option(text):
+    """解析 KEY=VALUE 形式的转换参数，数字和 true/false 自动转换类型"""
+    key, sep, value = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"参数格式应为 KEY=VALUE：{text}")
+    return key, parse_option_value(value)
+
+
+def parse_route(text):
+    """解析 EXT=TYPE 形式的路由，如 .pdf=pdf2excel"""
+    ext, sep, conversion_type = text.partition("=")
+    ext = "." + ext.lower().lstrip(".")
+    if not sep or ext not in INPUT_EXTENSIONS.get(conversion_type, ()):
+        raise argparse.ArgumentTypeError(f"路由格式应为 扩展名=转换类型，且扩展名是该转换的输入格式：{text}")
+    return ext, conversion_type
+
+
+def build_jobs(files, conversion_type, output_dir=None, options=None):
+    """为每个 (输入文件, 输入根目录) 生成转换任务；指定 output_dir 时按相对输入根目录的路径镜像到该目录"""
+    jobs = []
+    for input_file, root in files:
+        output_file = ""
+        if output_dir:
+            relative = os.path.splitext(os.path.relpath(input_file, root))[0]
+            output_file = os.path.join(output_dir, relative + OUTPUT_EXTENSIONS[conversion_type])
+        jobs.append(ConversionJob(conversion_type, input_file, output_file, dict(options or {})))
+    return jobs
+
+
+def duplicate_outputs(jobs):
+    """输出到同一路径的任务 {输出文件: [输入文件]}（如不同目录中的同名文件输出到同一目录）"""
+    inputs = {}
+    for job in jobs:
+        if job.output_file:
+            inputs.setdefault(os.path.normcase(os.path.abspath(job.output_file)), []).append(job.input_file)
+    return {output: files for output, files in inputs.items() if len(files) > 1}
+
+
+def print_summary(results, elapsed):
+    """打印吞吐量汇总"""
+    ok = sum(1 for r in results if r.success)
+    pages = sum(r.pages for r in results)
+    elapsed = max(elapsed, 1e-9)
+    print(f"\n共 {len(results)} 个文件：成功 {ok}，失败 {len(results) - ok}")
+    print(f"总页数 {pages}，耗时 {elapsed:.2f}s，"
+          f"{len(results) / elapsed:.2f} 文件/s，{pages / elapsed:.2f} 页/s")
+
+
+def cmd_convert(args):
+    """convert 子命令：批量转换"""
+    files = expand_inputs(args.paths, args.conversion_type)
+    if not files:
+        print("未找到需要转换的文件", file=sys.stderr)
+        return 1
+
+    options = dict(args.options)
+    if args.page_workers > 1:
+        options["page_workers"] = args.page_workers
+    if args.no_cache:
+        options["cache"] = False
+    jobs = build_jobs(files, args.conversion_type, args.output_dir, options)
+    duplicates = duplicate_outputs(jobs)
+    if duplicates:
+        for output, inputs in duplicates.items():
+            print(f"多个输入文件将输出到同一文件 {output}：{'、'.join(inputs)}", file=sys.stderr)
+        print("请分别转换这些文件或改用目录参数（按子目录镜像输出）", file=sys.stderr)
+        return 1
+    for output_dir in {os.path.dirname(job.output_file) for job in jobs if args.output_dir}:
+        os.makedirs(output_dir, exist_ok=True)
+    journal = None if args.no_journal else open_journal(args.journal)
+    if journal:
+        batch_id = journal.create_batch(jobs)
+        print(f"批次 {batch_id}（中断后可用 python -m pdfconverter resume {batch_id} 继续）")
+    return run_jobs(jobs, args, journal)
+
+
+def run_jobs(jobs, args, journal=None):
+    """并发执行任务，逐个打印结果并写入批次日志，最后打印汇总"""
+    total = len(jobs)
+    done = 0
+
+    def on_result(result):
+        nonlocal done
+        done += 1
+        if journal:
+            journal.record(result)
+        status = ("成功（缓存）" if result.cached else "成功") if result.success else "失败"
+        print(f"[{done}/{total}] {status} {result.job.input_file} ({result.elapsed:.2f}s)")
+        if not result.success:
+            print("    " + result.message.replace("\n", " "), file=sys.stderr)
+
+    start = time.perf_counter()
+    log_level = logging.INFO if args.verbose else logging.WARNING
+    try:
+        results = run_batch(jobs, args.jobs, on_result, log_level)
+    finally:
+        if journal:
+            journal.close()
+    print_summary(results, time.perf_counter() - start)
+    return 0 if all(r.success for r in results) else 1
+
+
+def cmd_resume(args):
+    """resume 子命令：继续批次日志中的批次，只执行失败和未完成的任务"""
+    journal = open_journal(args.journal)
+    if journal is None:
+        return 1
+    if args.list:
+        print(f"{'批次':<22} {'创建时间':<19} {'来源':<4} {'任务':>6} {'成功':>6} {'失败':>6} {'未完成':>6}")
+        for batch_id, created, source, total, ok, failed in journal.batches():
+            print(f"{batch_id:<22} {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created)):<19} "
+                  f"{source:<4} {total:>6} {ok:>6} {failed:>6} {total - ok - failed:>6}")
+        journal.close()
+        return 0
+
+    batch_id = args.batch_id or journal.latest_unfinished()
+    found = journal.resumable_jobs(batch_id) if batch_id else None
+    if found is None:
+        print(f"批次不存在：{batch_id}" if batch_id else "没有需要继续的批次", file=sys.stderr)
+        journal.close()
+        return 1 if batch_id else 0
+    jobs, skipped = found
+    print(f"批次 {batch_id}：跳过已完成 {skipped} 个，重新转换 {len(jobs)} 个")
+    if not jobs:
+        journal.close()
+        return 0
+    for output_dir in {os.path.dirname(job.output_file) for job in jobs}:
+        os.makedirs(output_dir, exist_ok=True)
+    return run_jobs(jobs, args, journal)
+
+
+def cmd_watch(args):
+    """watch 子命令：监视文件夹持续转换，Ctrl+C 或 SIGTERM 时等待在途任务完成后退出"""
+    for path in args.paths:
+        if not os.path.isdir(path):
+            print(f"输入目录不存在：{path}", file=sys.stderr)
+            return 1
+        if os.path.abspath(path) == os.path.abspath(args.output_dir):
+            print("输出目录不能与输入目录相同", file=sys.stderr)
+            return 1
+
+    options = dict(args.options)
+    if args.no_cache:
+        options["cache"] = False
+    routes = dict(default_routes(), **dict(args.routes))
+    failures = 0
+
+    def on_result(result):
+        nonlocal failures
+        failures += not result.success
+        status = ("成功（缓存）" if result.cached else "成功") if result.success else "失败"
+        print(f"{time.strftime('%H:%M:%S')} {status} {result.job.input_file} -> "
+              f"{result.job.output_file} ({result.elapsed:.2f}s)", flush=True)
+        if not result.success:
+            print("    " + result.message.replace("\n", " "), file=sys.stderr, flush=True)
+
+    log_level = logging.INFO if args.verbose else logging.WARNING
+    journal = None if args.no_journal else open_journal(args.journal)
+    watcher = FolderWatcher(args.paths, args.output_dir, routes, args.jobs, options,
+                            settle=args.settle, poll_interval=args.poll_interval,
+                            polling=args.polling, on_result=on_result, log_level=log_level, journal=journal)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: watcher.stop())
+    if not args.once:
+        print(f"正在监视 {', '.join(args.paths)}，输出到 {args.output_dir}（Ctrl+C 停止）", flush=True)
+    try:
+        if not watcher.run(once=args.once):
+            return 1
+    finally:
+        if journal:
+            journal.close()
+    return 1 if args.once and failures else 0
+
+
+def cmd_serve(args):
+    """serve 子命令：本机 HTTP 转换服务，Ctrl+C 或 SIGTERM 时停止"""
+    if args.host not in ("127.0.0.1", "localhost", "::1"):
+        print(f"警告：服务监听 {args.host}，其他机器也可以提交任务（服务没有身份验证）", file=sys.stderr)
+    log_level = logging.INFO if args.verbose else logging.WARNING
+    logging.getLogger().setLevel(log_level)  # pdf2docx 导入时已配置根日志
+    server = ConversionServer(args.host, args.port, args.jobs, args.work_dir,
+                              args.max_upload_mb << 20, args.retention, log_level)
+    # shutdown() 会等待 serve_forever() 退出，不能在同一线程的信号处理函数中直接调用
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    host, port = server.server_address[:2]
+    print(f"转换服务已启动：http://{host}:{port}（{server.jobs.runner.max_workers} 个工作进程，Ctrl+C 停止）",
+          flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="pdfconverter", description="PDF转换器 - 命令行批量转换")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = subparsers.add_parser("convert", help="批量转换文件")
+    convert_parser.add_argument("--type", dest="conversion_type", required=True,
+                                choices=sorted(OUTPUT_EXTENSIONS), help="转换类型")
+    convert_parser.add_argument("--jobs", "-j", type=int, default=default_workers(),
+                                help="并发进程数（默认 CPU 核数）")
+    convert_parser.add_argument("--page-workers", type=int, default=1,
+                                help="单个文件分片并行转换的进程数（适用于大文件；Word转PDF 按分页符、分节符分片）")
+    convert_parser.add_argument("--option", "-O", dest="options", type=parse_option, action="append",
+                                default=[], metavar="KEY=VALUE",
+                                help="转换参数，可重复指定，如 -O pages_per_sheet=1")
+    convert_parser.add_argument("--no-cache", action="store_true",
+                                help="不使用转换结果缓存和页面缓存（相同文件、相同参数也重新转换）")
+    convert_parser.add_argument("--output-dir", "-o", help="输出目录（默认与输入文件同目录；目录参数中的文件按子目录镜像存放）")
+    convert_parser.add_argument("--journal", help="批次日志文件（默认 %s）" % default_journal_path())
+    convert_parser.add_argument("--no-journal", action="store_true", help="不记录批次日志（中断后无法用 resume 继续）")
+    convert_parser.add_argument("--verbose", "-v", action="store_true", help="输出转换库的详细日志")
+    convert_parser.add_argument("paths", nargs="+", help="输入文件、通配符或目录")
+    convert_parser.set_defaults(func=cmd_convert)
+
+    resume_parser = subparsers.add_parser("resume", help="继续中断的批次，只转换失败和未完成的文件")
+    resume_parser.add_argument("--jobs", "-j", type=int, default=default_workers(),
+                               help="并发进程数（默认 CPU 核数）")
+    resume_parser.add_argument("--journal", help="批次日志文件（默认 %s）" % default_journal_path())
+    resume_parser.add_argument("--list", action="store_true", help="列出最近的批次")
+    resume_parser.add_argument("--verbose", "-v", action="store_true", help="输出转换库的详细日志")
+    resume_parser.add_argument("batch_id", nargs="?", help="批次 ID（默认最近一个未全部成功的批次）")
+    resume_parser.set_defaults(func=cmd_resume)
+
+    watch_parser = subparsers.add_parser("watch", help="监视文件夹，持续转换放入的文件")
+    watch_parser.add_argument("--output-dir", "-o", required=True,
+                              help="输出目录（按相对输入目录的路径镜像存放）")
+    watch_parser.add_argument("--jobs", "-j", type=int, default=default_workers(),
+                              help="并发进程数（默认 CPU 核数）")
+    watch_parser.add_argument("--route", dest="routes", type=parse_route, action="append", default=[],
+                              metavar="EXT=TYPE",
+                              help="按扩展名指定转换类型，可重复指定（默认 .pdf 转 Word），如 --route .pdf=pdf2excel")
+    watch_parser.add_argument("--option", "-O", dest="options", type=parse_option, action="append",
+                              default=[], metavar="KEY=VALUE", help="转换参数，可重复指定")
+    watch_parser.add_argument("--no-cache", action="store_true", help="不使用转换结果缓存和页面缓存")
+    watch_parser.add_argument("--settle", type=float, default=SETTLE_SECONDS,
+                              help=f"文件多少秒不再变化视为写入完成（默认 {SETTLE_SECONDS:g}）")
+    watch_parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL,
+                              help=f"轮询模式的扫描间隔秒数（默认 {POLL_INTERVAL:g}）")
+    watch_parser.add_argument("--polling", action="store_true",
+                              help="不使用 inotify，定时扫描（适用于网络共享目录，其他机器写入的文件 inotify 感知不到）")
+    watch_parser.add_argument("--journal", help="批次日志文件，记录已转换的文件（默认 %s）" % default_journal_path())
+    watch_parser.add_argument("--no-journal", action="store_true",
+                              help="不记录批次日志（按输出文件的修改时间判断文件是否已转换）")
+    watch_parser.add_argument("--once", action="store_true", help="转换完目录中现有的文件后退出")
+    watch_parser.add_argument("--verbose", "-v", action="store_true", help="输出转换库的详细日志")
+    watch_parser.add_argument("paths", nargs="+", help="输入目录")
+    watch_parser.set_defaults(func=cmd_watch)
+
+    serve_parser = subparsers.add_parser("serve", help="本机 HTTP 转换服务")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="监听地址（默认只监听本机）")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"端口（默认 {DEFAULT_PORT}）")
+    serve_parser.add_argument("--jobs", "-j", type=int, default=default_workers(),
+                              help="工作进程数（默认 CPU 核数）")
+    serve_parser.add_argument("--work-dir", help="存放上传文件和转换结果的目录（默认临时目录，退出时删除）")
+    serve_parser.add_argument("--max-upload-mb", type=int, default=DEFAULT_MAX_UPLOAD_MB,
+                              help=f"单个上传文件的大小上限（默认 {DEFAULT_MAX_UPLOAD_MB} MB）")
+    serve_parser.add_argument("--retention", type=float, default=RETENTION_SECONDS,
+                              help=f"已结束任务的保留秒数（默认 {RETENTION_SECONDS}）")
+    serve_parser.add_argument("--verbose", "-v", action="store_true", help="输出请求日志和转换库的详细日志")
+    serve_parser.set_defaults(func=cmd_serve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,207 @@
+"""流式读取 .docx 正文（Word转PDF 使用）
+
+python-docx 的 Document() 会把整个 document.xml 解析成 DOM 树，几百 MB 的文档要占用数 GB 内存。
+这里直接从 zip 包中 iterparse 正文 XML，依次产出正文顶层的段落和表格（轻量记录），
+处理完的元素立即从树中清除，内存占用与文档大小基本无关。
+段落文本的取法与 python-docx 的 paragraph.text 一致（w:tab 记为制表符、手动换行记为换行符）。
+分页符、分节符不产生文字，而是记在其后第一个段落的 page_break_before 上（段落中间的分页符按段落结束处理）。
+"""
+import zipfile
+import posixpath
+from dataclasses import dataclass, field
+
+from lxml import etree
+
+from .engine import ConversionError
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+RELS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+DEFAULT_DOCUMENT_PATH = "word/document.xml"
+# 开关类格式属性取这些值时表示关闭
+OFF_VALUES = ("0", "false", "off")
+# 不换页的分节符类型
+CONTINUOUS_SECTIONS = ("continuous", "nextColumn")
+
+
+@dataclass
+class Run:
+    """一段格式相同的文字"""
+    text: str
+    bold: bool = False
+    italic: bool = False
+
+
+@dataclass
+class Paragraph:
+    """正文段落"""
+    runs: list = field(default_factory=list)
+    style: str = ""  # 段落样式 ID，如 Heading1
+    page_break_before: bool = False  # 段落从新的一页开始
+
+    @property
+    def text(self):
+        return "".join(run.text for run in self.runs)
+
+
+@dataclass
+class Table:
+    """正文表格：rows 为每行的单元格文本列表（单元格内多个段落以换行连接）"""
+    rows: list = field(default_factory=list)
+
+
+def is_on(element):
+    """w:b、w:i 等开关属性是否开启（存在且 w:val 不为关闭值）"""
+    return element is not None and element.get(W + "val", "true").lower() not in OFF_VALUES
+
+
+def run_text(run):
+    """w:r 的文本：与 python-docx 的 run.text 一致"""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W + "t":
+            parts.append(child.text or "")
+        elif tag in (W + "tab", W + "ptab"):
+            parts.append("\t")
+        elif tag == W + "br":
+            if child.get(W + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")  # 分页符、分栏符不产生文字
+        elif tag == W + "cr":
+            parts.append("\n")
+        elif tag == W + "noBreakHyphen":
+            parts.append("-")
+    return "".join(parts)
+
+
+def read_run(run):
+    rpr = run.find(W + "rPr")
+    if rpr is None:
+        return Run(run_text(run))
+    return Run(run_text(run), bold=is_on(rpr.find(W + "b")), italic=is_on(rpr.find(W + "i")))
+
+
+def read_paragraph(paragraph):
+    """w:p 转为 Paragraph：取直接子级 w:r 及超链接中的 w:r"""
+    runs = []
+    for child in paragraph:
+        if child.tag == W + "r":
+            runs.append(read_run(child))
+        elif child.tag == W + "hyperlink":
+            runs.extend(read_run(run) for run in child.iterchildren(W + "r"))
+    ppr = paragraph.find(W + "pPr")
+    if ppr is None:
+        return Paragraph(runs)
+    style = ppr.find(W + "pStyle")
+    return Paragraph(runs, style.get(W + "val", "") if style is not None else "",
+                     page_break_before=is_on(ppr.find(W + "pageBreakBefore")))
+
+
+def breaks_page_after(paragraph):
+    """段落之后是否换页：段落中含分页符，或段落结束一个需要换页的节"""
+    for br in paragraph.iter(W + "br"):
+        if br.get(W + "type") == "page":
+            return True
+    section = paragraph.find(f"{W}pPr/{W}sectPr")
+    if section is None:
+        return False
+    section_type = section.find(W + "type")
+    return section_type is None or section_type.get(W + "val", "nextPage") not in CONTINUOUS_SECTIONS
+
+
+def read_table(table):
+    """w:tbl 转为 Table；嵌套表格的文字并入所在单元格"""
+    rows = []
+    for tr in table.iterchildren(W + "tr"):
+        cells = []
+        for tc in tr.iterchildren(W + "tc"):
+            cells.append("\n".join(read_paragraph(p).text for p in tc.iter(W + "p")))
+        rows.append(cells)
+    return Table(rows)
+
+
+def main_document_path(archive):
+    """从包关系中找到正文部件路径（通常为 word/document.xml）"""
+    try:
+        root = etree.fromstring(archive.read("_rels/.rels"))
+    except (KeyError, etree.XMLSyntaxError):
+        return DEFAULT_DOCUMENT_PATH
+    for rel in root.iter(RELS + "Relationship"):
+        if rel.get("Type") == OFFICE_DOCUMENT:
+            return posixpath.normpath(rel.get("Target", DEFAULT_DOCUMENT_PATH).lstrip("/"))
+    return DEFAULT_DOCUMENT_PATH
+
+
+class CountingReader:
+    """包装文件对象，记录已读取的字节数（用于估算进度）"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.position = 0
+
+    def read(self, size=-1):
+        data = self.stream.read(size)
+        self.position += len(data)
+        return data
+
+
+class DocxReader:
+    """逐个产出 .docx 正文顶层的 Paragraph / Table 记录
+
+    用法：
+        with DocxReader(path) as reader:
+            for block in reader:
+                ...
+    读取过程中 reader.fraction 为已读取正文 XML 的比例（0~1）。
+    """
+
+    def __init__(self, path):
+        try:
+            self.archive = zipfile.ZipFile(path)
+        except (OSError, zipfile.BadZipFile) as e:
+            raise ConversionError(f"无法读取Word文档（不是有效的 .docx 文件）：{e}") from e
+        name = main_document_path(self.archive)
+        try:
+            self.info = self.archive.getinfo(name)
+        except KeyError:
+            self.archive.close()
+            raise ConversionError(f"Word文档缺少正文部件：{name}") from None
+        self.stream = None
+
+    @property
+    def fraction(self):
+        if self.stream is None or not self.info.file_size:
+            return 0.0
+        return min(1.0, self.stream.position / self.info.file_size)
+
+    def __iter__(self):
+        self.stream = CountingReader(self.archive.open(self.info))
+        body = W + "body"
+        # 不解析外部实体、不访问网络；huge_tree 允许超长文本节点
+        events = etree.iterparse(self.stream, events=("end",), tag=(W + "p", W + "tbl"),
+                                 resolve_entities=False, no_network=True, huge_tree=True)
+        pending_break = False
+        for _, element in events:
+            parent = element.getparent()
+            if parent is None or parent.tag != body:
+                continue  # 表格内的段落随表格一起处理
+            if element.tag == W + "p":
+                paragraph = read_paragraph(element)
+                paragraph.page_break_before = paragraph.page_break_before or pending_break
+                pending_break = breaks_page_after(element)
+                yield paragraph
+            else:
+                yield read_table(element)
+            # 释放已处理的元素及其之前的兄弟节点
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+
+    def close(self):
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
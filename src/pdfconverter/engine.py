@@ -0,0 +1,205 @@
+"""转换引擎：不依赖 PyQt6 的纯 Python 转换核心（GUI、命令行共用）"""
+import os
+import time
+import uuid
+import logging
+import importlib
+import importlib.util
+from dataclasses import dataclass, field, replace
+
+from . import resultcache
+
+# 各转换类型的输入/输出扩展名
+INPUT_EXTENSIONS = {
+    "pdf2word": (".pdf",),
+    "pdf2excel": (".pdf",),
+    "word2pdf": (".docx", ".doc"),
+    "excel2pdf": (".xlsx", ".xls"),
+}
+OUTPUT_EXTENSIONS = {
+    "pdf2word": ".docx",
+    "pdf2excel": ".xlsx",
+    "word2pdf": ".pdf",
+    "excel2pdf": ".pdf",
+}
+
+# 转换类型 -> (转换模块, 依赖的第三方库)；转换模块在首次使用时才导入，启动时不加载任何转换库
+CONVERTER_MODULES = {
+    "pdf2word": ("pdf2word", ("pdf2docx", "fitz")),
+    "pdf2excel": ("pdf2excel", ("fitz", "pdfplumber", "openpyxl")),
+    "word2pdf": ("word2pdf", ("fitz", "lxml", "fpdf", "fontTools")),
+    "excel2pdf": ("excel2pdf", ("openpyxl", "fpdf", "fontTools")),
+}
+# 导入名与 pip 安装名不同的库
+PIP_NAMES = {"fitz": "pymupdf", "fpdf": "fpdf2", "fontTools": "fonttools"}
+
+# 转换类型 -> 转换函数，由各转换模块通过 register_converter 注册
+CONVERTERS = {}
+# 转换类型 -> 导入转换模块时缺失的库（find_spec 查不出的问题，如库的依赖缺失）
+_import_errors = {}
+
+
+class ConversionError(Exception):
+    """转换失败（消息直接展示给用户）"""
+
+
+@dataclass
+class ConversionJob:
+    """一个转换任务：转换类型、输入输出路径及可选参数"""
+    conversion_type: str
+    input_file: str
+    output_file: str = ""
+    options: dict = field(default_factory=dict)
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def __post_init__(self):
+        if not self.output_file:
+            self.output_file = default_output_path(self.conversion_type, self.input_file)
+
+
+@dataclass
+class ConversionResult:
+    """转换结果：是否成功、提示信息、处理页数与耗时（秒），cached 表示直接取自结果缓存，
+    input_hash 为工作进程中算出的输入文件 SHA-256（成功时，供批次日志记录，主进程不必再读文件）"""
+    job: ConversionJob
+    success: bool
+    message: str
+    pages: int = 0
+    elapsed: float = 0.0
+    cached: bool = False
+    input_hash: str = ""
+
+
+def register_converter(conversion_type):
+    """装饰器：注册转换函数，签名为 func(job, progress) -> 处理页数"""
+
+    def decorator(func):
+        CONVERTERS[conversion_type] = func
+        return func
+
+    return decorator
+
+
+def default_output_path(conversion_type, input_file):
+    """根据转换类型生成默认输出路径（与输入文件同目录同名）"""
+    ext = OUTPUT_EXTENSIONS.get(conversion_type)
+    if ext is None:
+        raise ConversionError(f"不支持的转换类型：{conversion_type}")
+    return os.path.splitext(input_file)[0] + ext
+
+
+def parse_option_value(value):
+    """把字符串形式的转换参数值转为 bool、int、float，其余保持字符串（命令行、HTTP 服务共用）"""
+    if value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def missing_module(conversion_type):
+    """转换类型缺失的依赖库名，齐全时返回空字符串；只查找库是否已安装，不导入"""
+    if conversion_type in CONVERTERS:
+        return ""
+    if conversion_type in _import_errors:
+        return _import_errors[conversion_type]
+    for name in CONVERTER_MODULES[conversion_type][1]:
+        if importlib.util.find_spec(name) is None:
+            return name
+    return ""
+
+
+def converter_available(conversion_type):
+    """转换类型是否可用（已注册，或依赖库齐全）"""
+    return conversion_type in CONVERTERS or (
+        conversion_type in CONVERTER_MODULES and not missing_module(conversion_type))
+
+
+def install_hint(conversion_type):
+    """缺少依赖库时给用户的安装提示"""
+    name = missing_module(conversion_type)
+    return f"缺少转换依赖库：{name}，请先安装：pip install {PIP_NAMES.get(name, name)}"
+
+
+def load_converter(conversion_type):
+    """返回转换函数，首次使用时导入对应的转换模块；不支持或缺少依赖库时抛出 ConversionError"""
+    func = CONVERTERS.get(conversion_type)
+    if func is not None:
+        return func
+    if conversion_type not in CONVERTER_MODULES:
+        raise ConversionError(f"不支持的转换类型：{conversion_type}")
+    if missing_module(conversion_type):
+        raise ConversionError(install_hint(conversion_type))
+    root = logging.getLogger()
+    level = root.level
+    try:
+        importlib.import_module("." + CONVERTER_MODULES[conversion_type][0], __package__)
+    except ImportError as e:
+        _import_errors[conversion_type] = e.name or str(e)
+        raise ConversionError(install_hint(conversion_type))
+    finally:
+        root.setLevel(level)  # pdf2docx 导入时会把根日志级别设为 INFO
+    return CONVERTERS[conversion_type]
+
+
+def _no_progress(value):
+    pass
+
+
+def write_output(func, job, progress):
+    """转换到输出目录中的临时文件，成功后原子替换为输出文件，返回页数
+
+    输出文件可能是结果缓存条目的硬链接，原地写入会连带改写缓存，替换只断开链接；
+    转换中途失败也不会留下写了一半的输出文件，原有的输出文件保持不变。
+    """
+    directory, name = os.path.split(os.path.abspath(job.output_file))
+    stem, ext = os.path.splitext(name)
+    tmp_path = os.path.join(directory, f".{stem}.{uuid.uuid4().hex[:8]}.tmp{ext}")  # 保留扩展名，转换库按它选择格式
+    try:
+        pages = func(replace(job, output_file=tmp_path), progress)
+        try:
+            os.replace(tmp_path, job.output_file)
+        except PermissionError as e:
+            raise ConversionError(f"无法写入输出文件：{e}，请关闭该文件后重试")
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass  # 转换失败时可能未生成
+        raise
+    return pages
+
+
+def convert(job, progress=None):
+    """执行一个转换任务，progress(int) 接收 0~100 的进度；异常转为失败结果返回
+
+    相同输入、相同参数的任务直接取结果缓存（任务参数 cache=False 时跳过缓存）。
+    """
+    progress = progress or _no_progress
+    start = time.perf_counter()
+    try:
+        func = load_converter(job.conversion_type)
+        if not job.output_file or os.path.isdir(job.output_file):
+            raise ConversionError(f"无效的输出路径：{job.output_file}")
+
+        digest = resultcache.file_digest(job.input_file)
+        cache = resultcache.default_cache() if job.options.get("cache", True) else None
+        if cache is not None:
+            key = resultcache.cache_key(job, digest)
+            pages = cache.fetch(key, job.output_file)
+            if pages is not None:
+                progress(100)
+                return ConversionResult(job, True, f"转换完成（使用缓存结果）：\n{job.output_file}",
+                                        pages, time.perf_counter() - start, cached=True, input_hash=digest)
+
+        pages = write_output(func, job, progress)
+        if cache is not None:
+            cache.store(key, job.output_file, pages or 0)
+        return ConversionResult(job, True, f"转换完成：\n{job.output_file}",
+                                pages or 0, time.perf_counter() - start, input_hash=digest)
+    except Exception as e:
+        return ConversionResult(job, False, f"转换失败：\n{str(e)}",
+                                0, time.perf_counter() - start)
@@ -0,0 +1,145 @@
+"""Excel转PDF（纯 Python 实现，不依赖 Office，可在 Linux 上运行）"""
+import os
+import math
+import logging
+import datetime
+from itertools import chain, islice
+
+import openpyxl
+
+from .engine import ConversionError, register_converter
+from .pdfdoc import PDF
+
+logger = logging.getLogger(__name__)
+
+ROW_HEIGHT = 6  # 行高（毫米）
+FONT_SIZE = 9
+TITLE_FONT_SIZE = 12
+MIN_COLUMN_WIDTH = 15  # 列宽下限（毫米），列太多时按列分组输出到后续页面
+SAMPLE_ROWS = 100  # 预读行数，用于确定列数（部分文件声明的表格范围不准确）
+
+
+def format_value(value):
+    """单元格值转为显示文本"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S") if value.time() != datetime.time() else value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def fit_text(pdf, text, width):
+    """截断文本使其不超出单元格宽度"""
+    if pdf.get_string_width(text) <= width:
+        return text
+    # 按宽度比例估算后逐字收缩
+    end = max(1, int(len(text) * width / pdf.get_string_width(text)))
+    while end > 0 and pdf.get_string_width(text[:end] + "…") > width:
+        end -= 1
+    return text[:end] + "…"
+
+
+def render_sheet(pdf, worksheet, on_row):
+    """逐行流式渲染一个工作表，每渲染一行回调 on_row(权重)，各组权重之和为 1
+
+    列数超过一页能容纳的列数时按列分组：每组从新页开始，重新读取工作表渲染该组的列（只读模式无法回退），不丢列。
+    """
+    # 只读模式下拿不到列宽，预读少量行确定列数
+    rows = worksheet.iter_rows(values_only=True)
+    head = list(islice(rows, SAMPLE_ROWS))
+    max_column = max([worksheet.max_column or 1] + [len(row) for row in head])
+    columns = max(1, min(max_column, int(pdf.epw // MIN_COLUMN_WIDTH)))
+    groups = math.ceil(max_column / columns)
+    truncated = 0
+    for group in range(groups):
+        first = group * columns
+        last = min(first + columns, max_column)
+        title = worksheet.title if groups == 1 else f"{worksheet.title}（第 {first + 1}-{last} 列）"
+        source = chain(head, rows) if group == 0 else worksheet.iter_rows(values_only=True)
+        truncated = render_columns(pdf, title, source, first, last, columns, max_column,
+                                   lambda: on_row(1 / groups))
+    if truncated:
+        logger.warning("工作表 %s 有 %d 行超出声明的 %d 列，超出部分未输出", worksheet.title, truncated, max_column)
+
+
+def render_columns(pdf, title, rows, first, last, columns, max_column, on_row):
+    """渲染各行的第 first 至 last 列（不含），列宽按每页 columns 列均分；返回超出 max_column 列的行数
+
+    直接用 text() 写文字、用 line() 画表格线（比逐格调用 cell() 快得多），并自行处理换页。
+    """
+    pdf.add_page()
+    pdf.set_font_size(TITLE_FONT_SIZE)
+    pdf.cell(0, ROW_HEIGHT * 1.5, title)
+    pdf.ln(ROW_HEIGHT * 2)
+    pdf.set_font_size(FONT_SIZE)
+
+    width = pdf.epw / columns
+    text_width = width - pdf.c_margin * 2
+    x_positions = [pdf.l_margin + i * width for i in range(last - first + 1)]
+    # 文字基线：行内垂直居中
+    baseline = (ROW_HEIGHT + pdf.font_size * 0.7) / 2
+
+    truncated = 0
+    top = y = pdf.get_y()
+    for row in rows:
+        if y + ROW_HEIGHT > pdf.page_break_trigger:
+            draw_grid(pdf, x_positions, top, y)
+            pdf.add_page()
+            top = y = pdf.get_y()
+        pdf.line(x_positions[0], y, x_positions[-1], y)
+        for i, value in enumerate(row[first:last]):
+            text = format_value(value)
+            if text:
+                pdf.text(x_positions[i] + pdf.c_margin, y + baseline, fit_text(pdf, text, text_width))
+        if len(row) > max_column and any(value is not None for value in row[max_column:]):
+            truncated += 1
+        y += ROW_HEIGHT
+        on_row()
+    draw_grid(pdf, x_positions, top, y)
+    pdf.set_y(y)
+    return truncated
+
+
+def draw_grid(pdf, x_positions, top, bottom):
+    """画出当前页表格的竖线和底边"""
+    if bottom <= top:
+        return
+    for x in x_positions:
+        pdf.line(x, top, x, bottom)
+    pdf.line(x_positions[0], bottom, x_positions[-1], bottom)
+
+
+@register_converter("excel2pdf")
+def excel_to_pdf(job, progress):
+    """Excel转PDF：只读模式 iter_rows 逐行读取并渲染，不把整个工作表载入内存"""
+    if os.path.splitext(job.input_file)[1].lower() == ".xls":
+        raise ConversionError("暂不支持 .xls 格式，请另存为 .xlsx 后重试")
+
+    workbook = openpyxl.load_workbook(job.input_file, read_only=True, data_only=True)
+    try:
+        pdf = PDF('L', 'mm', 'A4')  # 横向、毫米、A4纸张
+        pdf.set_auto_page_break(True, margin=10)
+        pdf.use_cjk_font(job.options.get("font_path"), size=FONT_SIZE)
+
+        # 以工作表声明的行数估算进度
+        total_rows = sum(ws.max_row or 0 for ws in workbook.worksheets) or 1
+        done_rows = reported_rows = 0
+
+        def on_row(weight):
+            nonlocal done_rows, reported_rows
+            done_rows += weight
+            if done_rows - reported_rows >= 100:
+                reported_rows = done_rows
+                progress(min(99, int(done_rows / total_rows * 100)))
+
+        for worksheet in workbook.worksheets:
+            render_sheet(pdf, worksheet, on_row)
+    finally:
+        workbook.close()
+
+    # 保存PDF文件
+    pdf.output(job.output_file)
+    progress(100)
+    return pdf.page_no()
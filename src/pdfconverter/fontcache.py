@@ -0,0 +1,213 @@
+"""TrueType 字体解析结果缓存（Word转PDF、Excel转PDF 共用）
+
+fpdf 的 add_font() 每次都要完整解析字体的 cmap、hmtx 等表并计算每个字符的宽度，
+对几 MB 的中文字体来说这一步往往比转换一个短文档本身还慢。这里把解析好的字体对象作为原型，
+按 (路径, 字形序号, mtime, 大小) 缓存在进程内，并可选地序列化到磁盘（pickle，只读取属于当前用户、
+其他用户不可写的目录和文件）；之后每个文档只克隆原型，重新以惰性方式打开字体文件（仅读表目录），从而跳过解析。字形顺序表也一并缓存：没有 post 字形名的
+中文字体要靠反查 cmap 生成字形名，输出子集化时这一步约占一半耗时。
+
+fpdf 在输出时会就地子集化 ttfont、修改字体描述符，因此克隆时这两者以及子集映射都是每个文档独立的。
+
+输出时 fpdf 只嵌入文档实际用到的字形（子集化，用到的字形由每个文档的 SubsetMap 统一收集），
+但 fontTools 子集化前要先解析整个 glyf、hmtx、cmap 表。这几张表在进程内预先解析一次，
+每个文档只复制会被子集化修改的部分（字形字典、度量字典、cmap 子表对象）。
+"""
+import os
+import copy
+import pickle
+import hashlib
+import logging
+import tempfile
+from collections import defaultdict
+
+import fpdf
+from fpdf import FPDF
+from fpdf.fonts import TTFFont, SubsetMap
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables._g_l_y_f import Glyph
+
+from .fonts import cache_dir
+
+logger = logging.getLogger(__name__)
+
+# 关闭后退回每次 add_font() 完整解析（基准测试用）
+ENABLED = True
+# 是否同时缓存到磁盘，供新启动的工作进程直接加载
+DISK_CACHE = True
+# 是否在文档间共享子集化所需的已解析字体表
+SHARED_TABLES = True
+
+# 每个文档独立的属性，不进入原型
+PER_DOCUMENT_SLOTS = ("i", "ttfont", "_hbfont", "subset", "missing_glyphs", "biggest_size_pt", "color_font")
+
+_prototypes = {}
+
+
+def font_key(path, face_index):
+    """缓存键：字体路径、字形序号、修改时间、大小及 fpdf 版本（内部结构随版本变化）"""
+    st = os.stat(path)
+    return (os.path.abspath(path), face_index, st.st_mtime, st.st_size, fpdf.__version__)
+
+
+def disk_path(key):
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir(), "fontcache", digest + ".pickle")
+
+
+def dump_prototype(font, glyph_order):
+    """原型转为可序列化的字典（cw 的默认值工厂是 lambda，需转成普通 dict）"""
+    state = {slot: getattr(font, slot) for slot in TTFFont.__slots__
+             if slot not in PER_DOCUMENT_SLOTS and hasattr(font, slot)}
+    state["cw"] = dict(font.cw)
+    return {"font": state, "glyph_order": glyph_order}
+
+
+def load_prototype(data):
+    font = TTFFont.__new__(TTFFont)
+    for slot, value in data["font"].items():
+        setattr(font, slot, value)
+    missing_width = font.desc.missing_width
+    font.cw = defaultdict(lambda: missing_width, data["font"]["cw"])
+    return font, data["glyph_order"]
+
+
+def trusted(st):
+    """磁盘缓存是否可信：属于当前用户且其他用户不可写（pickle 加载时可执行任意代码）；非 POSIX 系统不检查"""
+    if os.name != "posix":
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def read_disk_cache(key):
+    path = disk_path(key)
+    try:
+        if not trusted(os.stat(os.path.dirname(path))):
+            logger.warning("字体缓存目录 %s 不属于当前用户或其他用户可写，不读取", os.path.dirname(path))
+            return None
+        with open(path, "rb") as f:
+            if not trusted(os.fstat(f.fileno())):
+                logger.warning("字体缓存文件 %s 不属于当前用户或其他用户可写，不读取", path)
+                return None
+            return load_prototype(pickle.load(f))
+    except Exception:
+        return None
+
+
+def write_disk_cache(key, prototype):
+    """原子写入磁盘缓存（目录和文件仅当前用户可读写）；失败时只记录日志"""
+    path = disk_path(key)
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(dump_prototype(*prototype), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning("无法写入字体缓存 %s：%s", path, e)
+
+
+def parse_prototype(path, face_index):
+    """用一个临时 FPDF 完整解析字体，返回可克隆的 (原型, 字形顺序)；不适合缓存的字体返回 None"""
+    scratch = FPDF()
+    extra = {"collection_font_number": face_index} if face_index else {}
+    scratch.add_font("prototype", "", path, **extra)
+    font = scratch.fonts["prototype"]
+    # 彩色字体与 fpdf 实例绑定；缺 .notdef 的字体会被 fpdf 就地补字形，重新打开后会丢失
+    glyph_order = font.ttfont.getGlyphOrder()
+    if font.color_font is not None or ".notdef" not in glyph_order:
+        return None
+    font.ttfont.close()
+    return font, list(glyph_order)
+
+
+def read_shared_tables(font, glyph_order):
+    """预先解析子集化必读的大表；解析失败时返回 None（退回每个文档自行解析）"""
+    try:
+        ttfont = TTFont(font.ttffile, recalcTimestamp=False,
+                        fontNumber=font.collection_font_number, lazy=True)
+        ttfont.setGlyphOrder(list(glyph_order))
+        shared = {"cmap": ttfont["cmap"]}
+        for subtable in shared["cmap"].tables:
+            subtable.ensureDecompiled()
+        for tag in ("hmtx", "vmtx"):
+            if tag in ttfont:
+                shared[tag] = ttfont[tag]
+        if "glyf" in ttfont:
+            glyf = ttfont["glyf"]
+            # 只保留原始字形数据，复制时重新构造 Glyph（子集化会就地修改 Glyph）
+            shared["glyf"] = (glyf, [(name, getattr(glyph, "data", b"")) for name, glyph in glyf.glyphs.items()])
+        ttfont.close()
+        return shared
+    except Exception as e:
+        logger.debug("无法预解析字体表 %s：%s", font.ttffile, e)
+        return None
+
+
+def install_shared_tables(ttfont, shared):
+    """把共享表的副本放入某个文档的 ttfont，使其不再从文件解析这些表"""
+    cmap = copy.copy(shared["cmap"])
+    cmap.tables = [copy.copy(subtable) for subtable in cmap.tables]
+    ttfont.tables["cmap"] = cmap
+    for tag in ("hmtx", "vmtx"):
+        if tag in shared:
+            table = copy.copy(shared[tag])
+            table.metrics = dict(table.metrics)
+            ttfont.tables[tag] = table
+    if "glyf" in shared:
+        template, glyph_data = shared["glyf"]
+        glyf = copy.copy(template)
+        glyf.glyphs = {name: Glyph(data) for name, data in glyph_data}
+        glyf.glyphOrder = list(template.glyphOrder)
+        glyf._reverseGlyphOrder = {}
+        ttfont.tables["glyf"] = glyf
+
+
+def get_prototype(path, face_index):
+    """返回 (原型, 字形顺序, 共享表)；不适合缓存的字体返回 None"""
+    key = font_key(path, face_index)
+    if key in _prototypes:
+        return _prototypes[key]
+    prototype = read_disk_cache(key) if DISK_CACHE else None
+    if prototype is None:
+        prototype = parse_prototype(path, face_index)
+        if prototype is not None and DISK_CACHE:
+            write_disk_cache(key, prototype)
+    if prototype is not None:
+        prototype = (*prototype, read_shared_tables(*prototype))
+    _prototypes[key] = prototype
+    return prototype
+
+
+def clone_font(prototype, glyph_order, shared, pdf, fontkey):
+    """由原型生成某个文档专用的字体对象"""
+    font = copy.copy(prototype)
+    font.i = len(pdf.fonts) + 1
+    font.fontkey = fontkey
+    font.ttfont = TTFont(prototype.ttffile, recalcTimestamp=False,
+                         fontNumber=prototype.collection_font_number, lazy=True)
+    font.ttfont.setGlyphOrder(list(glyph_order))  # 子集化时会替换字形顺序，复制一份
+    if shared is not None and SHARED_TABLES:
+        install_shared_tables(font.ttfont, shared)
+    font._hbfont = None
+    font.desc = copy.copy(prototype.desc)
+    font.missing_glyphs = []
+    font.biggest_size_pt = 0
+    font.color_font = None
+    font.subset = SubsetMap(font)
+    return font
+
+
+def add_cached_font(pdf, family, path, face_index=0):
+    """等同于 pdf.add_font(family, '', path)，但字体只在首次使用时解析"""
+    fontkey = family.lower()
+    if fontkey in pdf.fonts:
+        return
+    cached = get_prototype(path, face_index) if ENABLED else None
+    if cached is None:
+        extra = {"collection_font_number": face_index} if face_index else {}
+        pdf.add_font(family, '', path, **extra)
+        return
+    prototype, glyph_order, shared = cached
+    pdf.fonts[fontkey] = clone_font(prototype, glyph_order, shared, pdf, fontkey)
+    if prototype.is_cff and prototype.is_cid_keyed:
+        pdf._set_min_pdf_version("1.6")  # 与 add_font() 保持一致
@@ -0,0 +1,226 @@
+"""中文字体查找（Word转PDF、Excel转PDF 共用）
+
+首次使用时扫描系统字体目录，把每个字体的族名、样式、是否覆盖中文等信息写入持久化索引
+（fonts.json）；之后的进程只需读取索引并检查字体目录的修改时间，目录有变化时才增量重扫。
+同一进程内解析结果会被缓存，重复查找几乎没有开销。
+"""
+import os
+import sys
+import json
+import logging
+import tempfile
+
+from .engine import ConversionError
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+FONT_EXTENSIONS = (".ttf", ".ttc", ".otf", ".otc")
+# 判断字体是否覆盖中文的样本字符
+CJK_SAMPLE = "中文字体"
+# 优先选用的中文字体族（按优先级），都没有时选任意一个覆盖中文的常规体
+PREFERRED_CJK_FAMILIES = [
+    "SimHei", "Microsoft YaHei", "SimSun", "PingFang SC", "Heiti SC", "STHeiti",
+    "Noto Sans CJK SC", "Noto Sans SC", "Source Han Sans SC", "Source Han Sans CN",
+    "WenQuanYi Micro Hei", "WenQuanYi Zen Hei", "AR PL UMing CN", "AR PL UKai CN",
+]
+REGULAR_STYLES = ("regular", "normal", "book", "roman", "medium", "w3")
+
+
+def system_font_dirs():
+    """当前平台的标准字体目录"""
+    home = os.path.expanduser("~")
+    if sys.platform.startswith("win"):
+        windir = os.environ.get("WINDIR", r"C:\Windows")
+        dirs = [os.path.join(windir, "Fonts")]
+        if os.environ.get("LOCALAPPDATA"):
+            dirs.append(os.path.join(os.environ["LOCALAPPDATA"], "Microsoft", "Windows", "Fonts"))
+        return dirs
+    if sys.platform == "darwin":
+        return ["/System/Library/Fonts", "/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(home, ".local", "share")
+    return ["/usr/share/fonts", "/usr/local/share/fonts",
+            os.path.join(data_home, "fonts"), os.path.join(home, ".fonts")]
+
+
+def cache_dir():
+    """本工具的缓存目录（可用环境变量 PDFCONVERTER_CACHE_DIR 覆盖）"""
+    if os.environ.get("PDFCONVERTER_CACHE_DIR"):
+        return os.environ["PDFCONVERTER_CACHE_DIR"]
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pdfconverter")
+
+
+def read_font_faces(path):
+    """读取字体文件中每个字形（TTC 可能含多个），返回索引记录列表；无法解析时返回空列表"""
+    from fontTools.ttLib import TTFont, TTCollection
+
+    try:
+        if path.lower().endswith((".ttc", ".otc")):
+            with TTCollection(path, lazy=True) as collection:
+                fonts = list(collection.fonts)
+                return [describe_face(font, i) for i, font in enumerate(fonts)]
+        with TTFont(path, lazy=True) as font:
+            return [describe_face(font, 0)]
+    except Exception as e:
+        logger.debug("跳过无法解析的字体 %s：%s", path, e)
+        return []
+
+
+def describe_face(font, face_index):
+    """提取单个字形的族名、样式、中文覆盖情况"""
+    name = font["name"]
+    family = name.getDebugName(16) or name.getDebugName(1) or ""
+    style = name.getDebugName(17) or name.getDebugName(2) or ""
+    cmap = font.getBestCmap() or {}
+    return {
+        "index": face_index,
+        "family": family,
+        "style": style,
+        "cjk": all(ord(ch) in cmap for ch in CJK_SAMPLE),
+        "truetype": "glyf" in font,
+    }
+
+
+class FontIndex:
+    """系统字体索引：path -> {mtime, size, faces}，并记录已扫描目录的修改时间"""
+
+    def __init__(self, index_path=None, font_dirs=None):
+        self.index_path = index_path or os.path.join(cache_dir(), "fonts.json")
+        self.font_dirs = font_dirs or system_font_dirs()
+        self.fonts = {}  # 字体路径 -> {"mtime", "size", "faces"}
+        self.dirs = {}  # 已扫描目录 -> mtime
+        self.dirty = False
+
+    def load(self):
+        """读取持久化索引（版本或字体目录不符时忽略）"""
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if data.get("version") == INDEX_VERSION and data.get("font_dirs") == self.font_dirs:
+            self.fonts = data.get("fonts", {})
+            self.dirs = data.get("dirs", {})
+        return self
+
+    def save(self):
+        """原子写入索引文件（先写临时文件再替换），多个进程同时写也不会损坏"""
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        data = {"version": INDEX_VERSION, "font_dirs": self.font_dirs,
+                "dirs": self.dirs, "fonts": self.fonts}
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.index_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.chmod(tmp_path, 0o644)  # mkstemp 默认仅自己可读
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+        self.dirty = False
+
+    def is_stale(self):
+        """索引是否过期：从未扫描过，或任一已扫描目录的修改时间变化（增删了文件）"""
+        if not self.dirs:
+            return True
+        for path, mtime in self.dirs.items():
+            try:
+                if os.stat(path).st_mtime != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def refresh(self):
+        """扫描字体目录：未变化的文件沿用索引记录，新增或修改的文件重新解析"""
+        fonts, dirs = {}, {}
+        for font_dir in self.font_dirs:
+            for root, _, names in os.walk(font_dir):
+                try:
+                    dirs[root] = os.stat(root).st_mtime
+                except OSError:
+                    continue
+                for name in names:
+                    if not name.lower().endswith(FONT_EXTENSIONS):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entry = self.fonts.get(path)
+                    if not entry or entry["mtime"] != st.st_mtime or entry["size"] != st.st_size:
+                        entry = {"mtime": st.st_mtime, "size": st.st_size, "faces": read_font_faces(path)}
+                    fonts[path] = entry
+        self.dirty = self.dirty or fonts != self.fonts or dirs != self.dirs
+        self.fonts, self.dirs = fonts, dirs
+        return self
+
+    def ensure_fresh(self):
+        """按需增量重扫并保存索引"""
+        if self.is_stale():
+            self.refresh()
+            try:
+                self.save()
+            except OSError as e:
+                logger.warning("无法保存字体索引 %s：%s", self.index_path, e)
+        return self
+
+    def faces(self):
+        """遍历所有字形：(路径, 字形记录)"""
+        for path, entry in self.fonts.items():
+            for face in entry["faces"]:
+                yield path, face
+
+    def find(self, family=None, cjk=False):
+        """按族名（不区分大小写）查找常规体，返回 (路径, 字形序号)；找不到时返回 None"""
+        candidates = [(path, face) for path, face in self.faces()
+                      if (not cjk or face["cjk"])
+                      and (family is None or face["family"].lower() == family.lower())]
+        if not candidates:
+            return None
+        # 常规体优先，其次 TrueType 轮廓，最后按路径保证结果稳定
+        path, face = min(candidates, key=lambda c: (
+            c[1]["style"].lower() not in REGULAR_STYLES, not c[1]["truetype"], c[0], c[1]["index"]))
+        return path, face["index"]
+
+    def find_cjk(self):
+        """查找中文字体：优先常用字体族，否则任意覆盖中文的字体"""
+        for family in PREFERRED_CJK_FAMILIES:
+            found = self.find(family, cjk=True)
+            if found:
+                return found
+        return self.find(cjk=True)
+
+
+# 进程内缓存：索引只加载一次，中文字体只解析一次
+_default_index = None
+_cjk_font = None
+
+
+def default_index():
+    """进程内共享的系统字体索引"""
+    global _default_index
+    if _default_index is None:
+        _default_index = FontIndex().load().ensure_fresh()
+    return _default_index
+
+
+def find_cjk_font(font_path=None):
+    """返回可用的中文字体 (路径, 字形序号)；font_path 指定时直接使用该字体"""
+    global _cjk_font
+    if font_path:
+        if not os.path.isfile(font_path):
+            raise ConversionError(f"字体文件不存在：{font_path}")
+        return font_path, 0
+    if _cjk_font is None:
+        _cjk_font = default_index().find_cjk()
+    if _cjk_font is None:
+        raise ConversionError("未找到支持中文的字体文件，请检查系统字体")
+    return _cjk_font
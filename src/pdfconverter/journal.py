@@ -0,0 +1,203 @@
+"""批次日志：把每批转换任务及其状态持久化到 SQLite，程序中途退出后可以继续未完成的部分
+
+    python -m pdfconverter resume [批次ID]      # 省略时继续最近一个未全部成功的批次
+    python -m pdfconverter resume --list        # 列出最近的批次
+
+每个任务一行：转换类型、输入输出路径、参数、状态（pending / done / failed）、
+完成时记录输入文件的大小、修改时间和 SHA-256、页数、耗时和提示信息。
+继续时跳过已完成的任务，重新执行失败和未完成的任务；已完成但输出文件不存在、
+或输入文件内容已变化的任务也重新执行。
+
+监视文件夹（watch）不建批次，每个文件一行（watched 表）：转换完成（done）时记录输入文件的大小、修改时间和
+SHA-256，重启后据此判断文件是否已转换；使工作进程崩溃的文件记为 crashed，内容变化前不再重试。
+
+结果按 COMMIT_EVERY 条或 COMMIT_SECONDS 秒批量提交，异常退出最多丢失最后一秒的记录（这些任务继续时重做）。
+日志文件默认位于本工具缓存目录下，可用环境变量 PDFCONVERTER_JOURNAL 指定路径。
+"""
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+
+from .engine import ConversionJob
+from .resultcache import file_digest
+
+logger = logging.getLogger(__name__)
+
+COMMIT_EVERY = 100
+COMMIT_SECONDS = 1.0
+KEEP_DAYS = 30  # 超过该天数的批次在新建批次时删除
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    batch_id TEXT NOT NULL REFERENCES batches(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    conversion_type TEXT NOT NULL,
+    input_file TEXT NOT NULL,
+    output_file TEXT NOT NULL,
+    options TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    input_size INTEGER,
+    input_mtime INTEGER,
+    input_hash TEXT,
+    pages INTEGER,
+    elapsed REAL,
+    finished REAL,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_batch ON jobs (batch_id, state, seq);
+CREATE TABLE IF NOT EXISTS watched (
+    input_file TEXT NOT NULL,
+    output_file TEXT NOT NULL,
+    state TEXT NOT NULL,
+    input_size INTEGER,
+    input_mtime INTEGER,
+    input_hash TEXT,
+    finished REAL NOT NULL,
+    message TEXT,
+    PRIMARY KEY (input_file, output_file)
+);
+"""
+
+
+def default_journal_path():
+    path = os.environ.get("PDFCONVERTER_JOURNAL")
+    if path:
+        return path
+    from .fonts import cache_dir
+
+    return os.path.join(cache_dir(), "journal.sqlite3")
+
+
+class BatchJournal:
+    """SQLite 批次日志；同一文件可被多个进程同时使用（WAL 模式）"""
+
+    def __init__(self, path=None):
+        self.path = path or default_journal_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")  # WAL 下断电最多丢失最近的事务，不会损坏数据库
+        self.db.execute("PRAGMA foreign_keys=ON")
+        self.db.executescript(SCHEMA)
+        self.uncommitted = 0
+        self.last_commit = time.monotonic()
+
+    def create_batch(self, jobs, source="cli"):
+        """记录一批任务（全部为 pending），返回批次 ID"""
+        batch_id = time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:6]
+        with self.db:
+            self.db.execute("DELETE FROM batches WHERE created < ?", (time.time() - KEEP_DAYS * 86400,))
+            self.db.execute("INSERT INTO batches (id, created, source) VALUES (?, ?, ?)",
+                            (batch_id, time.time(), source))
+            self.db.executemany(
+                "INSERT INTO jobs (job_id, batch_id, seq, conversion_type, input_file, output_file, options)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((job.job_id, batch_id, seq, job.conversion_type,
+                  os.path.abspath(job.input_file), os.path.abspath(job.output_file),
+                  json.dumps(job.options, default=str)) for seq, job in enumerate(jobs)))
+        return batch_id
+
+    def record(self, result):
+        """记录一个任务的结果（批量提交）；输入文件的 SHA-256 由工作进程算好随结果带回，这里不读文件"""
+        size = mtime = None
+        digest = result.input_hash or None
+        if result.success:
+            try:
+                st = os.stat(result.job.input_file)
+                size, mtime = st.st_size, st.st_mtime_ns
+            except OSError:
+                pass
+        self.db.execute(
+            "UPDATE jobs SET state = ?, input_size = ?, input_mtime = ?, input_hash = ?, pages = ?,"
+            " elapsed = ?, finished = ?, message = ? WHERE job_id = ?",
+            ("done" if result.success else "failed", size, mtime, digest, result.pages,
+             result.elapsed, time.time(), result.message, result.job.job_id))
+        self.uncommitted += 1
+        if self.uncommitted >= COMMIT_EVERY or time.monotonic() - self.last_commit >= COMMIT_SECONDS:
+            self.flush()
+
+    def flush(self):
+        self.db.commit()
+        self.uncommitted = 0
+        self.last_commit = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def latest_unfinished(self):
+        """最近一个含失败或未完成任务的批次 ID，没有时返回 None"""
+        row = self.db.execute(
+            "SELECT b.id FROM batches b WHERE EXISTS"
+            " (SELECT 1 FROM jobs j WHERE j.batch_id = b.id AND j.state != 'done')"
+            " ORDER BY b.created DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def batches(self, limit=20):
+        """最近的批次：(ID, 创建时间, 来源, 任务数, 成功数, 失败数)"""
+        return self.db.execute(
+            "SELECT b.id, b.created, b.source, COUNT(j.job_id), COALESCE(SUM(j.state = 'done'), 0),"
+            " COALESCE(SUM(j.state = 'failed'), 0) FROM batches b LEFT JOIN jobs j ON j.batch_id = b.id"
+            " GROUP BY b.id ORDER BY b.created DESC LIMIT ?", (limit,)).fetchall()
+
+    def resumable_jobs(self, batch_id):
+        """批次中需要（重新）执行的任务，返回 (任务列表, 跳过的已完成任务数)；批次不存在时返回 None"""
+        if self.db.execute("SELECT 1 FROM batches WHERE id = ?", (batch_id,)).fetchone() is None:
+            return None
+        jobs, skipped = [], 0
+        rows = self.db.execute(
+            "SELECT job_id, conversion_type, input_file, output_file, options, state,"
+            " input_size, input_mtime, input_hash FROM jobs WHERE batch_id = ? ORDER BY seq", (batch_id,))
+        for job_id, conversion_type, input_file, output_file, options, state, size, mtime, digest in rows:
+            if state == "done" and self.is_current(input_file, output_file, size, mtime, digest):
+                skipped += 1
+                continue
+            # 沿用原任务 ID，结果写回同一行
+            jobs.append(ConversionJob(conversion_type, input_file, output_file, json.loads(options), job_id))
+        return jobs, skipped
+
+    def record_watched(self, input_file, output_file, state, signature, digest=None, message=None):
+        """记录监视文件夹中一个文件的结果（立即提交）：state 为 done 或 crashed，signature 为输入文件的 (大小, 修改时间)"""
+        size, mtime = signature
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO watched (input_file, output_file, state, input_size, input_mtime,"
+                " input_hash, finished, message) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (input_file, output_file, state, size, mtime, digest, time.time(), message))
+
+    def watched(self, input_file, output_file):
+        """监视文件夹中一个文件的记录 (状态, 大小, 修改时间, SHA-256)，没有记录时返回 None"""
+        return self.db.execute(
+            "SELECT state, input_size, input_mtime, input_hash FROM watched"
+            " WHERE input_file = ? AND output_file = ?", (input_file, output_file)).fetchone()
+
+    @staticmethod
+    def is_current(input_file, output_file, size, mtime, digest):
+        """已完成任务的结果是否仍然有效：输出文件存在，且输入文件未变（大小、修改时间不同时再比较内容）"""
+        if not os.path.exists(output_file):
+            return False
+        try:
+            st = os.stat(input_file)
+        except OSError:
+            return True  # 输入文件已移走，保留已有结果
+        if (st.st_size, st.st_mtime_ns) == (size, mtime):
+            return True
+        return digest is not None and st.st_size == size and file_digest(input_file) == digest
+
+
+def open_journal(path=None):
+    """打开批次日志；失败时（如目录只读）记录警告并返回 None，不影响转换"""
+    try:
+        return BatchJournal(path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("无法打开批次日志 %s：%s", path or default_journal_path(), e)
+        return None
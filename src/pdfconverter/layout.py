@@ -0,0 +1,125 @@
+"""中文段落排版：按字宽断行并直接输出文本行（Word转PDF 使用）
+
+multi_cell() 断行时逐字符测量、反复拼接字符串，长文档里是主要耗时。这里把字体的字符宽度
+按码位预先展开成数组，一段文字先一次性查出每个字的宽度并求前缀和，再用二分查找确定每行的
+断点；断点按中文禁则调整（标点不出现在行首、开括号不出现在行尾、英文单词不从中间断开），
+最后用 text() 逐行直接写出，自行处理换页。
+"""
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+
+# 不能出现在行首的字符（句读、闭括号、后引号等）
+NO_LINE_START = frozenset(
+    "，。、；：？！…‥·・）］｝〕〉》」』】〗〙〛’”〞›»ー々〻゛゜ヽヾゝゞ"
+    "ぁぃぅぇぉっゃゅょゎァィゥェォッャュョヮヵヶ"
+    "%‰℃,.;:?!)]}>"
+)
+# 不能出现在行尾的字符（开括号、前引号、货币符号等）
+NO_LINE_END = frozenset("（［｛〔〈《「『【〖〘〚‘“〝‹«([{<$￥¥£€")
+# 字形宽度以千分之一 em 为单位
+UNITS_PER_EM = 1000
+MAX_CODEPOINT = 0x110000
+
+# 最多保留的宽度数组个数（每个约 4.4 MB）；字体原型共享 cw 时同一字体只占一个，
+# 未共享（如回退路径每个文档新建字体）时按最近使用淘汰，内存不随文档数增长
+MAX_WIDTH_TABLES = 4
+
+# 字体的 cw 字典 id -> (cw, 宽度数组)，按最近使用排序；保留 cw 引用以保证 id 不被复用
+_width_tables = OrderedDict()
+
+
+def glyph_widths(font):
+    """返回字体按码位展开的字符宽度数组（同一字体只构建一次，克隆的字体共享 cw）"""
+    key = id(font.cw)
+    cached = _width_tables.get(key)
+    if cached is not None and cached[0] is font.cw:
+        _width_tables.move_to_end(key)
+        return cached[1]
+    table = array("i", [font.desc.missing_width]) * MAX_CODEPOINT
+    for codepoint, width in font.cw.items():
+        if 0 <= codepoint < MAX_CODEPOINT:
+            table[codepoint] = int(width)
+    _width_tables[key] = (font.cw, table)
+    _width_tables.move_to_end(key)
+    while len(_width_tables) > MAX_WIDTH_TABLES:
+        _width_tables.popitem(last=False)
+    return table
+
+
+def is_word_char(ch):
+    """属于西文单词的字符（单词内部不断行）"""
+    return ch.isalnum() and ord(ch) < 0x2E80
+
+
+def adjust_break(text, start, end):
+    """按禁则把断点 end 向前移动，返回调整后的断点；无法满足时保持原断点（强制断行）"""
+    candidate = end
+    while candidate > start + 1:
+        before, after = text[candidate - 1], text[candidate]
+        if after in NO_LINE_START or before in NO_LINE_END:
+            candidate -= 1
+        elif is_word_char(before) and is_word_char(after):
+            candidate -= 1
+        else:
+            return candidate
+    return end
+
+
+def break_lines(text, widths, max_width):
+    """按宽度断行，返回每行的 (起点, 终点)；widths 为每个字符的宽度，max_width 与其同单位
+
+    行首的空格会被丢弃（与 multi_cell 一致）。
+    """
+    length = len(text)
+    offsets = list(accumulate(widths, initial=0))
+    lines = []
+    start = 0
+    while start < length:
+        # 最后一个满足 offsets[end] - offsets[start] <= max_width 的 end
+        end = bisect_right(offsets, offsets[start] + max_width, start + 1) - 1
+        if end >= length:
+            lines.append((start, length))
+            break
+        end = adjust_break(text, start, max(end, start + 1))
+        line_end = end
+        while line_end > start and text[line_end - 1] == " ":
+            line_end -= 1
+        lines.append((start, line_end))
+        start = end
+        while start < length and text[start] == " ":
+            start += 1
+    return lines
+
+
+def layout_lines(pdf, text):
+    """按当前字体和页宽把一段文字断成若干行；段内换行符（Word 中的手动换行）强制断行"""
+    table = glyph_widths(pdf.current_font)
+    # 把可用宽度换算为字体单位，断行时直接比较累计字宽
+    max_width = (pdf.epw - 2 * pdf.c_margin) * UNITS_PER_EM / pdf.font_size
+    lines = []
+    for segment in text.split("\n"):
+        if not segment:
+            lines.append("")
+            continue
+        codepoints = array("I")
+        codepoints.frombytes(segment.encode("utf-32-le"))
+        widths = list(map(table.__getitem__, codepoints))
+        lines.extend(segment[start:end] for start, end in break_lines(segment, widths, max_width))
+    return lines
+
+
+def write_paragraph(pdf, text, line_height):
+    """在当前位置排版并写出一段文字，需要时自动换页；结束后光标位于段落下方"""
+    x = pdf.l_margin + pdf.c_margin
+    baseline = (line_height + pdf.font_size * 0.7) / 2  # 行内垂直居中
+    y = pdf.get_y()
+    for line in layout_lines(pdf, text):
+        if y + line_height > pdf.page_break_trigger:
+            pdf.add_page()
+            y = pdf.get_y()
+        if line:
+            pdf.text(x, y + baseline, line)
+        y += line_height
+    pdf.set_xy(pdf.l_margin, y)
@@ -0,0 +1,142 @@
+"""页面级结果缓存（PDF转Excel、PDF转Word 共用）
+
+很多PDF含有完全相同的页面（封面、条款、附件），同一份报告的新版本往往只是在末尾追加页面。
+这里按页面内容计算指纹：页面内容流 + 页面尺寸/旋转 + 资源字典（字体、图片、表单等递归展开为
+各对象内容的哈希，与对象编号无关），再加上转换类型、影响解析结果的参数和转换库版本
+（库升级后解析结果可能变化），作为缓存键。
+转换时只有未命中的页面才真正解析，命中的页面直接取缓存的解析结果拼入输出。
+页面在转换过程中即写入缓存（PDF转Excel 逐页、PDF转Word 按分片），转换中途失败后再次转换时
+已写入的页面不再解析；两者另有不依赖缓存的断点（见 checkpoint）。
+
+缓存条目为 JSON 文件，存放方式、并发写入和 LRU 淘汰与结果缓存（resultcache）相同；
+每页一个条目、数量很多，按估计总大小淘汰，扫描间隔（RESCAN_EVERY 个条目）比结果缓存长。
+环境变量：
+  PDFCONVERTER_PAGE_CACHE=0        关闭页面缓存
+  PDFCONVERTER_PAGE_CACHE_DIR      缓存目录（默认为本工具缓存目录下的 pages）
+  PDFCONVERTER_PAGE_CACHE_MB       容量上限（MB，默认 1024）
+"""
+import os
+import re
+import json
+import hashlib
+import logging
+
+from .resultcache import ResultCache, atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+PAGE_CACHE_VERSION = 1
+DEFAULT_MAX_MB = 1024
+ENTRY_EXT = ".page"
+# 间接引用 "12 0 R"；/Parent、/P 指回页面树，展开会把整个文档卷入指纹，替换为常量
+REFERENCE = re.compile(r"(\d+) (\d+) R")
+BACK_REFERENCE = re.compile(r"/(Parent|P)\s+\d+ \d+ R")
+
+
+def object_digest(doc, xref, memo):
+    """PDF 对象内容的哈希：引用的对象递归替换为其哈希，流对象加上原始流数据"""
+    if xref in memo:
+        return memo[xref]
+    memo[xref] = "cycle"  # 循环引用时的占位
+    source = BACK_REFERENCE.sub(r"/\1 ref", doc.xref_object(xref, compressed=True))
+    digest = hashlib.sha256(
+        REFERENCE.sub(lambda m: object_digest(doc, int(m.group(1)), memo), source).encode("utf-8"))
+    if doc.xref_is_stream(xref):
+        digest.update(doc.xref_stream_raw(xref))
+    memo[xref] = digest.hexdigest()
+    return memo[xref]
+
+
+def page_resources(doc, xref, memo):
+    """页面资源字典的哈希；页面本身没有 /Resources 时沿页面树向上查找继承的资源"""
+    while xref:
+        kind, value = doc.xref_get_key(xref, "Resources")
+        if kind == "xref":
+            return object_digest(doc, int(value.split()[0]), memo)
+        if kind == "dict":
+            return REFERENCE.sub(lambda m: object_digest(doc, int(m.group(1)), memo), value)
+        kind, value = doc.xref_get_key(xref, "Parent")
+        xref = int(value.split()[0]) if kind == "xref" else 0
+    return ""
+
+
+def page_digests(doc, indexes):
+    """PyMuPDF 文档中指定页面的内容指纹（共享的字体等资源只计算一次）"""
+    memo = {}
+    digests = []
+    for i in indexes:
+        page = doc[i]
+        digest = hashlib.sha256(page.read_contents())
+        digest.update(repr((tuple(page.mediabox), tuple(page.cropbox), page.rotation)).encode())
+        digest.update(page_resources(doc, page.xref, memo).encode("utf-8"))
+        digests.append(digest.hexdigest())
+    return digests
+
+
+class PageCache(ResultCache):
+    """页面解析结果缓存：键为命名空间（转换类型、参数）+ 页面指纹，值为可 JSON 序列化的解析结果"""
+    RESCAN_EVERY = 5000
+
+    def page_keys(self, doc, namespace, indexes):
+        """PyMuPDF 文档中指定页面的缓存键；加密或结构异常、无法计算指纹的文档返回 None（不使用缓存）"""
+        if doc.needs_pass:
+            return None
+        try:
+            digests = page_digests(doc, indexes)
+        except Exception as e:
+            logger.warning("无法计算页面指纹，本次不使用页面缓存：%s", e)
+            return None
+        prefix = json.dumps([PAGE_CACHE_VERSION, namespace], sort_keys=True, default=str)
+        return [hashlib.sha256(f"{prefix}:{digest}".encode("utf-8")).hexdigest() for digest in digests]
+
+    def contains(self, key):
+        return os.path.exists(self.entry_paths(key, ENTRY_EXT)[0])
+
+    def get(self, key):
+        """返回缓存的解析结果，未命中（或刚被淘汰、内容损坏）时返回 None"""
+        path = self.entry_paths(key, ENTRY_EXT)[0]
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        try:
+            os.utime(path)  # 记录最近使用时间，供 LRU 淘汰
+        except OSError:
+            pass
+        return value
+
+    def put(self, key, value):
+        """写入一页的解析结果（原子替换），按估计总大小淘汰；失败时忽略，不影响转换"""
+        path = self.entry_paths(key, ENTRY_EXT)[0]
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            atomic_write_json(value, path)
+            self.added(os.path.getsize(path))
+        except OSError:
+            pass
+
+    def evict(self):
+        try:
+            super().evict()
+        except OSError:
+            pass
+
+
+_default_cache = None
+
+
+def default_page_cache(options=None):
+    """按环境变量配置的进程内共享页面缓存；关闭（或任务参数 cache=False）时返回 None"""
+    global _default_cache
+    if os.environ.get("PDFCONVERTER_PAGE_CACHE", "1") == "0":
+        return None
+    if options is not None and not options.get("cache", True):
+        return None
+    if _default_cache is None:
+        from .fonts import cache_dir
+
+        directory = os.environ.get("PDFCONVERTER_PAGE_CACHE_DIR") or os.path.join(cache_dir(), "pages")
+        max_mb = int(os.environ.get("PDFCONVERTER_PAGE_CACHE_MB") or DEFAULT_MAX_MB)
+        _default_cache = PageCache(directory, max_mb << 20)
+    return _default_cache
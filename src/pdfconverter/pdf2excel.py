@@ -0,0 +1,282 @@
+"""PDF转Excel"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+import pdfplumber
+import openpyxl
+from pdfplumber.utils import extract_text
+from openpyxl.worksheet.cell_range import CellRange
+
+from .batch import ordered_map
+from .checkpoint import Checkpoints
+from .engine import ConversionError, register_converter
+from .pagecache import default_page_cache
+from .resultcache import library_versions
+
+# 并行模式下每个工作进程一次处理的页数，也是写断点的间隔页数
+DEFAULT_CHUNK_PAGES = 50
+# xlsx 单个工作表的最大行数
+MAX_SHEET_ROWS = 1048576
+# 文本行聚类的纵向容差（与 pdfplumber extract_text 默认的 y_tolerance 相同）
+LINE_Y_TOLERANCE = 3
+BACKENDS = ("pdfplumber", "fitz")
+
+
+def extract_page_lines(page):
+    """文本模式：每行文本占一行（A列），无合并单元格"""
+    text = page.extract_text()
+    return [[line] for line in text.split('\n')] if text else [], []
+
+
+def table_grid(table, chars):
+    """把 pdfplumber 表格转为单元格网格，返回 (rows, merges)
+
+    行列边界取自所有单元格的边框坐标，跨越多条边界的单元格记为合并区域
+    (行偏移, 列偏移, 跨行数, 跨列数)。
+    """
+    xs = sorted({round(x, 1) for cell in table.cells for x in (cell[0], cell[2])})
+    ys = sorted({round(y, 1) for cell in table.cells for y in (cell[1], cell[3])})
+    col_index = {x: i for i, x in enumerate(xs)}
+    row_index = {y: i for i, y in enumerate(ys)}
+    rows = [[None] * (len(xs) - 1) for _ in range(len(ys) - 1)]
+    merges = []
+    for x0, top, x1, bottom in table.cells:
+        c0, c1 = col_index[round(x0, 1)], col_index[round(x1, 1)]
+        r0, r1 = row_index[round(top, 1)], row_index[round(bottom, 1)]
+        # 与 pdfplumber Table.extract 相同：按字符中心点归属单元格
+        cell_chars = [c for c in chars
+                      if x0 <= (c["x0"] + c["x1"]) / 2 < x1 and top <= (c["top"] + c["bottom"]) / 2 < bottom]
+        rows[r0][c0] = extract_text(cell_chars).strip() or None
+        if r1 - r0 > 1 or c1 - c0 > 1:
+            merges.append((r0, c0, r1 - r0, c1 - c0))
+    return rows, merges
+
+
+def extract_page_tables(page):
+    """表格模式：识别出的表格按网格写入多列（保留合并单元格），表格外区域按行写入A列
+
+    表格与文本行按在页面中的纵向位置排序，每个表格前后以空行分隔。
+    """
+    tables = page.find_tables()
+    if not tables:
+        return extract_page_lines(page)
+
+    outside = page
+    for table in tables:
+        outside = outside.outside_bbox(table.bbox)
+    blocks = [(line["top"], [[line["text"]]], [], False) for line in outside.extract_text_lines()]
+    blocks += [(table.bbox[1], *table_grid(table, page.chars), True) for table in tables]
+    blocks.sort(key=lambda block: block[0])
+
+    rows, merges = [], []
+    for i, (_, block_rows, block_merges, is_table) in enumerate(blocks):
+        if is_table and rows and rows[-1]:
+            rows.append([])  # 表格前空一行
+        merges.extend((r + len(rows), c, rs, cs) for r, c, rs, cs in block_merges)
+        rows.extend(block_rows)
+        if is_table and i < len(blocks) - 1:
+            rows.append([])  # 表格后空一行
+    return rows, merges
+
+
+def extract_page(page, options):
+    """提取单页内容，返回 (rows, merges)；单页解析失败时返回空内容（跳过该页）"""
+    try:
+        if options.get("mode") == "tables":
+            return extract_page_tables(page)
+        return extract_page_lines(page)
+    except Exception:
+        return [], []
+
+
+def extract_fitz_page(page):
+    """PyMuPDF 文本模式：按词坐标重建文本行，输出格式与 pdfplumber 的文本模式一致"""
+    try:
+        words = page.get_text("words")  # (x0, top, x1, bottom, 文本, 块号, 行号, 词号)
+    except Exception:
+        return [], []
+    # 按 top 排序后，相邻词 top 之差不超过容差的归为同一行，行内按 x 排序用空格连接
+    words.sort(key=lambda w: w[1])
+    lines, current, last_top = [], [], None
+    for word in words:
+        if current and word[1] - last_top > LINE_Y_TOLERANCE:
+            lines.append(current)
+            current = []
+        current.append(word)
+        last_top = word[1]
+    if current:
+        lines.append(current)
+    return [[" ".join(w[4] for w in sorted(line, key=lambda w: w[0]))] for line in lines], []
+
+
+def iter_page_range(input_file, start, end, options):
+    """打开PDF并按页序产出 [start, end) 各页的 (rows, merges)"""
+    if options.get("backend") == "fitz":
+        with fitz.open(input_file) as doc:
+            for i in range(start, end):
+                yield extract_fitz_page(doc[i])
+        return
+    with pdfplumber.open(input_file, pages=range(start + 1, end + 1)) as pdf:
+        for page in pdf.pages:
+            yield extract_page(page, options)
+            page.close()  # 释放该页的解析缓存
+
+
+def extract_page_range(input_file, start, end, options):
+    """工作进程：独立打开PDF，提取 [start, end) 页，返回每页的 (rows, merges)"""
+    return list(iter_page_range(input_file, start, end, options))
+
+
+def page_runs(pages, chunk_pages):
+    """把升序页码列表切分为若干连续、且不超过 chunk_pages 页的范围 [start, end)"""
+    runs = []
+    for i in pages:
+        if runs and runs[-1][1] == i and i - runs[-1][0] < chunk_pages:
+            runs[-1][1] = i + 1
+        else:
+            runs.append([i, i + 1])
+    return [tuple(run) for run in runs]
+
+
+def iter_extracted(job, pages, workers, checkpoints=None):
+    """按页序产出 pages（升序页码列表）各页的 (rows, merges)；workers > 1 时按页面范围分发到多进程提取
+
+    checkpoints 不为 None 时每个页面范围（不超过 chunk_pages 页）提取完成后写入断点。
+    """
+    chunk_pages = job.options.get("chunk_pages") or DEFAULT_CHUNK_PAGES
+    if workers <= 1:
+        # 不写断点时每段连续页面只打开一次PDF
+        for s, e in page_runs(pages, chunk_pages if checkpoints is not None else len(pages)):
+            run = {}
+            for i, page in zip(range(s, e), iter_page_range(job.input_file, s, e, job.options)):
+                run[i] = page
+                yield page
+            if checkpoints is not None:
+                checkpoints.save(run)
+        return
+
+    chunk_pages = min(chunk_pages, math.ceil(len(pages) / workers))
+    runs = page_runs(pages, chunk_pages)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        args_list = [(job.input_file, s, e, job.options) for s, e in runs]
+        for (s, e), result in zip(runs, ordered_map(executor, extract_page_range, args_list, workers * 2)):
+            if checkpoints is not None:
+                checkpoints.save(dict(zip(range(s, e), result)))
+            yield from result
+
+
+def iter_pages(job, total_pages, progress, cache=None, keys=None, checkpoints=None):
+    """按页序产出每页的 (rows, merges)
+
+    keys 为各页的页面缓存键：命中缓存的页直接读取缓存，其余页提取后写入缓存。
+    checkpoints 中已有的页（上次转换中途失败前完成的分片）逐个分片读取，其余页提取后写入断点。
+    """
+    saved = checkpoints.page_files() if checkpoints is not None else {}
+    cached = {i for i in range(total_pages) if keys is not None and cache.contains(keys[i])}
+    missing = [i for i in range(total_pages) if i not in cached and i not in saved]
+    workers = min(job.options.get("page_workers", 1), len(missing))
+    extracted = iter_extracted(job, missing, workers, checkpoints)
+    missing = set(missing)
+    loaded_file, loaded = None, {}
+    try:
+        for i in range(total_pages):
+            if i in missing:
+                rows, merges = next(extracted)
+                if keys is not None:
+                    cache.put(keys[i], [rows, merges])
+            else:
+                if i in cached:
+                    # 逐页读取缓存，内存占用不随页数增长
+                    page = cache.get(keys[i])
+                else:
+                    if saved[i] != loaded_file:
+                        loaded_file, loaded = saved[i], checkpoints.read(saved[i])
+                    page = loaded.get(i)
+                # 缓存条目刚被其他进程淘汰、断点文件无法读取时单独提取该页
+                rows, merges = page or extract_page_range(job.input_file, i, i + 1, job.options)[0]
+            yield rows, merges
+            progress(int((i + 1) / total_pages * 100))
+    finally:
+        extracted.close()
+
+
+class SheetWriter:
+    """流式写入工作表：行数达到上限或页数达到 pages_per_sheet 时自动新建工作表"""
+
+    def __init__(self, workbook, title="PDF内容", max_rows=MAX_SHEET_ROWS, pages_per_sheet=None):
+        self.workbook = workbook
+        self.title = title
+        self.max_rows = min(max_rows or MAX_SHEET_ROWS, MAX_SHEET_ROWS)
+        self.pages_per_sheet = pages_per_sheet
+        self.sheet_count = 0
+        self.worksheet = None
+        self.group_pages = 0  # 当前页组（pages_per_sheet）已写入的页数
+        self.new_sheet()
+
+    def new_sheet(self):
+        """新建工作表：第一个沿用原名，之后依次为“PDF内容(2)”“PDF内容(3)”…"""
+        self.sheet_count += 1
+        title = self.title if self.sheet_count == 1 else f"{self.title}({self.sheet_count})"
+        self.worksheet = self.workbook.create_sheet(title[:31])  # 工作表名最长 31 个字符
+        self.rows = 0
+
+    def write_page(self, rows, merges=()):
+        """写入一页的所有行；merges 为相对本页首行的合并区域 (行, 列, 跨行数, 跨列数)"""
+        if self.pages_per_sheet and self.group_pages >= self.pages_per_sheet:
+            self.new_sheet()
+            self.group_pages = 0
+        # 记录每一行落在哪个工作表的第几行，以便换表后仍能正确合并
+        positions = []
+        for row in rows:
+            if self.rows >= self.max_rows:
+                self.new_sheet()
+            self.worksheet.append(row)
+            self.rows += 1
+            positions.append((self.worksheet, self.rows))
+        for r, c, row_span, col_span in merges:
+            worksheet, first_row = positions[r]
+            if positions[r + row_span - 1][0] is not worksheet:
+                continue  # 合并区域被换表拆开时不合并
+            worksheet.merged_cells.add(CellRange(min_col=c + 1, min_row=first_row,
+                                                 max_col=c + col_span, max_row=first_row + row_span - 1))
+        self.group_pages += 1
+
+
+@register_converter("pdf2excel")
+def pdf_to_excel(job, progress):
+    """PDF转Excel：只写模式流式写入整行，内存占用不随页数增长
+
+    可选参数：mode="tables" 按表格网格输出；backend="fitz" 使用 PyMuPDF 快速提取文本。
+    超过一个分片（chunk_pages 页）的文档每个分片提取完即写入断点，转换中途失败后再次转换同一文件时
+    从已完成的分片继续，成功后删除断点。
+    """
+    backend = job.options.get("backend", "pdfplumber")
+    if backend not in BACKENDS:
+        raise ConversionError(f"不支持的文本提取后端：{backend}")
+    if backend == "fitz" and job.options.get("mode") == "tables":
+        raise ConversionError("表格模式仅支持 pdfplumber 后端")
+
+    workbook = openpyxl.Workbook(write_only=True)
+    writer = SheetWriter(workbook, max_rows=job.options.get("rows_per_sheet"),
+                         pages_per_sheet=job.options.get("pages_per_sheet"))
+
+    cache = default_page_cache(job.options)
+    with fitz.open(job.input_file) as doc:
+        total_pages = len(doc)
+        # 缓存键包含影响单页提取结果的参数和提取库版本
+        keys = cache and cache.page_keys(
+            doc, ("pdf2excel", job.options.get("mode"), backend, library_versions("pdf2excel")),
+            range(total_pages))
+    # 不超过一个分片的文档中途失败也只需重做这一个分片，不写断点
+    chunk_pages = job.options.get("chunk_pages") or DEFAULT_CHUNK_PAGES
+    checkpoints = Checkpoints.for_job(job) if total_pages > chunk_pages else None
+
+    for rows, merges in iter_pages(job, total_pages, progress, cache, keys, checkpoints):
+        writer.write_page(rows, merges)
+
+    workbook.save(job.output_file)
+    if checkpoints is not None:
+        checkpoints.remove()
+    progress(100)
+    return total_pages
@@ -0,0 +1,164 @@
+"""PDF转Word"""
+import math
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from pdf2docx import Converter
+
+from .checkpoint import Checkpoints
+from .engine import ConversionError, register_converter
+from .pagecache import default_page_cache
+from .resultcache import library_versions
+
+logger = logging.getLogger(__name__)
+
+# 每个分片的页数：分片解析完成后写入断点，中途失败最多重做一个分片
+DEFAULT_CHUNK_PAGES = 50
+
+
+def converter_settings(cv, options):
+    """pdf2docx 转换参数：默认参数 + 任务参数中 pdf2docx 认识的项"""
+    settings = cv.default_settings
+    settings.update({k: v for k, v in options.items() if k in settings})
+    return settings
+
+
+def page_shards(pages, chunk_pages):
+    """把页码列表按 chunk_pages 页切分为若干分片"""
+    return [pages[i:i + chunk_pages] for i in range(0, len(pages), chunk_pages)]
+
+
+def prepare_pages(cv, settings, pages):
+    """文档级解析（字体、页面尺寸、页眉页脚、页边距、分节）：pages 中的页面一起只做一次，返回需要逐页解析的页面"""
+    cv.load_pages(pages=pages).parse_document(**settings)
+    return [page for page in cv.pages if not page.skip_parsing]
+
+
+def parse_page(page, settings):
+    """页面级解析（段落、表格、图片）；忽略解析错误时失败的页不会 finalized，不出现在 store() 结果中"""
+    try:
+        page.parse(**settings)
+    except Exception as e:
+        if not settings['ignore_page_error']:
+            raise ConversionError(f"第 {page.id + 1} 页解析失败：{e}")
+        logger.warning("忽略解析失败的第 %d 页：%s", page.id + 1, e)
+    logger.debug("已转换第 %d 页", page.id + 1)
+
+
+def iter_parsed(cv, settings, shards, progress, checkpoints=None):
+    """在 cv 中依次解析各分片，每个分片完成后写入断点并产出该分片的页面解析结果列表
+
+    文档级解析（含整个文档的字体提取）对全部分片只做一次，分片只切分页面级解析，
+    因此分片再小也不会重复文档级解析。progress(done, total) 按已解析页数回报进度。
+    """
+    parsing = {page.id for page in prepare_pages(cv, settings, [i for shard in shards for i in shard])}
+    total_pages = sum(map(len, shards))
+    done_pages = 0
+    for shard in shards:
+        for i in shard:
+            if i in parsing:
+                parse_page(cv.pages[i], settings)
+            done_pages += 1
+            progress(done_pages, total_pages)
+        raw_pages = [cv.pages[i].store() for i in shard if cv.pages[i].finalized]
+        if checkpoints is not None:
+            checkpoints.save({raw_page["id"]: raw_page for raw_page in raw_pages})
+        yield raw_pages
+
+
+def parse_page_list(input_file, pages, options, chunk_pages, checkpoint_dir):
+    """工作进程：独立打开PDF解析一组页面（每 chunk_pages 页写一次断点），返回页面解析结果列表"""
+    cv = Converter(input_file)
+    try:
+        settings = converter_settings(cv, options)
+        checkpoints = Checkpoints(checkpoint_dir) if checkpoint_dir else None
+        shards = page_shards(pages, chunk_pages)
+        return [raw_page for raw_pages in iter_parsed(cv, settings, shards, lambda done, total: None, checkpoints)
+                for raw_page in raw_pages]
+    finally:
+        cv.close()
+
+
+def parse_missing(cv, job, settings, pages, workers, chunk_pages, checkpoints, progress):
+    """解析 pages（升序页码列表），逐批产出页面解析结果列表，并按已解析页数回报进度 progress(done, total)
+
+    单进程时在 cv 中每 chunk_pages 页产出一批；workers > 1 时按进程数分片，每个工作进程一个分片
+    （文档级解析每个进程只做一次），工作进程每 chunk_pages 页写一次断点，分片完成时产出。
+    """
+    if workers <= 1:
+        yield from iter_parsed(cv, settings, page_shards(pages, chunk_pages), progress, checkpoints)
+        return
+    checkpoint_dir = checkpoints.directory if checkpoints is not None else None
+    done_pages = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(parse_page_list, job.input_file, shard, job.options, chunk_pages,
+                                   checkpoint_dir): shard
+                   for shard in page_shards(pages, math.ceil(len(pages) / workers))}
+        for future in as_completed(futures):
+            done_pages += len(futures[future])
+            progress(done_pages, len(pages))
+            yield future.result()
+
+
+def cached_pages(cv, job, settings, start, end):
+    """查询页面缓存，返回 (缓存, 各页缓存键, {页码: 缓存的页面解析结果})；缓存关闭时返回 (None, None, {})"""
+    cache = default_page_cache(job.options)
+    keys = cache and cache.page_keys(cv.fitz_doc, ("pdf2word", settings, library_versions("pdf2word")),
+                                     range(start, end))
+    if not keys:
+        return None, None, {}
+    keys = dict(zip(range(start, end), keys))
+    hits = {}
+    for i, key in keys.items():
+        raw_page = cache.get(key)
+        if raw_page is not None:
+            raw_page["id"] = i  # 相同内容的页面可能位于其他文档的其他位置
+            hits[i] = raw_page
+    return cache, keys, hits
+
+
+@register_converter("pdf2word")
+def pdf_to_word(job, progress):
+    """PDF转 word：文档级解析一次、按页分片做页面级解析后一次性生成 docx；page_workers > 1 时按进程数分片并行解析
+
+    内容与之前转换过的页面相同的页直接使用页面缓存中的解析结果，只解析其余页面；
+    超过一个分片的文档每个分片解析完即写入断点（checkpoint），转换中途失败后再次转换同一文件时
+    从已完成的分片继续，成功后删除断点。
+    """
+    cv = Converter(job.input_file)
+    try:
+        settings = converter_settings(cv, job.options)
+        start = job.options.get("start", 0)
+        end = min(job.options.get("end") or len(cv.fitz_doc), len(cv.fitz_doc))
+        chunk_pages = job.options.get("chunk_pages") or DEFAULT_CHUNK_PAGES
+        # 不超过一个分片的文档中途失败也只需重做这一个分片，不写断点
+        checkpoints = Checkpoints.for_job(job) if end - start > chunk_pages else None
+        cache, keys, hits = cached_pages(cv, job, settings, start, end)
+        if checkpoints is not None:
+            for i, raw_page in checkpoints.load().items():
+                if start <= i < end:
+                    hits.setdefault(i, raw_page)
+        missing = [i for i in range(start, end) if i not in hits]
+        workers = min(job.options.get("page_workers", 1), len(missing))
+
+        # 解析占 95% 进度，生成 docx 占剩余部分
+        page_progress = lambda done, total: progress(int(done / total * 95))
+        raw_pages = list(hits.values())
+        if missing:
+            for parsed in parse_missing(cv, job, settings, missing, workers, chunk_pages, checkpoints,
+                                        page_progress):
+                if cache is not None:
+                    for raw_page in parsed:  # 解析失败被跳过的页不在其中，不缓存
+                        cache.put(keys[raw_page["id"]], raw_page)
+                raw_pages.extend(parsed)
+
+        # 按页序恢复全部解析结果，由同一个 Converter 统一生成 docx（分节、分页与单次解析一致）
+        cv.load_pages(start, end)
+        cv.restore({"pages": raw_pages})
+        cv.make_docx(job.output_file, **settings)
+        if checkpoints is not None:
+            checkpoints.remove()
+    finally:
+        cv.close()
+    progress(100)
+    return end - start
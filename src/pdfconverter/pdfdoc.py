@@ -0,0 +1,21 @@
+"""生成PDF共用的文档类"""
+from fpdf import FPDF
+
+from .fonts import find_cjk_font
+from .fontcache import add_cached_font
+
+
+class PDF(FPDF):
+    """自定义PDF类，支持中文显示（解决乱码问题）"""
+
+    def header(self):
+        pass  # 可自定义页眉
+
+    def footer(self):
+        pass  # 可自定义页脚
+
+    def use_cjk_font(self, font_path=None, size=12):
+        """加载中文字体并设为当前字体"""
+        path, face_index = find_cjk_font(font_path)
+        add_cached_font(self, 'SimHei', path, face_index)  # 支持中文，字体只解析一次
+        self.set_font('SimHei', size=size)  # 设置字体和大小
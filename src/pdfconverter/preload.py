@@ -0,0 +1,9 @@
+"""工作进程预加载：导入本模块即加载中文字体（含字宽表）
+
+由 batch.worker_context 加入 forkserver 的预加载模块列表，forkserver 进程导入一次，
+之后 fork 出的工作进程直接继承；不支持 forkserver、或 forkserver 进程导入不了本包时（见 batch.forkserver_preload）
+由 init_worker 在各工作进程内导入。
+"""
+from .batch import warm_up
+
+warm_up()
@@ -0,0 +1,247 @@
+"""转换结果缓存：按输入文件内容寻址，重复提交的文件直接复制已有结果
+
+缓存键为 输入文件内容的 SHA-256 + 转换类型 + 影响输出的转换参数 + 转换依赖库的版本，
+Word转PDF、Excel转PDF 还包括实际选用的中文字体（不同机器字体不同时结果不混用）。结果文件按键存放在缓存目录中
+（键的前两位作为子目录），旁边的 .json 记录页数等信息；命中时把结果复制（或硬链接）到输出路径，
+并更新修改时间，超出容量上限时按修改时间淘汰最久未用的条目（LRU）。
+淘汰需要扫描整个缓存目录，因此每个进程只维护总大小的估计值：超出上限，或距上次扫描已写入
+RESCAN_EVERY 个条目（统计其他进程写入的条目）时才扫描一次。
+
+缓存目录可以放在多台机器共享的文件系统上：写入时先写同目录下的临时文件再 os.replace，
+读取方只会看到完整的文件；条目被其他进程淘汰时按未命中处理。
+
+环境变量：
+  PDFCONVERTER_RESULT_CACHE=0       关闭缓存
+  PDFCONVERTER_RESULT_CACHE_DIR     缓存目录（默认为本工具缓存目录下的 results）
+  PDFCONVERTER_RESULT_CACHE_MB      容量上限（MB，默认 2048）
+  PDFCONVERTER_RESULT_CACHE_LINK=1  命中时硬链接而不是复制（同一文件系统内；输出文件与缓存条目共用
+                                    同一份数据，不要用原地写入的工具修改输出文件）
+"""
+import os
+import json
+import shutil
+import hashlib
+import logging
+import time
+import tempfile
+import functools
+import importlib.metadata
+
+logger = logging.getLogger(__name__)
+
+# 缓存格式或转换实现变化导致旧结果不可用时递增
+CACHE_VERSION = 2
+DEFAULT_MAX_MB = 2048
+# 输出依赖所选中文字体的转换类型
+FONT_DEPENDENT_TYPES = ("word2pdf", "excel2pdf")
+# 只影响转换速度或缓存行为、不影响输出内容的参数，不计入缓存键
+IGNORED_OPTIONS = ("cache", "page_workers", "chunk_pages", "chunks")
+HASH_BLOCK_SIZE = 1 << 20
+# 超过该时间仍未替换的临时文件视为写入进程已崩溃的残留，淘汰时删除
+STALE_TMP_SECONDS = 3600
+# 淘汰到容量上限的该比例，留出余量，之后不必每次写入都扫描
+EVICT_TARGET = 0.9
+
+
+def file_digest(path):
+    """文件内容的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def library_versions(conversion_type):
+    """转换类型依赖的第三方库版本（库升级后输出可能变化）"""
+    from .engine import CONVERTER_MODULES, PIP_NAMES
+
+    versions = {}
+    for name in CONVERTER_MODULES.get(conversion_type, ("", ()))[1]:
+        dist = PIP_NAMES.get(name, name)
+        try:
+            versions[dist] = importlib.metadata.version(dist)
+        except importlib.metadata.PackageNotFoundError:
+            versions[dist] = None
+    return versions
+
+
+def font_identity(font_path=None):
+    """实际选用的中文字体：(文件名, 字形序号, 文件大小)；找不到字体时返回 None（转换本身会报错）"""
+    from .fonts import find_cjk_font
+
+    try:
+        path, face_index = find_cjk_font(font_path)
+        return [os.path.basename(path), face_index, os.path.getsize(path)]
+    except Exception:
+        return None
+
+
+def cache_key(job, digest=None):
+    """任务的缓存键：输入内容 + 转换类型 + 影响输出的参数 + 依赖库版本（+ 中文字体）；
+    digest 为已算出的输入文件 SHA-256"""
+    options = {k: v for k, v in job.options.items() if k not in IGNORED_OPTIONS}
+    data = {"version": CACHE_VERSION, "type": job.conversion_type,
+            "input": digest or file_digest(job.input_file), "options": options,
+            "libraries": library_versions(job.conversion_type)}
+    if job.conversion_type in FONT_DEPENDENT_TYPES:
+        data["font"] = font_identity(job.options.get("font_path"))
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def atomic_copy(src, dst):
+    """复制到 dst 所在目录的临时文件后原子替换，并发读取方不会看到写了一半的文件"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dst), suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp_path)
+        os.chmod(tmp_path, 0o644)  # mkstemp 默认仅自己可读，共享目录需要其他用户可读
+        os.replace(tmp_path, dst)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_json(data, dst):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dst), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class ResultCache:
+    """容量有上限的转换结果缓存（LRU 淘汰）"""
+    RESCAN_EVERY = 200
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_MB << 20, hardlink=False):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # 硬链接更快；转换器输出先写临时文件再替换（见 engine.convert），不会改写链接着的缓存条目，
+        # 但用户用原地写入的工具修改输出文件仍会连带改坏缓存
+        self.hardlink = hardlink
+        self.estimated_bytes = None  # 上次扫描后的总大小 + 本进程之后写入的大小；未扫描过时为 None
+        self.added_since_scan = 0
+
+    def entry_paths(self, key, ext):
+        """(结果文件, 元数据文件) 路径"""
+        base = os.path.join(self.directory, key[:2], key)
+        return base + ext, base + ".json"
+
+    def fetch(self, key, output_file):
+        """命中时把结果放到 output_file 并返回页数，未命中返回 None"""
+        data_path, meta_path = self.entry_paths(key, os.path.splitext(output_file)[1])
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None  # 未缓存、刚被其他进程淘汰，或元数据损坏（重新转换后覆盖）
+        try:
+            self.deliver(data_path, output_file)
+        except FileNotFoundError:
+            if os.path.exists(data_path):
+                raise  # 输出目录不存在等，与转换时写出失败一样处理
+            return None
+        try:
+            os.utime(data_path)  # 记录最近使用时间，供 LRU 淘汰
+        except OSError:
+            pass
+        return meta.get("pages", 0)
+
+    def deliver(self, data_path, output_file):
+        """放到输出路径：替换而不是原地写入（输出文件可能是其他缓存条目的硬链接）"""
+        if self.hardlink:
+            tmp_path = output_file + ".cache-link"
+            try:
+                os.link(data_path, tmp_path)
+                os.replace(tmp_path, output_file)
+                return
+            except OSError:
+                if os.path.lexists(tmp_path):
+                    os.unlink(tmp_path)
+                if not os.path.exists(data_path):
+                    raise
+                # 跨文件系统等无法硬链接时改为复制
+        atomic_copy(data_path, output_file)
+
+    def store(self, key, output_file, pages):
+        """转换完成后存入结果并按需淘汰；失败只记录日志，不影响转换结果"""
+        data_path, meta_path = self.entry_paths(key, os.path.splitext(output_file)[1])
+        try:
+            os.makedirs(os.path.dirname(data_path), exist_ok=True)
+            # 先写结果文件再写元数据，读取方以元数据存在为准
+            atomic_copy(output_file, data_path)
+            size = os.path.getsize(data_path)
+            atomic_write_json({"pages": pages, "size": size}, meta_path)
+            self.added(size)
+        except OSError as e:
+            logger.warning("无法写入转换结果缓存 %s：%s", data_path, e)
+
+    def entries(self):
+        """遍历缓存条目：(修改时间, 大小, 结果文件路径)；顺带清理残留的临时文件"""
+        now = time.time()
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".json"):
+                    continue
+                try:
+                    st = entry.stat()
+                    if entry.name.endswith(".tmp"):
+                        if now - st.st_mtime > STALE_TMP_SECONDS:
+                            os.unlink(entry.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                yield st.st_mtime, st.st_size, entry.path
+
+    def added(self, size):
+        """记录本进程新写入的条目；估计总大小超出上限，或距上次扫描已写入 RESCAN_EVERY 个条目时才扫描淘汰"""
+        self.added_since_scan += 1
+        if self.estimated_bytes is not None:
+            self.estimated_bytes += size
+        if (self.estimated_bytes is None or self.estimated_bytes > self.max_bytes
+                or self.added_since_scan >= self.RESCAN_EVERY):
+            self.evict()
+
+    def evict(self):
+        """扫描缓存目录，总大小超出上限时删除最久未用的条目，直到不超过上限的 EVICT_TARGET"""
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        self.added_since_scan = 0
+        target = self.max_bytes * EVICT_TARGET if total > self.max_bytes else total
+        for _, size, data_path in entries:
+            if total <= target:
+                break
+            # 先删元数据，其他进程随即视为未命中
+            for path in (os.path.splitext(data_path)[0] + ".json", data_path):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
+        self.estimated_bytes = total
+
+
+_default_cache = None
+
+
+def default_cache():
+    """按环境变量配置的进程内共享缓存；关闭时返回 None"""
+    global _default_cache
+    if os.environ.get("PDFCONVERTER_RESULT_CACHE", "1") == "0":
+        return None
+    if _default_cache is None:
+        from .fonts import cache_dir
+
+        directory = os.environ.get("PDFCONVERTER_RESULT_CACHE_DIR") or os.path.join(cache_dir(), "results")
+        max_mb = int(os.environ.get("PDFCONVERTER_RESULT_CACHE_MB") or DEFAULT_MAX_MB)
+        hardlink = os.environ.get("PDFCONVERTER_RESULT_CACHE_LINK") == "1"
+        _default_cache = ResultCache(directory, max_mb << 20, hardlink)
+    return _default_cache
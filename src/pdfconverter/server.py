@@ -0,0 +1,392 @@
+"""本机 HTTP 转换服务：供其他系统以编程方式调用（标准库实现，默认只监听 127.0.0.1）
+
+    python -m pdfconverter serve [--port 8765] [--jobs 8]
+
+接口（均返回 JSON，下载结果除外）：
+  POST   /jobs?type=pdf2word&filename=a.pdf[&KEY=VALUE...]  请求体为文件内容，返回 202 与任务信息
+  GET    /jobs                     全部任务
+  GET    /jobs/<id>                任务状态、进度与各阶段耗时
+  GET    /jobs/<id>/result         下载转换结果（任务完成后）
+  DELETE /jobs/<id>                删除已结束的任务及其文件
+  GET    /status                   队列深度、运行中任务数、工作进程数等
+
+转换参数只接受各转换类型白名单中的参数（ALLOWED_OPTIONS），取值超出范围或未知参数返回 400。
+
+每个连接由单独的线程处理，上传内容分块写入磁盘，大文件上传不会阻塞其他请求。
+转换在启动时即全部就绪、预加载了转换库和字体的工作进程池中执行（BatchRunner），任务表只保存在内存中，
+已结束的任务超过保留时间后连同文件一起删除。
+"""
+import os
+import json
+import time
+import shutil
+import logging
+import tempfile
+import threading
+from dataclasses import dataclass
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urlsplit, parse_qsl, quote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from .batch import BatchRunner
+from .engine import INPUT_EXTENSIONS, OUTPUT_EXTENSIONS, ConversionJob, parse_option_value
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+DEFAULT_MAX_UPLOAD_MB = 1024
+RETENTION_SECONDS = 3600  # 已结束任务的保留时间
+POLL_SECONDS = 0.05  # 收取进度和结果的间隔
+UPLOAD_BLOCK_SIZE = 1 << 20
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+# 查询参数中不作为转换参数的项
+RESERVED_PARAMS = ("type", "filename")
+
+
+class RequestError(Exception):
+    """请求错误，转为对应的 HTTP 状态码返回"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# 单个任务的页级并发上限（每个任务会另起进程池）
+MAX_PAGE_WORKERS = os.cpu_count() or 1
+
+
+def integer(low, high):
+    """校验函数：low 到 high 之间的整数；不通过时返回错误说明，通过时返回 None"""
+    def check(value):
+        if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+            return f"应为 {low} 到 {high} 之间的整数"
+    return check
+
+
+def choice(*values):
+    """校验函数：取值为 values 之一"""
+    def check(value):
+        if value not in values:
+            return f"应为 {'、'.join(map(str, values))} 之一"
+    return check
+
+
+def boolean(value):
+    """校验函数：布尔值"""
+    if not isinstance(value, bool):
+        return "应为 true 或 false"
+
+
+# 各转换类型可通过 HTTP 指定的转换参数及其校验函数；不在其中的参数（如 font_path 可指向任意文件、
+# pdf2docx 的 debug、cpu_count 等）一律拒绝
+COMMON_OPTIONS = {"cache": boolean}
+ALLOWED_OPTIONS = {
+    "word2pdf": {"page_workers": integer(1, MAX_PAGE_WORKERS), "chunks": integer(1, 1024)},
+    "excel2pdf": {},
+    "pdf2excel": {"mode": choice("text", "tables"), "backend": choice("pdfplumber", "fitz"),
+                  "page_workers": integer(1, MAX_PAGE_WORKERS), "chunk_pages": integer(1, 10000),
+                  "rows_per_sheet": integer(1, 1048576), "pages_per_sheet": integer(1, 100000)},
+    "pdf2word": {"page_workers": integer(1, MAX_PAGE_WORKERS), "chunk_pages": integer(1, 10000),
+                 "start": integer(0, 1000000), "end": integer(1, 1000000),
+                 "ignore_page_error": boolean, "parse_lattice_table": boolean, "parse_stream_table": boolean,
+                 "extract_stream_table": boolean, "delete_end_line_hyphen": boolean, "list_not_table": boolean},
+}
+
+
+def validate_options(conversion_type, options):
+    """校验请求中的转换参数：只允许该转换类型的白名单参数且取值在范围内，否则抛出 RequestError(400)"""
+    allowed = dict(COMMON_OPTIONS, **ALLOWED_OPTIONS[conversion_type])
+    for key, value in options.items():
+        if key not in allowed:
+            raise RequestError(400, f"{conversion_type} 不支持参数 {key}，可用参数：{'、'.join(sorted(allowed))}")
+        error = allowed[key](value)
+        if error:
+            raise RequestError(400, f"参数 {key} {error}")
+    if "end" in options and options["end"] <= options.get("start", 0):
+        raise RequestError(400, "参数 end 应大于 start")
+
+
+@dataclass
+class ServerJob:
+    """任务表中的一项：转换任务及其状态，时间均为 time.monotonic()"""
+    job: ConversionJob
+    filename: str  # 上传时的文件名，用于下载时的文件名
+    created: float
+    uploaded: float
+    status: str = "queued"  # queued / running / done / failed
+    progress: int = 0
+    started: float = None
+    finished: float = None
+    result: object = None  # ConversionResult
+
+    @property
+    def directory(self):
+        return os.path.dirname(self.job.input_file)
+
+    @property
+    def download_name(self):
+        return os.path.splitext(self.filename)[0] + OUTPUT_EXTENSIONS[self.job.conversion_type]
+
+    def to_dict(self):
+        end = self.finished or time.monotonic()
+        timings = {
+            "upload": self.uploaded - self.created,
+            "queued": (self.started or end) - self.uploaded,
+            "convert": end - self.started if self.started is not None else None,
+            "total": end - self.created,
+        }
+        data = {
+            "id": self.job.job_id,
+            "type": self.job.conversion_type,
+            "filename": self.filename,
+            "options": self.job.options,
+            "status": self.status,
+            "progress": self.progress,
+            "timings": {k: round(v, 3) if v is not None else None for k, v in timings.items()},
+        }
+        if self.result is not None:
+            data.update(message=self.result.message, pages=self.result.pages, cached=self.result.cached)
+        return data
+
+
+class JobTable:
+    """内存中的任务表：提交任务到工作进程池，后台线程收取进度和结果、清理过期任务"""
+
+    def __init__(self, work_dir, max_workers=None, retention=RETENTION_SECONDS,
+                 log_level=logging.WARNING):
+        self.work_dir = work_dir
+        self.retention = retention
+        self.lock = threading.Lock()
+        self.jobs = {}  # job_id -> ServerJob
+        self.runner = BatchRunner(max_workers, log_level)
+        self.runner.start_workers()
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self.poll_loop, name="job-poller", daemon=True)
+        self.thread.start()
+
+    def create(self, conversion_type, filename, options, stream, length):
+        """把上传内容写入任务目录并提交转换，返回 ServerJob"""
+        created = time.monotonic()
+        ext = os.path.splitext(filename)[1].lower()
+        if ext not in INPUT_EXTENSIONS[conversion_type]:
+            raise RequestError(400, f"{conversion_type} 不支持 {ext or '无扩展名'} 文件，"
+                                    f"支持：{' '.join(INPUT_EXTENSIONS[conversion_type])}")
+        directory = tempfile.mkdtemp(dir=self.work_dir)
+        # 不使用上传的文件名作为路径，避免路径穿越
+        job = ConversionJob(conversion_type, os.path.join(directory, "input" + ext), "", options)
+        try:
+            with open(job.input_file, "wb") as f:
+                remaining = length
+                while remaining:
+                    block = stream.read(min(remaining, UPLOAD_BLOCK_SIZE))
+                    if not block:
+                        raise RequestError(400, "上传内容不完整")
+                    f.write(block)
+                    remaining -= len(block)
+        except BaseException:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+        record = ServerJob(job, filename, created, time.monotonic())
+        with self.lock:
+            try:
+                self.runner.submit(job)  # 工作进程异常退出后 BatchRunner 会重建进程池
+            except (BrokenProcessPool, OSError) as e:
+                shutil.rmtree(directory, ignore_errors=True)
+                logger.error("无法提交转换任务：%s", e)
+                raise RequestError(503, "转换进程池不可用，请稍后重试")
+            self.jobs[job.job_id] = record
+        return record
+
+    def get(self, job_id):
+        with self.lock:
+            record = self.jobs.get(job_id)
+        if record is None:
+            raise RequestError(404, f"任务不存在：{job_id}")
+        return record
+
+    def remove(self, job_id):
+        with self.lock:
+            record = self.jobs.get(job_id)
+            if record is None:
+                raise RequestError(404, f"任务不存在：{job_id}")
+            if record.finished is None:
+                raise RequestError(409, "任务尚未结束，不能删除")
+            del self.jobs[job_id]
+        shutil.rmtree(record.directory, ignore_errors=True)
+
+    def snapshot(self):
+        with self.lock:
+            return [record.to_dict() for record in self.jobs.values()]
+
+    def stats(self):
+        with self.lock:
+            counts = {status: 0 for status in ("queued", "running", "done", "failed")}
+            for record in self.jobs.values():
+                counts[record.status] += 1
+        return {"workers": self.runner.max_workers, "queue_depth": counts["queued"],
+                "running": counts["running"], "jobs": counts}
+
+    def poll_loop(self):
+        last_cleanup = time.monotonic()
+        while not self.stopping.wait(POLL_SECONDS):
+            with self.lock:
+                progress, results = self.runner.poll()
+                now = time.monotonic()
+                for job_id, value in progress:
+                    record = self.jobs.get(job_id)
+                    if record is None or record.finished is not None:
+                        continue
+                    if record.started is None:
+                        record.started = now
+                        record.status = "running"
+                    record.progress = value
+                for result in results:
+                    record = self.jobs.get(result.job.job_id)
+                    if record is None:
+                        continue
+                    record.finished = now
+                    if record.started is None:  # 开始事件尚未送达
+                        record.started = max(record.uploaded, now - result.elapsed)
+                    record.result = result
+                    record.status = "done" if result.success else "failed"
+                    record.progress = 100 if result.success else record.progress
+            if now - last_cleanup >= 10:
+                self.cleanup(now)
+                last_cleanup = now
+
+    def cleanup(self, now):
+        """删除结束超过保留时间的任务"""
+        with self.lock:
+            expired = [job_id for job_id, record in self.jobs.items()
+                       if record.finished is not None and now - record.finished > self.retention]
+            records = [self.jobs.pop(job_id) for job_id in expired]
+        for record in records:
+            shutil.rmtree(record.directory, ignore_errors=True)
+
+    def close(self):
+        self.stopping.set()
+        self.thread.join()
+        self.runner.shutdown(wait=True)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """HTTP 请求处理（每个连接一个线程）；self.server.jobs 为 JobTable"""
+    server_version = "PDFConverter"
+
+    def log_message(self, format, *args):
+        logger.info("%s %s", self.address_string(), format % args)
+
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self, method):
+        try:
+            url = urlsplit(self.path)
+            parts = [part for part in url.path.split("/") if part]
+            params = dict(parse_qsl(url.query))
+            # /jobs -> get_jobs，/jobs/<id>[/result] -> get_jobs_item
+            name = f"{method}_{parts[0]}{'_item' if len(parts) > 1 else ''}" if parts else ""
+            handler = getattr(self, name, None)
+            if handler is None:
+                raise RequestError(404, f"未知的接口：{method.upper()} {url.path}")
+            handler(parts, params)
+        except RequestError as e:
+            self.close_connection = True  # 请求体可能未读完
+            self.send_json(e.status, {"error": str(e)})
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 客户端已断开
+        except Exception as e:
+            logger.exception("处理请求失败：%s", self.path)
+            self.send_json(500, {"error": str(e)})
+
+    def do_GET(self):
+        self.handle_request("get")
+
+    def do_POST(self):
+        self.handle_request("post")
+
+    def do_DELETE(self):
+        self.handle_request("delete")
+
+    def get_status(self, parts, params):
+        self.send_json(200, self.server.jobs.stats())
+
+    def get_jobs(self, parts, params):
+        self.send_json(200, {"jobs": self.server.jobs.snapshot()})
+
+    def post_jobs(self, parts, params):
+        conversion_type = params.get("type")
+        if conversion_type not in OUTPUT_EXTENSIONS:
+            raise RequestError(400, f"type 应为 {'、'.join(sorted(OUTPUT_EXTENSIONS))} 之一")
+        filename = os.path.basename(params.get("filename") or self.headers.get("X-Filename", ""))
+        if not filename:
+            raise RequestError(400, "缺少文件名（filename 参数）")
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            raise RequestError(411, "缺少 Content-Length")
+        length = int(length)
+        if length > self.server.max_upload:
+            raise RequestError(413, f"文件超过上限 {self.server.max_upload >> 20} MB")
+        options = {k: parse_option_value(v) for k, v in params.items() if k not in RESERVED_PARAMS}
+        validate_options(conversion_type, options)
+        record = self.server.jobs.create(conversion_type, filename, options, self.rfile, length)
+        self.send_json(202, record.to_dict())
+
+    def get_jobs_item(self, parts, params):
+        record = self.server.jobs.get(parts[1])
+        if len(parts) == 2:
+            self.send_json(200, record.to_dict())
+            return
+        if parts[2:] != ["result"]:
+            raise RequestError(404, f"未知的接口：GET {self.path}")
+        if record.status != "done":
+            raise RequestError(409, f"任务{'转换失败' if record.status == 'failed' else '尚未完成'}，没有可下载的结果")
+        path = record.job.output_file
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPES.get(os.path.splitext(path)[1], "application/octet-stream"))
+        self.send_header("Content-Length", str(os.path.getsize(path)))
+        self.send_header("Content-Disposition", f"attachment; filename*=UTF-8''{quote(record.download_name)}")
+        self.end_headers()
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, self.wfile, UPLOAD_BLOCK_SIZE)
+
+    def delete_jobs_item(self, parts, params):
+        if len(parts) != 2:
+            raise RequestError(404, f"未知的接口：DELETE {self.path}")
+        self.server.jobs.remove(parts[1])
+        self.send_json(200, {"deleted": parts[1]})
+
+
+class ConversionServer(ThreadingHTTPServer):
+    """HTTP 服务：启动时即启动全部工作进程（预加载转换库和字体）"""
+    daemon_threads = True
+    request_queue_size = 128  # 大量客户端同时连接时的 listen 队列长度
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, max_workers=None, work_dir=None,
+                 max_upload=DEFAULT_MAX_UPLOAD_MB << 20, retention=RETENTION_SECONDS,
+                 log_level=logging.WARNING):
+        self.own_work_dir = work_dir is None
+        self.work_dir = work_dir or tempfile.mkdtemp(prefix="pdfconverter-server-")
+        os.makedirs(self.work_dir, exist_ok=True)
+        self.max_upload = max_upload
+        self.jobs = JobTable(self.work_dir, max_workers, retention, log_level)
+        try:
+            super().__init__((host, port), RequestHandler)
+        except BaseException:
+            self.jobs.close()
+            raise
+
+    def server_close(self):
+        super().server_close()
+        self.jobs.close()
+        if self.own_work_dir:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
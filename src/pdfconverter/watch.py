@@ -0,0 +1,467 @@
+"""监视文件夹：无界面持续转换放入输入目录的文件
+
+    python -m pdfconverter watch -o 输出目录 输入目录 [输入目录 ...]
+
+- 发现文件：Linux 上用 inotify 递归监视输入目录，其他平台或 inotify 不可用（如监视数超限）时
+  定时扫描目录树；启动时和 inotify 事件队列溢出时全量扫描一次。
+- 去抖动：文件大小和修改时间连续 settle 秒不变才提交转换，避免转换写了一半的文件；
+  隐藏文件和 Office 锁文件（~$ 开头）忽略。
+- 路由：按扩展名选择转换类型（默认 .pdf 转 Word，可用 routes 指定，如 .pdf 转 Excel）。
+- 输出：按相对输入目录的路径镜像到输出目录（多个输入目录时以输入目录名为第一级子目录，
+  目录名相同的输入目录再加上路径哈希区分），
+  先写同目录下的临时文件，成功后原子替换为正式输出。
+- 并发：进程池执行，在途任务最多为进程数的 2 倍，其余文件留在待处理表中，内存占用不随处理量增长。
+  工作进程异常退出（内存不足、转换库崩溃）会使进程池损坏：重建进程池，当时在途的文件逐个单独重新转换，
+  单独转换仍使工作进程崩溃的文件判定为失败。
+- 重启：转换完成的文件记入批次日志（输入文件的大小、修改时间和 SHA-256），输出文件存在且输入文件未变
+  即视为已完成，重启后不会重复转换；转换失败的文件在内容变化（或重启）后重试，
+  使工作进程崩溃的文件也记入批次日志，重启后内容变化前不再重试。
+  无法打开批次日志时退回比较修改时间：输出文件比输入文件新即视为已完成。
+"""
+import os
+import time
+import errno
+import select
+import signal
+import struct
+import ctypes
+import ctypes.util
+import logging
+import uuid
+import sqlite3
+import hashlib
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .batch import WORKER_DIED, default_workers, init_worker, run_job, worker_context
+from .engine import INPUT_EXTENSIONS, OUTPUT_EXTENSIONS, ConversionJob, ConversionResult
+from .journal import BatchJournal
+
+logger = logging.getLogger(__name__)
+
+SETTLE_SECONDS = 2.0  # 文件多久不再变化视为写入完成
+POLL_INTERVAL = 5.0  # 轮询模式的扫描间隔
+TICK_SECONDS = 0.5  # 检查待处理文件、收取结果的间隔
+PART_SUFFIX = ".part"  # 临时输出文件名：.{文件名}.{随机串}.part{扩展名}
+
+# inotify 常量（linux/inotify.h）
+IN_MODIFY = 0x2
+IN_ATTRIB = 0x4
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def default_routes():
+    """扩展名 -> 转换类型；同一扩展名对应多种转换时取第一种（.pdf 转 Word）"""
+    routes = {}
+    for conversion_type, exts in INPUT_EXTENSIONS.items():
+        for ext in exts:
+            routes.setdefault(ext, conversion_type)
+    return routes
+
+
+def file_signature(path):
+    """(大小, 修改时间)；文件不存在或无法访问（如上级路径不是目录）时返回 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def remove_file(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass  # 转换失败时可能未生成
+
+
+def is_ignored(name):
+    """隐藏文件、Office 锁文件"""
+    return name.startswith((".", "~$"))
+
+
+class Inotify:
+    """Linux inotify 的最小封装：按目录添加监视，读取有变化的文件"""
+
+    def __init__(self):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)  # 非 Linux 平台没有该函数
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.dirs = {}  # wd -> (输入目录, 被监视的目录)
+
+    def add_dir(self, root, path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return  # 目录已被删除
+            raise OSError(err, os.strerror(err), path)  # ENOSPC：超出 max_user_watches
+        self.dirs[wd] = (root, path)
+
+    def read(self, timeout):
+        """等待最多 timeout 秒，返回 (变化的文件 [(输入目录, 路径)], 新目录 [(输入目录, 路径)], 是否溢出)"""
+        files, dirs, overflow = [], [], False
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return files, dirs, overflow
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return files, dirs, overflow
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+            elif mask & IN_IGNORED:
+                self.dirs.pop(wd, None)  # 目录被删除或移走
+            elif wd in self.dirs and name and not is_ignored(name):
+                root, path = self.dirs[wd]
+                (dirs if mask & IN_ISDIR else files).append((root, os.path.join(path, name)))
+        return files, dirs, overflow
+
+    def close(self):
+        os.close(self.fd)
+
+
+def root_prefixes(roots):
+    """多个输入目录时各自在输出目录中的第一级子目录：输入目录名；重名（或为根目录）时加上完整路径的哈希"""
+    names = [os.path.basename(root) or "root" for root in roots]
+    return {root: name if names.count(name) == 1 else
+            f"{name}-{hashlib.sha1(root.encode('utf-8')).hexdigest()[:8]}"
+            for root, name in zip(roots, names)}
+
+
+def init_watch_worker(log_level, preload=()):
+    """工作进程忽略 Ctrl+C，由主进程等待在途任务完成后统一退出"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    init_worker(log_level, preload=preload)
+
+
+@dataclass
+class RunningTask:
+    """在途任务"""
+    path: str
+    root: str  # 所属输入目录
+    signature: tuple
+    part: str  # 临时输出
+    output: str  # 正式输出
+    generation: int  # 提交时的进程池代数
+    isolated: bool = False  # 进程池损坏后单独重新转换的文件
+
+
+class FolderWatcher:
+    """监视输入目录并持续转换；run() 阻塞运行，stop() 后等待在途任务完成再返回
+
+    on_result(result) 在每个文件转换完成后调用，result.job.output_file 为正式输出路径。
+    journal 为 BatchJournal，记录已完成和使工作进程崩溃的文件；为 None 时按修改时间判断是否已完成。
+    """
+
+    def __init__(self, inputs, output_dir, routes=None, max_workers=None, options=None,
+                 settle=SETTLE_SECONDS, poll_interval=POLL_INTERVAL, polling=False,
+                 on_result=None, log_level=logging.WARNING, journal=None):
+        self.roots = [os.path.abspath(path) for path in inputs]
+        self.prefixes = root_prefixes(self.roots)
+        self.output_dir = os.path.abspath(output_dir)
+        self.routes = routes or default_routes()
+        self.max_workers = max_workers or default_workers()
+        self.options = options or {}
+        self.settle = settle
+        self.poll_interval = poll_interval
+        self.polling = polling
+        self.on_result = on_result
+        self.log_level = log_level
+        self.journal = journal
+        self.pending = {}  # 路径 -> (输入目录, 签名, 签名最近变化的时间)
+        self.running = {}  # future -> RunningTask
+        self.suspects = {}  # 进程池损坏时在途的文件：路径 -> (输入目录, 签名)，逐个单独重新转换
+        self.failed = {}  # 路径 -> 转换失败时的签名，文件变化后才重试
+        self.executor = None
+        self.generation = 0  # 进程池重建次数
+        self.seen = {}  # 轮询模式：路径 -> 上次扫描时的签名
+        self.inotify = None
+        self.stopping = False
+
+    def stop(self):
+        self.stopping = True
+
+    def route(self, path):
+        return self.routes.get(os.path.splitext(path)[1].lower())
+
+    def output_path(self, root, path):
+        """镜像到输出目录的正式输出路径"""
+        relative = os.path.relpath(path, root)
+        if len(self.roots) > 1:
+            relative = os.path.join(self.prefixes[root], relative)
+        return os.path.join(self.output_dir, os.path.splitext(relative)[0]
+                            + OUTPUT_EXTENSIONS[self.route(path)])
+
+    def is_done(self, root, path, signature):
+        """批次日志中有完成记录、输出文件存在且输入文件未变即已完成；转换失败或使工作进程崩溃且内容未变的文件不再重试"""
+        if self.failed.get(path) == signature:
+            return True
+        output = self.output_path(root, path)
+        if self.journal is None:
+            output = file_signature(output)
+            return output is not None and output[1] >= signature[1]
+        row = self.journal.watched(path, output)
+        if row is None:
+            return False
+        state, size, mtime, digest = row
+        if state == "crashed":
+            return (size, mtime) == signature
+        return BatchJournal.is_current(path, output, size, mtime, digest)
+
+    def mark(self, root, path):
+        """文件有变化：需要转换时加入待处理表，去抖动后提交"""
+        if path in self.pending:
+            return  # 签名在 submit_ready() 中更新
+        signature = file_signature(path)
+        if signature is None or self.is_done(root, path, signature):
+            return
+        if path in self.suspects or any(task.path == path for task in self.running.values()):
+            return  # 转换完成时会检查文件是否又被修改
+        self.pending[path] = (root, signature, time.monotonic())
+
+    def scan(self, root, top=None, previous=None):
+        """扫描目录树：标记需要转换的文件；inotify 模式下同时为各子目录添加监视
+
+        轮询模式下 previous 为上次扫描记录的签名，签名未变的文件跳过，不必每次都查看输出文件。
+        """
+        for dirpath, dirnames, names in os.walk(top or root):
+            dirnames[:] = [d for d in dirnames
+                           if not is_ignored(d) and os.path.join(dirpath, d) != self.output_dir]
+            if self.inotify is not None:
+                self.inotify.add_dir(root, dirpath)
+            for name in names:
+                path = os.path.join(dirpath, name)
+                if is_ignored(name) or not self.route(path):
+                    continue
+                if self.inotify is None:
+                    signature = self.seen[path] = file_signature(path)
+                    if previous is not None and previous.get(path) == signature:
+                        continue
+                self.mark(root, path)
+
+    def scan_all(self):
+        previous, self.seen = self.seen, {}  # 每次重建，已删除的文件随之移除
+        for root in self.roots:
+            self.scan(root, previous=previous)
+
+    def start_watching(self):
+        """优先使用 inotify，不可用时退回轮询"""
+        if not self.polling:
+            try:
+                self.inotify = Inotify()
+                self.scan_all()
+                return
+            except (OSError, AttributeError) as e:  # 非 Linux 平台、监视数超限等
+                self.use_polling(e)
+                return
+        self.scan_all()
+
+    def use_polling(self, error):
+        logger.warning("无法使用 inotify（%s），改为每 %.0f 秒扫描一次", error, self.poll_interval)
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+        self.scan_all()
+
+    def wait_events(self, timeout):
+        """等待文件变化（inotify）或定时重新扫描（轮询）"""
+        if self.inotify is None:
+            time.sleep(timeout)
+            if time.monotonic() - self.last_scan >= self.poll_interval:
+                self.scan_all()
+                self.last_scan = time.monotonic()
+            return
+        files, dirs, overflow = self.inotify.read(timeout)
+        if overflow:
+            logger.warning("inotify 事件队列溢出，重新扫描输入目录")
+            self.scan_all()
+            return
+        for root, path in dirs:
+            if path == self.output_dir:
+                continue
+            try:
+                self.scan(root, path)  # 新目录：添加监视并处理其中已有的文件
+            except OSError as e:
+                self.use_polling(e)
+                return
+        for root, path in files:
+            if self.route(path):
+                self.mark(root, path)
+
+    def clean_partial_outputs(self):
+        """删除上次异常退出时残留的临时输出文件"""
+        for dirpath, _, names in os.walk(self.output_dir):
+            for name in names:
+                if name.startswith(".") and PART_SUFFIX + "." in name:
+                    try:
+                        os.unlink(os.path.join(dirpath, name))
+                    except OSError:
+                        pass
+
+    def start_pool(self):
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.context,
+                                            initializer=init_watch_worker, initargs=(self.log_level, self.preload))
+
+    def restart_pool(self):
+        """工作进程异常退出后重建进程池"""
+        logger.warning("工作进程异常退出，重建进程池")
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.generation += 1
+        self.start_pool()
+
+    def submit_ready(self):
+        """提交签名已稳定 settle 秒的文件，在途任务数不超过进程数的 2 倍
+
+        有待单独重新转换的文件时，等在途任务全部完成后逐个提交，期间不提交其他文件，
+        以便找出使工作进程崩溃的文件。
+        """
+        if self.suspects:
+            if not self.running:
+                path = next(iter(self.suspects))
+                root, signature = self.suspects.pop(path)
+                current = file_signature(path)
+                if current == signature:
+                    self.submit(root, path, signature, isolated=True)
+                elif current is not None:
+                    self.pending[path] = (root, current, time.monotonic())
+            return
+        now = time.monotonic()
+        for path, (root, signature, since) in list(self.pending.items()):
+            if len(self.running) >= self.max_workers * 2:
+                break
+            current = file_signature(path)
+            if current is None:
+                del self.pending[path]
+            elif current != signature:
+                self.pending[path] = (root, current, now)
+            elif now - since >= self.settle:
+                del self.pending[path]
+                self.submit(root, path, signature)
+
+    def submit(self, root, path, signature, isolated=False):
+        output = self.output_path(root, path)
+        directory, name = os.path.split(output)
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            self.fail(path, signature, output, f"无法创建输出目录 {directory}：{e}")
+            return
+        stem, ext = os.path.splitext(name)
+        # 不用 mkstemp：它创建的文件仅自己可读，转换后原样成为输出文件
+        part = os.path.join(directory, f".{stem}.{uuid.uuid4().hex[:8]}{PART_SUFFIX}{ext}")
+        job = ConversionJob(self.route(path), path, part, dict(self.options))
+        try:
+            future = self.executor.submit(run_job, job)
+        except BrokenProcessPool:
+            self.restart_pool()
+            future = self.executor.submit(run_job, job)
+        self.running[future] = RunningTask(path, root, signature, part, output, self.generation, isolated)
+
+    def collect(self, wait=False):
+        """处理已完成的任务：成功且输入未再变化时替换为正式输出"""
+        for future in list(self.running):
+            if not (wait or future.done()):
+                continue
+            task = self.running.pop(future)
+            path, root, signature, part, output = task.path, task.root, task.signature, task.part, task.output
+            crashed = False
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                if task.generation == self.generation and not self.stopping:
+                    self.restart_pool()
+                if not task.isolated:
+                    # 不知道是哪个文件使工作进程崩溃：在途的文件都逐个单独重新转换
+                    remove_file(part)
+                    self.suspects[path] = (root, signature)
+                    continue
+                crashed = True
+                result = ConversionResult(ConversionJob(self.route(path), path, part), False, WORKER_DIED)
+            except Exception as e:
+                result = ConversionResult(ConversionJob(self.route(path), path, part),
+                                          False, f"转换失败：\n{str(e)}")
+            changed = file_signature(path) != signature
+            if result.success and not changed:
+                try:
+                    os.replace(part, output)
+                    self.failed.pop(path, None)
+                    self.record(path, output, "done", signature, result.input_hash)
+                except OSError as e:
+                    logger.error("无法写入输出文件 %s：%s", output, e)
+                    result = ConversionResult(result.job, False, f"转换失败：\n无法写入输出文件：{e}",
+                                              elapsed=result.elapsed)
+            if not result.success or changed:
+                remove_file(part)
+                if not result.success:
+                    self.failed[path] = signature
+                if crashed and not changed:
+                    self.record(path, output, "crashed", signature, message=result.message)
+            if changed:
+                self.mark(root, path)  # 转换期间文件被修改，按新内容重新转换
+                continue
+            result.job.output_file = output
+            if self.on_result:
+                self.on_result(result)
+
+    def record(self, path, output, state, signature, digest=None, message=None):
+        """写入批次日志；写入失败只记录警告（重启后该文件重新转换）"""
+        if self.journal is None:
+            return
+        try:
+            self.journal.record_watched(path, output, state, signature, digest or None, message)
+        except sqlite3.Error as e:
+            logger.warning("无法写入批次日志：%s", e)
+
+    def fail(self, path, signature, output, message):
+        """未能提交或完成的任务：记录错误并按转换失败处理（文件内容变化后重试）"""
+        logger.error("%s：%s", path, message)
+        self.failed[path] = signature
+        if self.on_result:
+            job = ConversionJob(self.route(path), path, output, dict(self.options))
+            self.on_result(ConversionResult(job, False, f"转换失败：\n{message}"))
+
+    def run(self, once=False):
+        """持续运行直到 stop() 后返回 True；once=True 时处理完现有文件即返回；无法创建输出目录时记录错误并返回 False"""
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+        except OSError as e:
+            logger.error("无法创建输出目录 %s：%s", self.output_dir, e)
+            return False
+        self.clean_partial_outputs()
+        self.start_watching()
+        self.last_scan = time.monotonic()
+        try:
+            self.context, self.preload = worker_context(set(self.routes.values()))
+            self.start_pool()
+            try:
+                while not self.stopping:
+                    self.submit_ready()
+                    self.collect()
+                    if once and not self.pending and not self.running and not self.suspects:
+                        break
+                    self.wait_events(TICK_SECONDS)
+                self.collect(wait=True)
+            finally:
+                self.executor.shutdown()
+        finally:
+            if self.inotify is not None:
+                self.inotify.close()
+        return True
@@ -0,0 +1,121 @@
+"""Word转PDF"""
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+
+from .batch import ordered_map
+from .docxreader import DocxReader, Paragraph
+from .engine import register_converter
+from .layout import glyph_widths, write_paragraph
+from .pdfdoc import PDF
+
+LINE_HEIGHT = 10  # 行高（毫米）
+LINE_SPACING = 5  # 段落间距（毫米）
+FONT_SIZE = 12
+CHUNKS_PER_WORKER = 2  # 多进程模式下每个进程平均分到的分片数（分片略多于进程数以均衡负载）
+
+
+def new_document(options):
+    """创建纵向 A4、已设置中文字体的PDF"""
+    pdf = PDF('P', 'mm', 'A4')  # 纵向、毫米、A4纸张
+    pdf.add_page()
+    pdf.use_cjk_font(options.get("font_path"), size=FONT_SIZE)
+    return pdf
+
+
+def render_paragraph(pdf, paragraph):
+    """写入一个段落；分页符、分节符处换页"""
+    if paragraph.page_break_before and pdf.get_y() > pdf.t_margin:
+        pdf.add_page()
+    text = paragraph.text
+    if text.strip():
+        # 按中文禁则断行写入文本
+        write_paragraph(pdf, text, LINE_HEIGHT)
+    pdf.ln(LINE_SPACING)  # 段落间距（空段落即空行）
+
+
+def render_chunk(paragraphs, output_file, options):
+    """工作进程：把一组连续段落渲染为单独的PDF，返回页数"""
+    pdf = new_document(options)
+    for paragraph in paragraphs:
+        render_paragraph(pdf, paragraph)
+    pdf.output(output_file)
+    return pdf.page_no()
+
+
+def iter_chunks(reader, chunks):
+    """按分页符、分节符把段落分组：每读完约 1/chunks 的正文后，在下一个分页处切分
+
+    不含分页符、分节符的文档只有一组。
+    """
+    chunk, boundary = [], 1 / chunks
+    for block in reader:
+        if not isinstance(block, Paragraph):
+            continue  # 表格暂不输出
+        if block.page_break_before and chunk and reader.fraction >= boundary:
+            yield chunk
+            chunk = []
+            boundary = reader.fraction + 1 / chunks
+        chunk.append(block)
+    if chunk:
+        yield chunk
+
+
+def merge_pdfs(part_files, output_file):
+    """用 PyMuPDF 按顺序合并分片PDF，返回总页数"""
+    merged = fitz.open()
+    try:
+        for part_file in part_files:
+            with fitz.open(part_file) as part:
+                merged.insert_pdf(part)
+        merged.save(output_file, garbage=1, deflate=True)  # garbage=3 去重可再小约 15%，但合并耗时约 3 倍
+        return merged.page_count
+    finally:
+        merged.close()
+
+
+def word_to_pdf_parallel(job, workers, progress):
+    """按分页符、分节符把文档切分为若干分片，多进程分别渲染后按顺序合并"""
+    chunks = job.options.get("chunks") or workers * CHUNKS_PER_WORKER
+    # 先在主进程加载字体（含字宽表），fork 出的工作进程直接继承，不必各自解析
+    glyph_widths(new_document(job.options).current_font)
+    with tempfile.TemporaryDirectory() as tmp, DocxReader(job.input_file) as reader:
+        part_files = []
+
+        def chunk_args():
+            for i, paragraphs in enumerate(iter_chunks(reader, chunks)):
+                part_files.append(os.path.join(tmp, f"part{i:05d}.pdf"))
+                yield paragraphs, part_files[-1], job.options
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # 渲染占 90% 进度（按已读取的正文比例估算），合并占剩余部分
+            for _ in ordered_map(executor, render_chunk, chunk_args(), workers * 2):
+                progress(min(90, int(reader.fraction * 90)))
+        return merge_pdfs(part_files, job.output_file)
+
+
+@register_converter("word2pdf")
+def word_to_pdf(job, progress):
+    """Word转PDF：流式读取正文逐段写入；page_workers > 1 时按分页符、分节符分片多进程渲染"""
+    workers = job.options.get("page_workers", 1)
+    if workers > 1:
+        pages = word_to_pdf_parallel(job, workers, progress)
+        progress(100)
+        return pages
+
+    pdf = new_document(job.options)
+    # 流式读取Word正文，逐段写入PDF（表格暂不输出）
+    with DocxReader(job.input_file) as reader:
+        for block in reader:
+            if not isinstance(block, Paragraph):
+                continue
+            render_paragraph(pdf, block)
+            # 按已读取的正文比例更新进度
+            progress(min(99, int(reader.fraction * 100)))
+
+    # 保存PDF文件
+    pdf.output(job.output_file)
+    progress(100)
+    return pdf.page_no()
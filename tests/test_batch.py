@@ -0,0 +1,86 @@
+"""工作进程异常退出：BatchRunner 重建进程池后照常转换，run_batch 只把导致崩溃的任务报告为失败"""
+import os
+import sys
+import time
+import signal
+import multiprocessing
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from pdfconverter import batch
+from pdfconverter.batch import WORKER_DIED, BatchRunner, run_batch
+from pdfconverter.engine import ConversionJob
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("pdfplumber")
+pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "in.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 60), "Item 1 quarterly revenue")
+    doc.save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def runner():
+    runner = BatchRunner(1, conversion_types=["pdf2excel"])
+    yield runner
+    runner.shutdown()
+
+
+def job(pdf, name):
+    return ConversionJob("pdf2excel", pdf, os.path.join(os.path.dirname(pdf), name), {"cache": False})
+
+
+def wait_results(runner, count, timeout=120):
+    results = []
+    deadline = time.monotonic() + timeout
+    while len(results) < count and time.monotonic() < deadline:
+        results += runner.poll()[1]
+        time.sleep(0.05)
+    return results
+
+
+def test_submit_after_worker_killed(runner, pdf):
+    pid, = runner.start_workers()
+    os.kill(pid, signal.SIGKILL)
+    time.sleep(1)  # 等进程池发现工作进程退出
+    runner.submit(job(pdf, "a.xlsx"))
+    results = wait_results(runner, 1)
+    assert [r.success for r in results] == [True], results
+
+
+def test_job_in_flight_when_worker_killed_is_retried(runner, pdf):
+    pid, = runner.start_workers()
+    runner.submit(job(pdf, "b.xlsx"))
+    os.kill(pid, signal.SIGKILL)
+    results = wait_results(runner, 1)
+    assert [r.success for r in results] == [True], results
+    runner.submit(job(pdf, "c.xlsx"))
+    assert [r.success for r in wait_results(runner, 1)] == [True]
+
+
+batch_run_job = batch.run_job
+
+
+def crash_on_bad(job):
+    if os.path.basename(job.output_file).startswith("bad"):
+        os._exit(1)
+    return batch_run_job(job)
+
+
+def test_run_batch_reports_only_crashing_job(monkeypatch, pdf):
+    # fork 出的工作进程继承替换后的 run_job
+    monkeypatch.setattr(batch, "run_job", crash_on_bad)
+    monkeypatch.setattr(batch, "worker_context", lambda types: (multiprocessing.get_context("fork"), ()))
+    jobs = [job(pdf, name) for name in ("a.xlsx", "bad.xlsx", "b.xlsx", "c.xlsx")]
+    results = {os.path.basename(r.job.output_file): r for r in run_batch(jobs, max_workers=2)}
+    assert sorted(results) == ["a.xlsx", "b.xlsx", "bad.xlsx", "c.xlsx"]
+    assert results["bad.xlsx"].message == WORKER_DIED
+    assert all(r.success for name, r in results.items() if name != "bad.xlsx")
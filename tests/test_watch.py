@@ -0,0 +1,64 @@
+"""监视文件夹：工作进程崩溃后重建进程池，使其崩溃的文件记入批次日志，重启后不再重试"""
+import os
+import sys
+import multiprocessing
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from pdfconverter import watch
+from pdfconverter.batch import WORKER_DIED
+from pdfconverter.journal import BatchJournal
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("pdfplumber")
+pytest.importorskip("openpyxl")
+
+watch_run_job = watch.run_job
+
+
+def crash_on_bad(job):
+    if os.path.basename(job.input_file).startswith("bad"):
+        os._exit(1)
+    return watch_run_job(job)
+
+
+@pytest.fixture
+def inbox(tmp_path, monkeypatch):
+    # fork 出的工作进程继承替换后的 run_job
+    monkeypatch.setattr(watch, "run_job", crash_on_bad)
+    monkeypatch.setattr(watch, "worker_context", lambda types: (multiprocessing.get_context("fork"), ()))
+    directory = tmp_path / "in"
+    directory.mkdir()
+    for name in ("a.pdf", "bad.pdf", "b.pdf", "c.pdf"):
+        doc = fitz.open()
+        doc.new_page().insert_text((50, 60), f"{name} quarterly revenue")
+        doc.save(str(directory / name))
+    return directory
+
+
+def run_once(inbox, journal):
+    results = []
+    watcher = watch.FolderWatcher([str(inbox)], str(inbox.parent / "out"), {".pdf": "pdf2excel"}, 2,
+                                  {"cache": False}, settle=0, polling=True, on_result=results.append,
+                                  journal=journal)
+    assert watcher.run(once=True)
+    return {os.path.basename(r.job.input_file): r for r in results}
+
+
+def test_crashing_file_is_isolated_and_skipped_after_restart(inbox, tmp_path):
+    journal = BatchJournal(str(tmp_path / "journal.sqlite3"))
+    results = run_once(inbox, journal)
+    assert sorted(results) == ["a.pdf", "b.pdf", "bad.pdf", "c.pdf"]
+    assert results["bad.pdf"].message == WORKER_DIED
+    assert all(r.success for name, r in results.items() if name != "bad.pdf")
+    assert not (tmp_path / "out" / "bad.xlsx").exists()
+
+    # 输出文件的修改时间早于输入文件（如硬链接自缓存）也按批次日志判断为已完成
+    os.utime(tmp_path / "out" / "a.xlsx", ns=(0, 0))
+    assert run_once(inbox, journal) == {}
+
+    os.utime(inbox / "bad.pdf", ns=(1, 1))
+    assert list(run_once(inbox, journal)) == ["bad.pdf"]
+    journal.close()